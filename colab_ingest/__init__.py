@@ -9,8 +9,14 @@ Supports downloading from:
 And automatically extracts archives and uploads to Google Drive.
 """
 
-from colab_ingest.core.pipeline import Pipeline, PipelineConfig
-from colab_ingest.core.state import StateDB, Task, TaskStatus
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from colab_ingest.core.pipeline import Pipeline, PipelineConfig
+    from colab_ingest.core.state import StateDB, Task, TaskStatus
 
 __version__ = "0.1.0"
 __author__ = "Your Name"
@@ -26,3 +32,22 @@ __all__ = [
     "Task",
     "TaskStatus",
 ]
+
+# Public names resolved on first access, so that importing a submodule
+# (e.g. the CLI) does not pull in the whole pipeline import graph.
+_LAZY_EXPORTS = {
+    "Pipeline": "colab_ingest.core.pipeline",
+    "PipelineConfig": "colab_ingest.core.pipeline",
+    "StateDB": "colab_ingest.core.state",
+    "Task": "colab_ingest.core.state",
+    "TaskStatus": "colab_ingest.core.state",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -9,29 +9,83 @@ from __future__ import annotations
 
 import os
 import shutil
+import signal
+import stat
+import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib.metadata import PackageNotFoundError, distribution
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 import typer
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.table import Table
+from rich.console import Console, Group
+from rich.text import Text
 
-from .core.pipeline import Pipeline, PipelineConfig
-from .core.state import StateDB, Task, TaskStatus
-from .utils.logging import setup_logging
-
-# Load .env file if present
-load_dotenv()
+# Heavy modules (the pipeline graph, rich tables, dotenv) are imported inside
+# the commands that need them so that --help and light commands start fast.
+if TYPE_CHECKING:
+    from .core.pipeline import Pipeline, PipelineStats
+    from .core.state import Task, TaskStatus
 
 app = typer.Typer(
     name="colab-ingest",
     help="Download files from Pixeldrain, BuzzHeavier, Bunkr and upload to Google Drive.",
     add_completion=False,
+    # Skip Typer's own rich help/traceback rendering; commands use rich directly
+    pretty_exceptions_enable=False,
+    rich_markup_mode=None,
 )
 
-console = Console()
+# Automatic highlighting and emoji codes are off: output is explicit markup
+# only, which also keeps rendering cheap when output is captured
+console = Console(highlight=False, emoji=False)
+# Notes that must stay out of machine-readable stdout
+err_console = Console(stderr=True, highlight=False, emoji=False)
+
+# Google Drive mount point on Colab
+_DRIVE_ROOT = Path("/content/drive")
+
+# Directory holding the bundled third-party downloader modules
+_BUNDLED_DOWNLOADERS_DIR = Path(__file__).resolve().parent / "downloaders"
+
+# Cap on threads used for filesystem walks; higher counts thrash FUSE mounts
+_MAX_WALK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Display colors keyed by TaskStatus value (keyed by string so the state
+# module need not be imported at CLI startup)
+_STATUS_COLOR = {
+    "done": "green",
+    "failed": "red",
+    "pending": "white",
+    "downloading": "yellow",
+    "extracting": "yellow",
+    "uploading": "yellow",
+}
+
+# Pre-rendered markup for each status, so formatting a row is a dict lookup
+_STATUS_MARKUP = {
+    value: f"[{color}]{value}[/{color}]" for value, color in _STATUS_COLOR.items()
+}
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+_STATUS_OUTPUT_FORMATS = ("table", "json", "tsv")
+
+# Fields written per task by `status --output json`, in output order
+_JSON_TASK_COLUMNS = ("url", "host", "status", "retries", "updated_at", "error")
+
+
+def _print_lines(lines: list[str], target: Optional[Console] = None) -> None:
+    """Render several markup lines with a single console.print call.
+    
+    Args:
+        lines: Lines of rich markup; an empty string yields a blank line.
+        target: Console to print to (defaults to the stdout console).
+    """
+    (target or console).print(Group(*(Text.from_markup(line) for line in lines)))
 
 
 def _validate_links_file(path: Path) -> None:
@@ -43,14 +97,41 @@ def _validate_links_file(path: Path) -> None:
     Raises:
         typer.Exit: If validation fails.
     """
-    if not path.exists():
+    # One stat() answers both questions
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
         console.print(f"[red]Error:[/red] Links file not found: {path}")
-        raise typer.Exit(1)
-    if not path.is_file():
+        raise typer.Exit(1) from None
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Cannot access links file {path}: {e}")
+        raise typer.Exit(1) from None
+    if not stat.S_ISREG(mode):
         console.print(f"[red]Error:[/red] Not a file: {path}")
         raise typer.Exit(1)
 
 
+def _read_links(path: Path) -> list[str]:
+    """Read URLs from a links file, dropping comments and duplicates.
+    
+    The file is scanned in binary mode so blank and comment lines are
+    skipped without decoding them. Order of first occurrence is preserved.
+    
+    Args:
+        path: Path to the links file.
+        
+    Returns:
+        Unique URLs in file order.
+    """
+    with path.open("rb") as f:
+        seen = dict.fromkeys(
+            line.decode("utf-8", "ignore")
+            for line in (raw.strip() for raw in f)
+            if line and not line.startswith(b"#")
+        )
+    return list(seen)
+
+
 def _build_drive_path(drive_dest: str) -> Path:
     """Build the full Google Drive path from user input.
     
@@ -65,14 +146,16 @@ def _build_drive_path(drive_dest: str) -> Path:
     Returns:
         Full path to the drive destination.
     """
-    # If already absolute path starting with /content/drive, use as-is
-    if drive_dest.startswith("/content/drive"):
-        return Path(drive_dest)
+    drive_dest = drive_dest.strip()
     
-    # Strip leading slash if present
-    drive_dest = drive_dest.lstrip("/")
+    # If already a path inside the mount point, use as-is. Compare path
+    # components, so e.g. "/content/drive_backup" is not mistaken for it.
+    path = Path(os.path.normpath(drive_dest))
+    if path == _DRIVE_ROOT or _DRIVE_ROOT in path.parents:
+        return path
     
-    return Path("/content/drive") / drive_dest
+    # Strip leading slash if present
+    return _DRIVE_ROOT / drive_dest.lstrip("/")
 
 
 def _truncate_url(url: str, max_length: int = 50) -> str:
@@ -99,16 +182,57 @@ def _format_status(status: TaskStatus) -> str:
     Returns:
         Formatted status string with color markup.
     """
-    color_map = {
-        TaskStatus.DONE: "green",
-        TaskStatus.FAILED: "red",
-        TaskStatus.PENDING: "white",
-        TaskStatus.DOWNLOADING: "yellow",
-        TaskStatus.EXTRACTING: "yellow",
-        TaskStatus.UPLOADING: "yellow",
-    }
-    color = color_map.get(status, "white")
-    return f"[{color}]{status.value}[/{color}]"
+    markup = _STATUS_MARKUP.get(status.value)
+    if markup is None:
+        markup = f"[white]{status.value}[/white]"
+    return markup
+
+
+def _write_plain_task_rows(tasks: list[Task]) -> None:
+    """Write tasks to stdout as tab-separated rows with a header line.
+    
+    Used instead of a rich table when stdout is not a terminal, so large
+    listings piped to files or other tools skip rendering altogether.
+    
+    Args:
+        tasks: Tasks to write.
+    """
+    lines = ["url\thost\tstatus\tretries\tupdated\terror"]
+    for task in tasks:
+        error = (task.error or "").replace("\t", " ").replace("\n", " ")
+        lines.append(
+            f"{task.url}\t{task.host.value}\t{task.status.value}\t{task.retries}\t"
+            f"{task.updated_at.strftime('%Y-%m-%d %H:%M')}\t{error}"
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _write_json_task_rows(rows: Iterable[dict]) -> None:
+    """Write task rows to stdout as JSON Lines, one object per task.
+    
+    Uses orjson when it is installed and the standard library otherwise.
+    Rows are written as they are consumed, so a generator streams straight
+    to stdout.
+    
+    Args:
+        rows: Task dictionaries from StateDB.iter_task_dicts() with the
+            _JSON_TASK_COLUMNS fields.
+    """
+    try:
+        import orjson
+        
+        def dumps(obj: dict) -> str:
+            return orjson.dumps(obj).decode()
+    except ImportError:
+        import json
+        
+        dumps = json.dumps
+    
+    def encode(row: dict) -> str:
+        row["updated_at"] = row["updated_at"].isoformat()
+        return dumps(row) + "\n"
+    
+    sys.stdout.writelines(map(encode, rows))
 
 
 def _format_bytes(size_bytes: int) -> str:
@@ -120,16 +244,110 @@ def _format_bytes(size_bytes: int) -> str:
     Returns:
         Human-readable size string.
     """
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # Each unit is 2**10 of the previous one, so the exponent picks the unit;
+    # bit_length() gives it exactly, where a float log2 can round up
+    index = min(len(_BYTE_UNITS) - 1, (size_bytes.bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (index * 10)):.1f} {_BYTE_UNITS[index]}"
+
+
+def _package_version(dist_name: str) -> Optional[str]:
+    """Look up an installed distribution's version without importing it.
+    
+    Only the package metadata is read, so heavy packages are not initialized
+    just to confirm that they are present.
+    
+    Args:
+        dist_name: Distribution name as published (e.g. "python-dotenv").
+        
+    Returns:
+        Version string if installed, None otherwise.
+    """
+    try:
+        return distribution(dist_name).version
+    except PackageNotFoundError:
+        return None
+
+
+def _module_available(module_name: str) -> bool:
+    """Check whether a top-level module can be imported, without importing it.
+    
+    Modules that are already loaded are answered from ``sys.modules``; for
+    the rest, ``find_spec`` locates the module without executing it.
+    
+    Args:
+        module_name: Importable top-level module name (e.g. "dotenv").
+        
+    Returns:
+        True if the module is loaded or importable.
+    """
+    if module_name in sys.modules:
+        return True
+    try:
+        return find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _which_any(names: tuple[str, ...]) -> Optional[str]:
+    """Find the first of several executables with a single PATH scan.
+    
+    Unlike chained ``shutil.which`` calls, each PATH directory is visited
+    once and probed for every name before moving on.
+    
+    Args:
+        names: Executable names in order of preference within a directory.
+        
+    Returns:
+        Full path to the first match, or None if none is found.
+    """
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        if not directory:
+            continue
+        for name in names:
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                return candidate
+    return None
+
+
+def _walk_size(path: str) -> int:
+    """Sum file sizes under a directory with an iterative scandir walk.
+    
+    Args:
+        path: Directory path.
+        
+    Returns:
+        Total size in bytes. Unreadable entries are skipped.
+    """
+    # DirEntry caches type info from the directory listing, so we avoid a
+    # Path allocation and an extra stat() per entry.
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    return total
 
 
 def _get_dir_size(path: Path) -> int:
     """Calculate total size of a directory.
     
+    Top-level subdirectories are walked concurrently, since the walk is
+    bound by metadata round-trips rather than CPU.
+    
     Args:
         path: Directory path.
         
@@ -137,16 +355,145 @@ def _get_dir_size(path: Path) -> int:
         Total size in bytes.
     """
     total = 0
-    if path.exists() and path.is_dir():
-        for item in path.rglob("*"):
-            if item.is_file():
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
                 try:
-                    total += item.stat().st_size
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
                 except OSError:
                     pass
+    except OSError:
+        return 0
+    
+    if len(subdirs) <= 1:
+        return total + sum(_walk_size(d) for d in subdirs)
+    
+    workers = min(_MAX_WALK_WORKERS, len(subdirs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_walk_size, d) for d in subdirs]
+        for future in as_completed(futures):
+            total += future.result()
     return total
 
 
+def _parallel_rmtree(root: Path, workers: int = 16) -> None:
+    """Remove a directory tree, unlinking files from a thread pool.
+    
+    Collects files and directories with one scandir walk, unlinks the files
+    concurrently, then removes directories deepest-first. Falls back to
+    ``shutil.rmtree`` if anything goes wrong part-way through. If root is a
+    symlink, only the link is removed, as ``rm -rf`` would.
+    
+    Args:
+        root: Directory to remove.
+        workers: Maximum number of unlink threads.
+    """
+    # scandir would follow the link and empty its target
+    if os.path.islink(root):
+        os.unlink(root)
+        return
+    
+    files: list[str] = []
+    dirs: list[str] = [str(root)]
+    try:
+        # dirs is appended in walk order, so parents always precede children
+        index = 0
+        while index < len(dirs):
+            with os.scandir(dirs[index]) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    else:
+                        files.append(entry.path)
+            index += 1
+        
+        if files:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Consume the iterator so unlink errors propagate
+                for _ in executor.map(os.unlink, files, chunksize=256):
+                    pass
+        
+        for directory in reversed(dirs):
+            os.rmdir(directory)
+    except OSError:
+        shutil.rmtree(root)
+
+
+def _run_pipeline(pipeline: Pipeline) -> tuple[PipelineStats, bool]:
+    """Run the pipeline on a worker thread so the main thread stays responsive.
+    
+    SIGTERM (e.g. Colab runtime shutdown) and the first Ctrl-C request a
+    graceful shutdown: running subprocess downloads are stopped, other
+    running tasks finish and record their state, and interrupted or queued
+    tasks are left for the next run. A second Ctrl-C aborts immediately.
+    
+    Args:
+        pipeline: Configured pipeline to run.
+        
+    Returns:
+        Tuple of (stats, cancelled).
+        
+    Raises:
+        KeyboardInterrupt: If Ctrl-C is pressed a second time.
+        Exception: Any exception raised by the pipeline itself.
+    """
+    cancel = threading.Event()
+    outcome: dict = {}
+    
+    def target() -> None:
+        try:
+            outcome["stats"] = pipeline.run(cancel=cancel)
+        except BaseException as e:  # re-raised on the main thread
+            outcome["error"] = e
+    
+    worker = threading.Thread(target=target, name="pipeline", daemon=True)
+    previous_handler = signal.signal(signal.SIGTERM, lambda signum, frame: cancel.set())
+    try:
+        worker.start()
+        while worker.is_alive():
+            try:
+                # Short joins so signal handlers get a chance to run
+                worker.join(0.2)
+            except KeyboardInterrupt:
+                if cancel.is_set():
+                    raise
+                cancel.set()
+                console.print(
+                    "\n[yellow]Stopping downloads and waiting for active tasks "
+                    "(press Ctrl-C again to abort)...[/yellow]"
+                )
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+    
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["stats"], cancel.is_set()
+
+
+def _fast_rmtree(root: Path) -> None:
+    """Remove a directory tree, preferring the system ``rm -rf``.
+    
+    On POSIX systems ``rm`` deletes large trees noticeably faster than
+    Python-level walking. Falls back to the parallel unlinker when ``rm``
+    is unavailable or fails.
+    
+    Args:
+        root: Directory to remove.
+    """
+    rm = shutil.which("rm") if os.name == "posix" else None
+    if rm:
+        try:
+            subprocess.run([rm, "-rf", "--", str(root)], check=True, capture_output=True)
+            return
+        except (subprocess.CalledProcessError, OSError):
+            pass
+    _parallel_rmtree(root)
+
+
 @app.command()
 def run(
     links: Path = typer.Option(
@@ -184,6 +531,11 @@ def run(
         "--max-retries",
         help="Maximum retry attempts per task",
     ),
+    bunkr_workers: int = typer.Option(
+        0,
+        "--bunkr-workers",
+        help="Reuse this many Bunkr downloader processes across URLs (0: one per URL)",
+    ),
     retry_failed: bool = typer.Option(
         False,
         "--retry-failed",
@@ -212,15 +564,23 @@ def run(
     Example:
         colab-ingest run --links /path/to/links.txt --drive-dest "MyDrive/Uploads"
     """
+    from .core.pipeline import Pipeline, PipelineConfig
+    from .utils.logging import mask_sensitive_data, setup_logging
+    
     # Validate inputs
     _validate_links_file(links)
+    try:
+        link_urls = _read_links(links)
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Could not read links file: {e}")
+        raise typer.Exit(1) from None
     
     # Build full drive path
     full_drive_path = _build_drive_path(drive_dest)
     
     # Check if drive is accessible (when not in dry-run mode)
     if not dry_run:
-        drive_base = Path("/content/drive")
+        drive_base = _DRIVE_ROOT
         if not drive_base.exists():
             console.print(
                 "[yellow]Warning:[/yellow] Google Drive not mounted at /content/drive. "
@@ -238,51 +598,38 @@ def run(
         concurrency=concurrency,
         pixeldrain_api_key=pixeldrain_api_key,
         max_retries=max_retries,
+        bunkr_workers=bunkr_workers,
         retry_failed=retry_failed,
         keep_temp=keep_temp,
         dry_run=dry_run,
+        links=link_urls,
     )
     
     # Display configuration
-    console.print("\n[bold cyan]Pipeline Configuration[/bold cyan]")
-    console.print(f"  Links file:      {links}")
-    console.print(f"  Drive dest:      {full_drive_path}")
-    console.print(f"  Working dir:     {workdir}")
-    console.print(f"  Concurrency:     {concurrency}")
-    console.print(f"  Max retries:     {max_retries}")
-    console.print(f"  Retry failed:    {retry_failed}")
-    console.print(f"  Keep temp:       {keep_temp}")
-    console.print(f"  Dry run:         {dry_run}")
-    console.print(f"  Verbose:         {verbose}")
+    config_lines = [
+        "",
+        "[bold cyan]Pipeline Configuration[/bold cyan]",
+        f"  Links file:      {links} ({len(link_urls)} unique URL(s))",
+        f"  Drive dest:      {full_drive_path}",
+        f"  Working dir:     {workdir}",
+        f"  Concurrency:     {concurrency}",
+        f"  Max retries:     {max_retries}",
+        f"  Retry failed:    {retry_failed}",
+        f"  Keep temp:       {keep_temp}",
+        f"  Dry run:         {dry_run}",
+        f"  Verbose:         {verbose}",
+    ]
+    if bunkr_workers:
+        config_lines.append(f"  Bunkr workers:   {bunkr_workers}")
     if pixeldrain_api_key:
-        masked_key = "*" * (len(pixeldrain_api_key) - 4) + pixeldrain_api_key[-4:]
-        console.print(f"  Pixeldrain key:  {masked_key}")
-    console.print()
+        config_lines.append(f"  Pixeldrain key:  {mask_sensitive_data(pixeldrain_api_key)}")
+    config_lines.append("")
+    _print_lines(config_lines)
     
     # Run pipeline
     try:
         pipeline = Pipeline(config, logger=logger)
-        stats = pipeline.run()
-        
-        # Display summary
-        console.print("\n[bold cyan]Pipeline Summary[/bold cyan]")
-        console.print(f"  Total tasks:   {stats.total_tasks}")
-        console.print(f"  Completed:     [green]{stats.completed}[/green]")
-        console.print(f"  Failed:        [red]{stats.failed}[/red]")
-        console.print(f"  Skipped:       {stats.skipped}")
-        console.print(f"  Downloaded:    {_format_bytes(stats.bytes_downloaded)}")
-        console.print(f"  Uploaded:      {_format_bytes(stats.bytes_uploaded)}")
-        console.print(f"  Duration:      {stats.duration_seconds():.1f}s")
-        console.print()
-        
-        # Exit with appropriate code
-        if stats.failed > 0:
-            console.print("[yellow]Some tasks failed. Use 'status' to see details.[/yellow]")
-            raise typer.Exit(1)
-        else:
-            console.print("[green]All tasks completed successfully![/green]")
-            raise typer.Exit(0)
-            
+        stats, cancelled = _run_pipeline(pipeline)
     except KeyboardInterrupt:
         console.print("\n[yellow]Pipeline interrupted by user.[/yellow]")
         raise typer.Exit(130)
@@ -290,6 +637,29 @@ def run(
         console.print(f"[red]Pipeline error:[/red] {e}")
         logger.exception("Pipeline failed with exception")
         raise typer.Exit(1)
+    
+    # Display summary
+    _print_lines([
+        "",
+        "[bold cyan]Pipeline Summary[/bold cyan]",
+        f"  Total tasks:   {stats.total_tasks}",
+        f"  Completed:     [green]{stats.completed}[/green]",
+        f"  Failed:        [red]{stats.failed}[/red]",
+        f"  Skipped:       {stats.skipped}",
+        f"  Downloaded:    {_format_bytes(stats.bytes_downloaded)}",
+        f"  Uploaded:      {_format_bytes(stats.bytes_uploaded)}",
+        f"  Duration:      {stats.duration_seconds():.1f}s",
+        "",
+    ])
+    
+    # Exit with appropriate code
+    if cancelled:
+        console.print("[yellow]Pipeline interrupted; unfinished tasks will resume on the next run.[/yellow]")
+        raise typer.Exit(130)
+    if stats.failed > 0:
+        console.print("[yellow]Some tasks failed. Use 'status' to see details.[/yellow]")
+        raise typer.Exit(1)
+    console.print("[green]All tasks completed successfully![/green]")
 
 
 @app.command()
@@ -300,25 +670,82 @@ def status(
         "-w",
         help="Working directory",
     ),
+    limit: int = typer.Option(
+        200,
+        "--limit",
+        "-n",
+        help="Show at most this many tasks, most recently updated first (0 for all)",
+    ),
+    output: Optional[str] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Output format: table, json or tsv (default: table on a terminal, tsv otherwise)",
+    ),
 ) -> None:
     """
-    Show status of all tasks in the state database.
+    Show status of tasks in the state database.
     """
+    from rich.table import Table
+    
+    from .core.state import StateDB
+    
+    if output is None:
+        output = "table" if console.is_terminal else "tsv"
+    if output not in _STATUS_OUTPUT_FORMATS:
+        console.print(
+            f"[red]Error:[/red] Unknown output format: {output} "
+            f"(expected one of: {', '.join(_STATUS_OUTPUT_FORMATS)})"
+        )
+        raise typer.Exit(1)
+    
     state_db_path = workdir / "state.db"
     
     if not state_db_path.exists():
         console.print(f"[yellow]No state database found at {state_db_path}[/yellow]")
         console.print("Run the pipeline first to create tasks.")
-        raise typer.Exit(0)
+        return
     
     db = StateDB(state_db_path)
     db.init_db()
     
-    tasks = db.get_all_tasks()
+    task_limit = limit if limit > 0 else None
+    if output == "json":
+        # Machine-readable output: one JSON object per line, no summary
+        _write_json_task_rows(
+            db.iter_task_dicts(_JSON_TASK_COLUMNS, task_limit, "updated_at DESC")
+        )
+        return
+    
+    tasks = db.get_all_tasks(limit=task_limit, order_by="updated_at DESC")
     
     if not tasks:
         console.print("[yellow]No tasks found in the database.[/yellow]")
-        raise typer.Exit(0)
+        return
+    
+    # Summary shown below the task rows
+    stats = db.get_stats()
+    summary_lines = []
+    if len(tasks) < stats.get("total", 0):
+        summary_lines.append(
+            f"[dim]Showing {len(tasks)} most recently updated of "
+            f"{stats['total']} task(s); use --limit 0 to show all.[/dim]"
+        )
+    summary_lines += [
+        "",
+        f"[bold]Summary:[/bold] "
+        f"Total: {stats.get('total', 0)}, "
+        f"[green]Done: {stats.get('done', 0)}[/green], "
+        f"[red]Failed: {stats.get('failed', 0)}[/red], "
+        f"Pending: {stats.get('pending', 0)}",
+    ]
+    
+    if output == "tsv":
+        # Skip table layout and styling entirely; the summary goes to
+        # stderr so stdout holds only task rows
+        _write_plain_task_rows(tasks)
+        _print_lines(summary_lines, err_console)
+        return
     
     # Create table
     table = Table(title="Task Status")
@@ -329,8 +756,8 @@ def status(
     table.add_column("Updated")
     table.add_column("Error", style="red", max_width=30)
     
-    for task in tasks:
-        table.add_row(
+    rows = [
+        (
             _truncate_url(task.url),
             task.host.value,
             _format_status(task.status),
@@ -338,16 +765,12 @@ def status(
             task.updated_at.strftime("%Y-%m-%d %H:%M"),
             (task.error[:27] + "...") if task.error and len(task.error) > 30 else (task.error or ""),
         )
+        for task in tasks
+    ]
+    for row in rows:
+        table.add_row(*row)
     
-    console.print(table)
-    
-    # Show summary
-    stats = db.get_stats()
-    console.print(f"\n[bold]Summary:[/bold] "
-                  f"Total: {stats.get('total', 0)}, "
-                  f"[green]Done: {stats.get('done', 0)}[/green], "
-                  f"[red]Failed: {stats.get('failed', 0)}[/red], "
-                  f"Pending: {stats.get('pending', 0)}")
+    console.print(Group(table, *(Text.from_markup(line) for line in summary_lines)))
 
 
 @app.command()
@@ -372,6 +795,8 @@ def reset(
     """
     Reset failed tasks to pending status for retry.
     """
+    from .core.state import StateDB, TaskStatus
+    
     state_db_path = workdir / "state.db"
     
     if not state_db_path.exists():
@@ -396,19 +821,16 @@ def reset(
         all_task_list = db.get_all_tasks()
         if not all_task_list:
             console.print("[yellow]No tasks to reset.[/yellow]")
-            raise typer.Exit(0)
+            return
         
         confirm = typer.confirm(
             f"Reset ALL {len(all_task_list)} tasks to pending? This cannot be undone."
         )
         if not confirm:
             console.print("[yellow]Cancelled.[/yellow]")
-            raise typer.Exit(0)
+            return
         
-        reset_count = 0
-        for task in all_task_list:
-            db.reset_task(task.id)
-            reset_count += 1
+        reset_count = db.reset_tasks(task.id for task in all_task_list)
         
         console.print(f"[green]Reset {reset_count} task(s) to pending.[/green]")
         
@@ -418,12 +840,9 @@ def reset(
         
         if not failed_tasks:
             console.print("[yellow]No failed tasks to reset.[/yellow]")
-            raise typer.Exit(0)
+            return
         
-        reset_count = 0
-        for task in failed_tasks:
-            db.reset_task(task.id)
-            reset_count += 1
+        reset_count = db.reset_tasks(task.id for task in failed_tasks)
         
         console.print(f"[green]Reset {reset_count} failed task(s) to pending.[/green]")
 
@@ -459,29 +878,33 @@ def clean(
     
     if total_size == 0:
         console.print("[yellow]No temporary files to clean.[/yellow]")
-        raise typer.Exit(0)
+        return
     
-    console.print("[bold]Directories to clean:[/bold]")
+    clean_lines = ["[bold]Directories to clean:[/bold]"]
     if downloads_dir.exists():
-        console.print(f"  downloads/  ({_format_bytes(downloads_size)})")
+        clean_lines.append(f"  downloads/  ({_format_bytes(downloads_size)})")
     if extracted_dir.exists():
-        console.print(f"  extracted/  ({_format_bytes(extracted_size)})")
-    console.print(f"\n[bold]Total space to free:[/bold] {_format_bytes(total_size)}")
-    
-    console.print("\n[dim]Keeping: logs/, state.db[/dim]")
+        clean_lines.append(f"  extracted/  ({_format_bytes(extracted_size)})")
+    clean_lines += [
+        "",
+        f"[bold]Total space to free:[/bold] {_format_bytes(total_size)}",
+        "",
+        "[dim]Keeping: logs/, state.db[/dim]",
+    ]
+    _print_lines(clean_lines)
     
     if not force:
         confirm = typer.confirm("\nProceed with cleanup?")
         if not confirm:
             console.print("[yellow]Cancelled.[/yellow]")
-            raise typer.Exit(0)
+            return
     
     # Perform cleanup
     cleaned_size = 0
     
     if downloads_dir.exists():
         try:
-            shutil.rmtree(downloads_dir)
+            _fast_rmtree(downloads_dir)
             cleaned_size += downloads_size
             console.print("[green]Removed downloads/[/green]")
         except Exception as e:
@@ -489,7 +912,7 @@ def clean(
     
     if extracted_dir.exists():
         try:
-            shutil.rmtree(extracted_dir)
+            _fast_rmtree(extracted_dir)
             cleaned_size += extracted_size
             console.print("[green]Removed extracted/[/green]")
         except Exception as e:
@@ -510,6 +933,10 @@ def check() -> None:
     - Extraction tools (unrar, 7z)
     - Google Drive mount
     """
+    from rich.table import Table
+    
+    from .utils.logging import mask_sensitive_data
+    
     table = Table(title="System Check")
     table.add_column("Component", style="cyan")
     table.add_column("Status")
@@ -529,21 +956,26 @@ def check() -> None:
         all_ok = False
     
     # Required packages
-    packages = ["typer", "rich", "python-dotenv", "httpx"]
-    for pkg in packages:
-        try:
-            __import__(pkg.replace("-", "_"))
-            table.add_row(f"Package: {pkg}", "[green]OK[/green]", "Installed")
-        except ImportError:
+    packages = {
+        "typer": "typer",
+        "rich": "rich",
+        "python-dotenv": "dotenv",
+        "httpx": "httpx",
+    }
+    for pkg, module_name in packages.items():
+        if _module_available(module_name):
+            version = _package_version(pkg)
+            details = f"Installed ({version})" if version else "Installed"
+            table.add_row(f"Package: {pkg}", "[green]OK[/green]", details)
+        else:
             table.add_row(f"Package: {pkg}", "[red]FAIL[/red]", "Not installed")
             all_ok = False
     
-    # Third-party downloader scripts
-    third_party_dir = Path(__file__).parent.parent / "third_party"
-    bunkr_script = third_party_dir / "BunkrDownloader" / "downloader.py"
-    buzz_script = third_party_dir / "buzzheavier-downloader" / "bhdownload.py"
+    # Bundled downloader scripts
+    bunkr_script = _BUNDLED_DOWNLOADERS_DIR / "bunkr" / "downloader.py"
+    buzz_script = _BUNDLED_DOWNLOADERS_DIR / "buzzheavier" / "bhdownload.py"
     
-    if bunkr_script.exists():
+    if os.path.isfile(bunkr_script):
         table.add_row("BunkrDownloader", "[green]OK[/green]", str(bunkr_script))
     else:
         table.add_row(
@@ -552,7 +984,7 @@ def check() -> None:
             "Not found - Bunkr downloads won't work",
         )
     
-    if buzz_script.exists():
+    if os.path.isfile(buzz_script):
         table.add_row("BuzzHeavier", "[green]OK[/green]", str(buzz_script))
     else:
         table.add_row(
@@ -568,15 +1000,17 @@ def check() -> None:
     else:
         table.add_row("unrar", "[yellow]WARN[/yellow]", "Not found - RAR extraction limited")
     
-    sevenz_path = shutil.which("7z") or shutil.which("7za")
+    sevenz_path = _which_any(("7z", "7za"))
     if sevenz_path:
         table.add_row("7-Zip", "[green]OK[/green]", sevenz_path)
     else:
         table.add_row("7-Zip", "[yellow]WARN[/yellow]", "Not found - 7z extraction limited")
     
     # Google Drive mount
-    drive_path = Path("/content/drive")
-    if drive_path.exists() and drive_path.is_dir():
+    # is_dir() is a single stat and is False for missing paths; this
+    # matters on the FUSE mount where each stat is a round-trip
+    drive_path = _DRIVE_ROOT
+    if drive_path.is_dir():
         # Check if MyDrive exists
         mydrive = drive_path / "MyDrive"
         if mydrive.exists():
@@ -598,7 +1032,7 @@ def check() -> None:
     # Environment variables
     pixeldrain_key = os.environ.get("PIXELDRAIN_API_KEY")
     if pixeldrain_key:
-        masked = "*" * (len(pixeldrain_key) - 4) + pixeldrain_key[-4:]
+        masked = mask_sensitive_data(pixeldrain_key)
         table.add_row("PIXELDRAIN_API_KEY", "[green]OK[/green]", f"Set ({masked})")
     else:
         table.add_row(
@@ -617,7 +1051,16 @@ def check() -> None:
 
 
 def main() -> None:
-    """Main entry point for the CLI."""
+    """Main entry point for the CLI.
+    
+    Loads a ``.env`` file if present, unless ``COLAB_INGEST_SKIP_DOTENV``
+    is set, before dispatching to the Typer app.
+    """
+    if not os.environ.get("COLAB_INGEST_SKIP_DOTENV"):
+        from dotenv import load_dotenv
+        
+        load_dotenv()
+    
     app()
 
 
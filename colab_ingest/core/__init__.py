@@ -7,8 +7,14 @@ This module contains the main orchestration logic for:
 - Upload coordination
 """
 
-from colab_ingest.core.pipeline import Pipeline, PipelineConfig, PipelineStats
-from colab_ingest.core.state import StateDB, Task, TaskStatus
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from colab_ingest.core.pipeline import Pipeline, PipelineConfig, PipelineStats
+    from colab_ingest.core.state import StateDB, Task, TaskStatus
 
 __all__ = [
     "Pipeline",
@@ -18,3 +24,22 @@ __all__ = [
     "Task",
     "TaskStatus",
 ]
+
+# Resolved on first access; see colab_ingest.__getattr__
+_LAZY_EXPORTS = {
+    "Pipeline": "colab_ingest.core.pipeline",
+    "PipelineConfig": "colab_ingest.core.pipeline",
+    "PipelineStats": "colab_ingest.core.pipeline",
+    "StateDB": "colab_ingest.core.state",
+    "Task": "colab_ingest.core.state",
+    "TaskStatus": "colab_ingest.core.state",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
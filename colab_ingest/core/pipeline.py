@@ -8,17 +8,23 @@ and graceful shutdown handling.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import os
+import queue
 import signal
 import sys
 import re
 import threading
-from concurrent.futures import ThreadPoolExecutor, Future
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.progress import (
     Progress,
@@ -41,8 +47,52 @@ from ..downloaders.pixeldrain import PixeldrainDownloader, DownloadResult
 from ..utils.extract import extract_archive, ExtractionResult
 from ..utils.logging import setup_logging, TaskLogAdapter, is_colab_environment
 from ..utils.paths import WorkdirManager
-from ..utils.upload import upload_to_drive, UploadResult
-from ..utils.url_detect import HostType, parse_links_file
+from ..utils.upload import upload_to_drive_many, UploadResult
+from ..utils.url_detect import (
+    HostType,
+    extract_buzzheavier_id,
+    extract_pixeldrain_id,
+    parse_links,
+    parse_links_file,
+)
+
+# Max state updates the state writer groups into one batch
+_STATE_WRITE_BATCH = 256
+
+# Minimum time between progress display updates from one callback
+_PROGRESS_UPDATE_INTERVAL_NS = 100_000_000  # 100ms
+
+# Kinds of queued state updates (see Pipeline._write_state_batch)
+_STATE_STATUS = "status"
+_STATE_OUTPUT_PATHS = "output_paths"
+
+
+def _split_missing(paths: Iterable[Path]) -> Tuple[List[Path], List[Path]]:
+    """Split paths into those that exist and those that do not.
+
+    Each parent directory is listed once with os.scandir() instead of
+    stat'ing every path.
+
+    Args:
+        paths: Files or directories to check.
+
+    Returns:
+        Tuple of (existing paths, missing paths), each in input order.
+    """
+    names_by_dir: Dict[Path, Set[str]] = {}
+    present: List[Path] = []
+    missing: List[Path] = []
+    for path in paths:
+        names = names_by_dir.get(path.parent)
+        if names is None:
+            try:
+                with os.scandir(path.parent) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            names_by_dir[path.parent] = names
+        (present if path.name in names else missing).append(path)
+    return present, missing
 
 
 @dataclass
@@ -56,9 +106,12 @@ class PipelineConfig:
         concurrency: Number of concurrent workers (default 3).
         pixeldrain_api_key: Optional API key for Pixeldrain authentication.
         max_retries: Maximum retry attempts for failed operations (default 3).
+        bunkr_workers: Number of Bunkr downloader processes reused across
+            downloads (default 0: a fresh process per download).
         retry_failed: If True, retry previously failed tasks (default False).
         keep_temp: If True, keep temporary files after upload (default False).
         dry_run: If True, log actions without executing (default False).
+        links: Pre-read URLs to process. When set, links_file is not re-parsed.
     """
 
     links_file: Path
@@ -67,9 +120,11 @@ class PipelineConfig:
     concurrency: int = 3
     pixeldrain_api_key: Optional[str] = None
     max_retries: int = 3
+    bunkr_workers: int = 0
     retry_failed: bool = False
     keep_temp: bool = False
     dry_run: bool = False
+    links: Optional[List[str]] = field(default=None, repr=False)
 
 
 @dataclass
@@ -83,8 +138,10 @@ class PipelineStats:
         skipped: Number of skipped tasks (already done).
         bytes_downloaded: Total bytes downloaded across all tasks.
         bytes_uploaded: Total bytes uploaded to Drive.
-        start_time: Pipeline start timestamp.
+        start_time: Pipeline start timestamp (for display).
         end_time: Pipeline end timestamp (None if still running).
+        start_monotonic: Monotonic clock reading at start, used for durations.
+        end_monotonic: Monotonic clock reading at end (None if still running).
     """
 
     total_tasks: int = 0
@@ -95,15 +152,25 @@ class PipelineStats:
     bytes_uploaded: int = 0
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
+    start_monotonic: float = field(default_factory=time.monotonic, repr=False)
+    end_monotonic: Optional[float] = field(default=None, repr=False)
+
+    def mark_finished(self) -> None:
+        """Record the end of the pipeline execution."""
+        self.end_monotonic = time.monotonic()
+        self.end_time = datetime.now()
 
     def duration_seconds(self) -> float:
         """Calculate the duration of the pipeline execution.
 
+        Uses the monotonic clock, so it is cheap to call and unaffected by
+        wall-clock adjustments.
+
         Returns:
             Duration in seconds.
         """
-        end = self.end_time or datetime.now()
-        return (end - self.start_time).total_seconds()
+        end = self.end_monotonic if self.end_monotonic is not None else time.monotonic()
+        return end - self.start_monotonic
 
     def summary(self) -> str:
         """Generate a summary string of the pipeline execution.
@@ -160,20 +227,66 @@ class Pipeline:
         self._state_db = StateDB(self._workdir_manager.state_db_path)
         self._state_db.init_db()
 
+        # State updates from worker threads are queued to a single writer
+        # coroutine while tasks run, which applies them on one dedicated
+        # thread (see _state_writer_loop); the loop is also used to hand
+        # statistics updates to the event loop thread
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._state_events: Optional[asyncio.Queue] = None
+
+        # HTTP session shared by all Pixeldrain downloads of a run, so
+        # connections (and TLS sessions) are reused across tasks
+        self._http_session: Optional[requests.Session] = None
+
+        # Subprocess downloader adapters are shared by all tasks (each call
+        # passes the task's download dir); installation is checked once
+        downloads_dir = self._workdir_manager.downloads_dir
+        self._bunkr_adapter = BunkrDownloaderAdapter(
+            download_dir=downloads_dir,
+            max_retries=config.max_retries,
+            logger=self.logger,
+            worker_pool_size=config.bunkr_workers,
+        )
+        self._buzzheavier_adapter = BuzzHeavierDownloaderAdapter(
+            download_dir=downloads_dir,
+            logger=self.logger,
+        )
+        self._adapter_installed: Dict[HostType, bool] = {}
+
+        # Download handler per host; all share the _download_pixeldrain signature
+        self._download_handlers: Dict[
+            HostType,
+            Callable[
+                [Task, Path, Optional[Callable], TaskLogAdapter],
+                Tuple[List[Path], int],
+            ],
+        ] = {
+            HostType.PIXELDRAIN: self._download_pixeldrain,
+            HostType.BUNKR: self._download_bunkr,
+            HostType.BUZZHEAVIER: self._download_buzzheavier,
+        }
+
         # Detect if running in Colab - use simple logging instead of rich progress
         self._in_colab = is_colab_environment()
 
-        # Rich console for progress display (only used when not in Colab)
-        self._console = Console() if not self._in_colab else None
+        # Rich console for progress display. Only created for interactive
+        # terminals outside Colab: when stdout is redirected (CI, nohup) or
+        # COLAB_INGEST_QUIET=1, nobody sees the live display and its refresh
+        # thread would just burn CPU, so progress is logged instead.
+        show_progress = (
+            not self._in_colab
+            and sys.stdout.isatty()
+            and os.environ.get("COLAB_INGEST_QUIET") != "1"
+        )
+        self._console: Optional[Console] = Console() if show_progress else None
 
-        # Shutdown handling
-        self._shutdown_requested = False
-        self._shutdown_lock = threading.Lock()
-        self._active_futures: Dict[str, Future] = {}
+        # Shutdown handling (the event may be replaced by one passed to run())
+        self._cancel_event = threading.Event()
+        self._active_count = 0
 
-        # Statistics tracking
+        # Statistics tracking (only mutated on the event loop thread while
+        # tasks run; workers report through _add_stats)
         self._stats = PipelineStats()
-        self._stats_lock = threading.Lock()
 
         # Progress tracking (disabled in Colab for better output)
         self._progress: Optional[Progress] = None
@@ -184,21 +297,38 @@ class Pipeline:
             self.logger.info("Running in Colab mode (simple logging enabled)")
         self.logger.info(f"Pipeline initialized with config: {config}")
 
-    def run(self) -> PipelineStats:
+    @property
+    def _shutdown_requested(self) -> bool:
+        """Whether a graceful shutdown has been requested."""
+        return self._cancel_event.is_set()
+
+    def run(self, cancel: Optional[threading.Event] = None) -> PipelineStats:
         """Execute the full pipeline synchronously.
 
+        Args:
+            cancel: Optional event that requests a graceful shutdown when set.
+                Running subprocess downloads are stopped and tasks already
+                past their download finish; interrupted and queued tasks are
+                left for a later run to resume. Lets callers running the
+                pipeline off the main thread cancel it cooperatively.
+
         Returns:
             PipelineStats with execution statistics.
         """
-        return asyncio.run(self.run_async())
+        return asyncio.run(self.run_async(cancel=cancel))
 
-    async def run_async(self) -> PipelineStats:
+    async def run_async(self, cancel: Optional[threading.Event] = None) -> PipelineStats:
         """Async version of run for better concurrency.
 
+        Args:
+            cancel: Optional event that requests a graceful shutdown when set.
+
         Returns:
             PipelineStats with execution statistics.
         """
-        self._stats = PipelineStats(start_time=datetime.now())
+        if cancel is not None:
+            self._cancel_event = cancel
+        self._stats = PipelineStats()
 
         # Register signal handlers for graceful shutdown
         self._register_signal_handlers()
@@ -210,27 +340,218 @@ class Pipeline:
 
             if not tasks:
                 self.logger.info("No tasks to process")
-                self._stats.end_time = datetime.now()
+                self._stats.mark_finished()
                 return self._stats
 
             self.logger.info(f"Loaded {len(tasks)} task(s) to process")
 
             if self.config.dry_run:
                 self._dry_run_tasks(tasks)
-                self._stats.end_time = datetime.now()
+                self._stats.mark_finished()
                 return self._stats
 
             # Process tasks with concurrency
-            await self._process_tasks_concurrent(tasks)
+            self._http_session = self._create_http_session()
+            writer = self._start_state_writer()
+            try:
+                await self._process_tasks_concurrent(tasks)
+            finally:
+                await self._stop_state_writer(writer)
+                self._http_session.close()
+                self._http_session = None
 
         except Exception as e:
             self.logger.error(f"Pipeline execution failed: {e}", exc_info=True)
         finally:
-            self._stats.end_time = datetime.now()
+            # Release the connections opened by the loop and writer threads,
+            # and any pooled downloader processes
+            self._state_db.close()
+            self._bunkr_adapter.close()
+            self._stats.mark_finished()
             self.logger.info(self._stats.summary())
 
         return self._stats
 
+    def _create_http_session(self) -> requests.Session:
+        """Create the HTTP session shared by a run's downloads.
+
+        The connection pool is sized so every concurrent task can keep a
+        connection to the same host alive.
+
+        Returns:
+            Configured requests session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max(self.config.concurrency, 10))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _start_state_writer(self) -> asyncio.Task:
+        """Start the background coroutine that persists state updates.
+
+        Returns:
+            The writer task, to be passed to _stop_state_writer().
+        """
+        self._loop = asyncio.get_running_loop()
+        self._state_events = asyncio.Queue()
+        return asyncio.create_task(self._state_writer_loop(self._state_events))
+
+    async def _stop_state_writer(self, writer: asyncio.Task) -> None:
+        """Flush queued state updates and stop the writer.
+
+        Args:
+            writer: Task returned by _start_state_writer().
+        """
+        if self._state_events is not None:
+            self._state_events.put_nowait(None)
+        try:
+            await writer
+        finally:
+            self._state_events = None
+            self._loop = None
+
+    async def _state_writer_loop(self, events: asyncio.Queue) -> None:
+        """Drain queued state updates into grouped writes.
+
+        Waits for one update, then takes everything else already queued
+        (up to _STATE_WRITE_BATCH) and writes it as one batch. All batches
+        run on a single dedicated thread, so workers never contend for the
+        database's write lock. A None event stops the loop after earlier
+        updates are written.
+
+        Args:
+            events: Queue of (kind, args) tuples.
+        """
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-writer") as executor:
+            stopping = False
+            while not stopping:
+                batch = []
+                event = await events.get()
+                while event is not None:
+                    batch.append(event)
+                    if len(batch) >= _STATE_WRITE_BATCH or events.empty():
+                        break
+                    event = events.get_nowait()
+                stopping = event is None
+
+                if batch:
+                    try:
+                        await loop.run_in_executor(executor, self._write_state_batch, batch)
+                    except Exception as e:
+                        self.logger.error(f"Failed to write task state updates: {e}")
+
+    def _write_state_batch(self, batch: List[Tuple[str, tuple]]) -> None:
+        """Apply one batch of queued state updates.
+
+        The whole batch is written in a single transaction. If that fails,
+        the transaction is rolled back and the updates are written one at a
+        time, so one bad update only loses itself.
+
+        Args:
+            batch: (kind, args) tuples in the order they were queued.
+        """
+        try:
+            with self._state_db.batch():
+                self._apply_state_updates(batch)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                raise
+            self.logger.warning(
+                f"Grouped task state write failed ({e}); writing updates one at a time"
+            )
+
+        for event in batch:
+            try:
+                self._apply_state_updates([event])
+            except Exception as e:
+                task_id = event[1][0]
+                self.logger.error(f"Failed to write state update for task {task_id}: {e}")
+
+    def _apply_state_updates(self, updates: List[Tuple[str, tuple]]) -> None:
+        """Write queued state updates, output paths first.
+
+        Args:
+            updates: (kind, args) tuples in the order they were queued.
+        """
+        status_updates = []
+        for kind, args in updates:
+            if kind == _STATE_STATUS:
+                status_updates.append(args)
+            else:
+                self._state_db.set_output_paths(*args)
+        self._state_db.update_statuses(status_updates)
+
+    def _set_status(
+        self,
+        task_id: str,
+        status: TaskStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a task status change.
+
+        While tasks are running the update is queued for the state writer;
+        otherwise it is written directly. Safe to call from worker threads.
+
+        Args:
+            task_id: The task ID to update.
+            status: The new status.
+            error: Optional error message.
+        """
+        loop, events = self._loop, self._state_events
+        if loop is None or events is None:
+            self._state_db.update_status(task_id, status, error=error)
+            return
+        loop.call_soon_threadsafe(
+            events.put_nowait, (_STATE_STATUS, (task_id, status, error))
+        )
+
+    def _set_output_paths(self, task_id: str, paths: List[str]) -> None:
+        """Record a task's output paths.
+
+        Queued for the state writer while tasks are running, like
+        _set_status(). Safe to call from worker threads.
+
+        Args:
+            task_id: The task ID to update.
+            paths: List of output paths.
+        """
+        loop, events = self._loop, self._state_events
+        if loop is None or events is None:
+            self._state_db.set_output_paths(task_id, paths)
+            return
+        loop.call_soon_threadsafe(
+            events.put_nowait, (_STATE_OUTPUT_PATHS, (task_id, paths))
+        )
+
+    def _add_stats(self, **deltas: int) -> None:
+        """Add to the pipeline statistics counters.
+
+        While tasks run, the deltas are handed to the event loop thread,
+        which is the only thread that mutates the counters, so no lock is
+        needed. Safe to call from worker threads.
+
+        Args:
+            **deltas: Amounts to add, keyed by PipelineStats field name.
+        """
+        loop = self._loop
+        if loop is None:
+            self._apply_stats(deltas)
+            return
+        loop.call_soon_threadsafe(self._apply_stats, deltas)
+
+    def _apply_stats(self, deltas: Dict[str, int]) -> None:
+        """Apply counter deltas to the statistics.
+
+        Args:
+            deltas: Amounts to add, keyed by PipelineStats field name.
+        """
+        stats = self._stats
+        for name, delta in deltas.items():
+            setattr(stats, name, getattr(stats, name) + delta)
+
     def _load_tasks(self) -> List[Task]:
         """Parse links file and create/update tasks in state DB.
 
@@ -239,9 +560,12 @@ class Pipeline:
         """
         self.logger.info(f"Loading tasks from: {self.config.links_file}")
 
-        # Parse links file
+        # Parse links (already read by the caller, or from the links file)
         try:
-            parsed_links = parse_links_file(self.config.links_file)
+            if self.config.links is not None:
+                parsed_links = parse_links(self.config.links)
+            else:
+                parsed_links = parse_links_file(self.config.links_file)
         except FileNotFoundError as e:
             self.logger.error(f"Links file not found: {e}")
             return []
@@ -251,6 +575,21 @@ class Pipeline:
 
         tasks_to_process: List[Task] = []
 
+        # Look up every known URL in one query instead of one per link
+        existing_tasks = self._state_db.get_tasks_by_urls(
+            url for url, host_type, _ in parsed_links if host_type != HostType.UNKNOWN
+        )
+
+        # Create all new tasks in one transaction
+        created_tasks = {
+            task.url: task
+            for task in self._state_db.create_tasks(
+                (url, host_type)
+                for url, host_type, _ in parsed_links
+                if host_type != HostType.UNKNOWN and url not in existing_tasks
+            )
+        }
+
         for original_url, host_type, extracted_id in parsed_links:
             # Skip unknown hosts
             if host_type == HostType.UNKNOWN:
@@ -258,14 +597,13 @@ class Pipeline:
                 continue
 
             # Check if task exists in state DB
-            existing_task = self._state_db.get_task_by_url(original_url)
+            existing_task = existing_tasks.get(original_url)
 
             if existing_task:
                 # Handle existing task based on status
                 if existing_task.status == TaskStatus.DONE:
                     self.logger.debug(f"Skipping completed task: {original_url}")
-                    with self._stats_lock:
-                        self._stats.skipped += 1
+                    self._stats.skipped += 1
                     continue
 
                 if existing_task.status == TaskStatus.FAILED:
@@ -279,16 +617,15 @@ class Pipeline:
                             tasks_to_process.append(existing_task)
                     else:
                         self.logger.debug(f"Skipping failed task (retry_failed=False): {original_url}")
-                        with self._stats_lock:
-                            self._stats.skipped += 1
+                        self._stats.skipped += 1
                     continue
 
                 # Task is in progress (PENDING, DOWNLOADING, EXTRACTING, UPLOADING)
                 # Add to processing list
                 tasks_to_process.append(existing_task)
             else:
-                # Create new task
-                task = self._state_db.create_task(original_url, host_type)
+                # Newly created task
+                task = created_tasks[original_url]
                 self.logger.debug(f"Created new task: {task.id} for {original_url}")
                 tasks_to_process.append(task)
 
@@ -317,8 +654,8 @@ class Pipeline:
         Args:
             tasks: List of tasks to process.
         """
-        # In Colab mode, use simple logging instead of rich progress
-        if self._in_colab:
+        # In Colab or headless mode, use simple logging instead of rich progress
+        if self._console is None:
             await self._process_tasks_concurrent_simple(tasks)
             return
 
@@ -341,80 +678,86 @@ class Pipeline:
                 total=len(tasks),
             )
 
-            # Use ThreadPoolExecutor for concurrent processing
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=self.config.concurrency) as executor:
-                # Submit all tasks
-                futures: List[Future] = []
-                for task in tasks:
-                    if self._shutdown_requested:
-                        break
-
-                    future = executor.submit(self._process_task, task)
-                    futures.append(future)
-                    with self._shutdown_lock:
-                        self._active_futures[task.id] = future
-
-                # Wait for all tasks to complete
-                for future in futures:
-                    if self._shutdown_requested:
-                        self.logger.info("Shutdown requested, waiting for active tasks...")
-                        break
-
-                    try:
-                        # Use asyncio to wait without blocking
-                        await loop.run_in_executor(None, future.result)
-                    except Exception as e:
-                        self.logger.error(f"Task execution error: {e}")
+            await self._run_tasks(tasks)
 
             self._progress = None
 
     async def _process_tasks_concurrent_simple(self, tasks: List[Task]) -> None:
-        """Process tasks concurrently with simple logging (for Colab).
+        """Process tasks concurrently with simple logging (for Colab/headless).
 
         This method uses standard logging instead of rich progress bars,
-        which works better in Google Colab's output system.
+        which works better in Google Colab's output system and in logs
+        captured from non-interactive runs.
 
         Args:
             tasks: List of tasks to process.
         """
         self.logger.info(f"Processing {len(tasks)} task(s) with concurrency={self.config.concurrency}")
         
-        # Use ThreadPoolExecutor for concurrent processing
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor(max_workers=self.config.concurrency) as executor:
-            # Submit all tasks
-            futures: List[Future] = []
-            for i, task in enumerate(tasks, 1):
-                if self._shutdown_requested:
-                    break
-
-                self.logger.info(f"[{i}/{len(tasks)}] Queuing task: {task.url[:60]}...")
-                future = executor.submit(self._process_task, task)
-                futures.append(future)
-                with self._shutdown_lock:
-                    self._active_futures[task.id] = future
-
-            # Wait for all tasks to complete
-            completed_count = 0
-            for future in futures:
-                if self._shutdown_requested:
-                    self.logger.info("Shutdown requested, waiting for active tasks...")
-                    break
+        for i, task in enumerate(tasks, 1):
+            self.logger.info(f"[{i}/{len(tasks)}] Queuing task: {task.url[:60]}...")
+
+        completed_count = 0
+
+        def log_progress() -> None:
+            nonlocal completed_count
+            completed_count += 1
+            self.logger.info(
+                f"Progress: {completed_count}/{len(tasks)} tasks processed "
+                f"({self._stats.completed} completed, {self._stats.failed} failed)"
+            )
+
+        await self._run_tasks(tasks, on_task_done=log_progress)
+
+    async def _run_tasks(
+        self,
+        tasks: List[Task],
+        on_task_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Run tasks with at most ``concurrency`` of them in flight.
+
+        A semaphore bounds the number of running tasks, so queued tasks hold
+        no worker thread until they start. Each task's blocking phases
+        (subprocess downloaders, extraction, copying to Drive) run on a
+        dedicated pool of ``concurrency`` worker threads to keep the event
+        loop free; the loop's default executor would cap them at
+        min(32, cpu_count + 4).
 
+        Completions are handled in the order tasks finish, not the order
+        they were queued, so a slow early task never delays accounting for
+        the ones behind it.
+
+        Args:
+            tasks: List of tasks to process.
+            on_task_done: Optional callback invoked on the event loop after
+                each task finishes, successfully or not.
+        """
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def run_one(task: Task, executor: ThreadPoolExecutor) -> None:
+            async with semaphore:
+                self._active_count += 1
                 try:
-                    # Use asyncio to wait without blocking
-                    await loop.run_in_executor(None, future.result)
-                    completed_count += 1
+                    await loop.run_in_executor(executor, self._process_task, task)
                 except Exception as e:
                     self.logger.error(f"Task execution error: {e}")
-                    completed_count += 1
-                
-                # Log progress periodically
-                self.logger.info(
-                    f"Progress: {completed_count}/{len(tasks)} tasks processed "
-                    f"({self._stats.completed} completed, {self._stats.failed} failed)"
-                )
+                finally:
+                    self._active_count -= 1
+
+        shutdown_logged = False
+        with ThreadPoolExecutor(
+            max_workers=self.config.concurrency, thread_name_prefix="task"
+        ) as executor:
+            for finished in asyncio.as_completed(
+                [run_one(task, executor) for task in tasks]
+            ):
+                await finished
+                if on_task_done is not None:
+                    on_task_done()
+                if self._shutdown_requested and not shutdown_logged:
+                    self.logger.info("Shutdown requested, waiting for active tasks...")
+                    shutdown_logged = True
 
     def _process_task(self, task: Task) -> bool:
         """Process single task: download → extract → upload → cleanup.
@@ -426,7 +769,14 @@ class Pipeline:
             True if task completed successfully, False otherwise.
         """
         task_logger = TaskLogAdapter(self.logger, task.id)
-        task_logger.info(f"Starting task: {task.url}")
+
+        # Queued tasks bail out once shutdown is requested; they stay in
+        # their current state and are picked up again on the next run.
+        if self._shutdown_requested:
+            task_logger.info("Shutdown requested, leaving task for next run")
+            return False
+
+        task_logger.info("Starting task: %s", task.url)
 
         # Create progress task for this specific task
         progress_task_id: Optional[TaskID] = None
@@ -443,6 +793,11 @@ class Pipeline:
 
             # Phase 1: Download
             success, downloaded_files = self._download_task(task, task_logger)
+            if not success and self._shutdown_requested:
+                # The download was most likely stopped by the shutdown;
+                # leave the task to be resumed by the next run
+                task_logger.info("Download interrupted by shutdown, leaving task for next run")
+                return False
             if not success:
                 self._mark_task_failed(task, "Download failed")
                 return False
@@ -452,16 +807,10 @@ class Pipeline:
                 self._mark_task_failed(task, "No files downloaded")
                 return False
 
-            # Phase 2: Extract
-            success, files_to_upload = self._extract_task(task, downloaded_files, task_logger)
-            if not success:
-                self._mark_task_failed(task, "Extraction failed")
-                return False
-
-            # Phase 3: Upload (pass downloaded_files to get meaningful folder name)
-            success = self._upload_task(task, files_to_upload, task_logger, downloaded_files)
-            if not success:
-                self._mark_task_failed(task, "Upload failed")
+            # Phases 2 and 3: Extract and upload
+            failure = self._extract_and_upload(task, downloaded_files, task_logger)
+            if failure is not None:
+                self._mark_task_failed(task, failure)
                 return False
 
             # Phase 4: Cleanup
@@ -469,11 +818,10 @@ class Pipeline:
                 self._cleanup_task(task, task_logger)
 
             # Mark task as complete
-            self._state_db.update_status(task.id, TaskStatus.DONE)
+            self._set_status(task.id, TaskStatus.DONE)
             task_logger.info("Task completed successfully")
 
-            with self._stats_lock:
-                self._stats.completed += 1
+            self._add_stats(completed=1)
 
             # Update overall progress
             if self._progress and self._overall_task_id is not None:
@@ -482,7 +830,7 @@ class Pipeline:
             return True
 
         except Exception as e:
-            task_logger.error(f"Unexpected error: {e}", exc_info=True)
+            task_logger.error("Unexpected error: %s", e, exc_info=True)
             self._mark_task_failed(task, str(e))
             return False
         finally:
@@ -491,9 +839,6 @@ class Pipeline:
                 self._progress.remove_task(progress_task_id)
             if task.id in self._task_progress_ids:
                 del self._task_progress_ids[task.id]
-            if task.id in self._active_futures:
-                with self._shutdown_lock:
-                    del self._active_futures[task.id]
 
     def _download_task(
         self,
@@ -509,46 +854,37 @@ class Pipeline:
         Returns:
             Tuple of (success, list of downloaded file paths).
         """
-        task_logger.info(f"Downloading from {task.host.value}")
-        self._state_db.update_status(task.id, TaskStatus.DOWNLOADING)
+        task_logger.info("Downloading from %s", task.host.value)
+        self._set_status(task.id, TaskStatus.DOWNLOADING)
 
         download_dir = self._workdir_manager.get_task_download_dir(task.id)
         downloaded_files: List[Path] = []
+        total_bytes = 0
 
         # Create progress callback
         progress_callback = self._create_progress_callback(task, "Downloading")
 
         try:
-            if task.host == HostType.PIXELDRAIN:
-                downloaded_files = self._download_pixeldrain(
-                    task, download_dir, progress_callback, task_logger
-                )
-            elif task.host == HostType.BUNKR:
-                downloaded_files = self._download_bunkr(
-                    task, download_dir, task_logger
-                )
-            elif task.host == HostType.BUZZHEAVIER:
-                downloaded_files = self._download_buzzheavier(
-                    task, download_dir, task_logger
-                )
-            else:
-                task_logger.error(f"Unsupported host type: {task.host}")
+            handler = self._download_handlers.get(task.host)
+            if handler is None:
+                task_logger.error("Unsupported host type: %s", task.host)
                 return False, []
 
+            downloaded_files, total_bytes = handler(
+                task, download_dir, progress_callback, task_logger
+            )
+
             if downloaded_files:
-                with self._stats_lock:
-                    for f in downloaded_files:
-                        if f.exists():
-                            self._stats.bytes_downloaded += f.stat().st_size
+                self._add_stats(bytes_downloaded=total_bytes)
 
-                task_logger.info(f"Downloaded {len(downloaded_files)} file(s)")
+                task_logger.info("Downloaded %d file(s)", len(downloaded_files))
                 return True, downloaded_files
             else:
                 return False, []
 
         except Exception as e:
-            task_logger.error(f"Download error: {e}")
-            self._state_db.update_status(task.id, TaskStatus.FAILED, error=str(e))
+            task_logger.error("Download error: %s", e)
+            self._set_status(task.id, TaskStatus.FAILED, error=str(e))
             return False, []
 
     def _download_pixeldrain(
@@ -557,7 +893,7 @@ class Pipeline:
         download_dir: Path,
         progress_callback: Optional[Callable],
         task_logger: TaskLogAdapter,
-    ) -> List[Path]:
+    ) -> Tuple[List[Path], int]:
         """Download from Pixeldrain.
 
         Args:
@@ -567,24 +903,24 @@ class Pipeline:
             task_logger: Logger with task context.
 
         Returns:
-            List of downloaded file paths.
+            Tuple of (downloaded file paths, total bytes downloaded).
         """
         if not self.config.pixeldrain_api_key:
             task_logger.error("Pixeldrain API key not configured")
-            return []
+            return [], 0
 
         # Extract file ID from URL
-        from ..utils.url_detect import extract_pixeldrain_id
         file_id = extract_pixeldrain_id(task.url)
         if not file_id:
-            task_logger.error(f"Could not extract Pixeldrain ID from: {task.url}")
-            return []
+            task_logger.error("Could not extract Pixeldrain ID from: %s", task.url)
+            return [], 0
 
         downloader = PixeldrainDownloader(
             api_key=self.config.pixeldrain_api_key,
             download_dir=download_dir,
             max_retries=self.config.max_retries,
             logger=self.logger,
+            session=self._http_session,
         )
 
         # Track last logged percentage for Colab mode
@@ -599,7 +935,7 @@ class Pipeline:
                 if percent >= last_logged_percent[0] + 10:
                     last_logged_percent[0] = (percent // 10) * 10
                     speed_mb = speed / (1024 * 1024) if speed > 0 else 0
-                    task_logger.info(f"Download progress: {percent}% ({speed_mb:.1f} MB/s)")
+                    task_logger.info("Download progress: %d%% (%.1f MB/s)", percent, speed_mb)
             
             if progress_callback:
                 progress_callback(downloaded, total, speed)
@@ -607,40 +943,37 @@ class Pipeline:
         result: DownloadResult = downloader.download(file_id, pd_progress_callback)
 
         if result.success and result.file_path:
-            return [result.file_path]
+            return [result.file_path], result.file_size
         else:
-            task_logger.error(f"Pixeldrain download failed: {result.error}")
-            return []
+            task_logger.error("Pixeldrain download failed: %s", result.error)
+            return [], 0
 
     def _download_bunkr(
         self,
         task: Task,
         download_dir: Path,
+        progress_callback: Optional[Callable],
         task_logger: TaskLogAdapter,
-    ) -> List[Path]:
+    ) -> Tuple[List[Path], int]:
         """Download from Bunkr.
 
         Args:
             task: The task to download.
             download_dir: Directory to save files.
+            progress_callback: Unused; progress is parsed from the
+                downloader's output instead.
             task_logger: Logger with task context.
 
         Returns:
-            List of downloaded file paths.
+            Tuple of (downloaded file paths, total bytes downloaded).
         """
-        downloader = BunkrDownloaderAdapter(
-            download_dir=download_dir,
-            max_retries=self.config.max_retries,
-            logger=self.logger,
-        )
+        downloader = self._bunkr_adapter
 
         # Verify installation
-        if not downloader.verify_installation():
+        if not self._is_adapter_installed(HostType.BUNKR, downloader):
             task_logger.error("BunkrDownloader not installed or not found")
-            return []
+            return [], 0
 
-        import re
-        
         # Track last logged percentage for Colab mode
         last_logged_percent = [0]
         
@@ -649,7 +982,7 @@ class Pipeline:
             if self._in_colab:
                 # Log all non-empty lines to show progress
                 if line.strip():
-                    task_logger.info(f"[bunkr] {line}")
+                    task_logger.info("[bunkr] %s", line)
                 # Also log percentage milestones
                 percent_match = re.search(r'(\d+(?:\.\d+)?)\s*%', line)
                 if percent_match:
@@ -657,9 +990,9 @@ class Pipeline:
                     # Log every 10% milestone
                     if percent >= last_logged_percent[0] + 10:
                         last_logged_percent[0] = (percent // 10) * 10
-                        task_logger.info(f"Download progress: {percent}%")
-            else:
-                task_logger.debug(f"[bunkr] {line}")
+                        task_logger.info("Download progress: %d%%", percent)
+            elif task_logger.isEnabledFor(logging.DEBUG):
+                task_logger.debug("[bunkr] %s", line)
             
             # Parse progress from BunkrDownloader output for rich progress
             # Common patterns: "Downloading: 50%", "50% complete", progress bars
@@ -687,49 +1020,51 @@ class Pipeline:
                             description=f"[yellow]⬇ {filename}...",
                         )
 
-        result: BunkrDownloadResult = downloader.download(task.url, output_callback)
+        result: BunkrDownloadResult = downloader.download(
+            task.url,
+            output_callback,
+            download_dir=download_dir,
+            cancel_event=self._cancel_event,
+        )
 
         if result.success:
-            return result.downloaded_files
+            return result.downloaded_files, result.total_bytes
         else:
-            task_logger.error(f"Bunkr download failed: {result.error}")
-            return []
+            task_logger.error("Bunkr download failed: %s", result.error)
+            return [], 0
 
     def _download_buzzheavier(
         self,
         task: Task,
         download_dir: Path,
+        progress_callback: Optional[Callable],
         task_logger: TaskLogAdapter,
-    ) -> List[Path]:
+    ) -> Tuple[List[Path], int]:
         """Download from BuzzHeavier.
 
         Args:
             task: The task to download.
             download_dir: Directory to save files.
+            progress_callback: Unused; progress is parsed from the
+                downloader's output instead.
             task_logger: Logger with task context.
 
         Returns:
-            List of downloaded file paths.
+            Tuple of (downloaded file paths, total bytes downloaded).
         """
-        downloader = BuzzHeavierDownloaderAdapter(
-            download_dir=download_dir,
-            logger=self.logger,
-        )
+        downloader = self._buzzheavier_adapter
 
         # Verify installation
-        if not downloader.verify_installation():
+        if not self._is_adapter_installed(HostType.BUZZHEAVIER, downloader):
             task_logger.error("BuzzHeavier downloader not installed or not found")
-            return []
+            return [], 0
 
         # Extract file ID from URL
-        from ..utils.url_detect import extract_buzzheavier_id
         file_id = extract_buzzheavier_id(task.url)
         if not file_id:
             # Fall back to using the full URL
             file_id = task.url
 
-        import re
-        
         # Track last logged percentage for Colab mode
         last_logged_percent = [0]
         
@@ -738,7 +1073,7 @@ class Pipeline:
             if self._in_colab:
                 # Log all non-empty lines to show progress
                 if line.strip():
-                    task_logger.info(f"[buzzheavier] {line}")
+                    task_logger.info("[buzzheavier] %s", line)
                 # Also log percentage milestones
                 percent_match = re.search(r'(\d+(?:\.\d+)?)\s*%', line)
                 if percent_match:
@@ -746,9 +1081,9 @@ class Pipeline:
                     # Log every 10% milestone
                     if percent >= last_logged_percent[0] + 10:
                         last_logged_percent[0] = (percent // 10) * 10
-                        task_logger.info(f"Download progress: {percent}%")
-            else:
-                task_logger.debug(f"[buzzheavier] {line}")
+                        task_logger.info("Download progress: %d%%", percent)
+            elif task_logger.isEnabledFor(logging.DEBUG):
+                task_logger.debug("[buzzheavier] %s", line)
             
             # Parse progress from BuzzHeavier output for rich progress
             if self._progress and task.id in self._task_progress_ids:
@@ -771,19 +1106,112 @@ class Pipeline:
                         description=f"[yellow]⬇ Downloading...",
                     )
 
-        result: BuzzHeavierDownloadResult = downloader.download(file_id, output_callback)
+        result: BuzzHeavierDownloadResult = downloader.download(
+            file_id,
+            output_callback,
+            download_dir=download_dir,
+            cancel_event=self._cancel_event,
+        )
 
         if result.success:
-            return result.downloaded_files
+            return result.downloaded_files, result.total_bytes
         else:
-            task_logger.error(f"BuzzHeavier download failed: {result.error}")
-            return []
+            task_logger.error("BuzzHeavier download failed: %s", result.error)
+            return [], 0
+
+    def _is_adapter_installed(
+        self,
+        host: HostType,
+        adapter: Union[BunkrDownloaderAdapter, BuzzHeavierDownloaderAdapter],
+    ) -> bool:
+        """Check a downloader adapter's installation, once per pipeline.
+
+        Args:
+            host: Host type the adapter serves (the cache key).
+            adapter: The adapter to verify.
+
+        Returns:
+            True if the adapter's bundled downloader is installed.
+        """
+        installed = self._adapter_installed.get(host)
+        if installed is None:
+            installed = adapter.verify_installation()
+            self._adapter_installed[host] = installed
+        return installed
+
+    def _extract_and_upload(
+        self,
+        task: Task,
+        downloaded_files: List[Path],
+        task_logger: TaskLogAdapter,
+    ) -> Optional[str]:
+        """Extract downloaded files and upload the results.
+
+        With several downloaded files the two phases overlap: the items of
+        each extracted archive are handed to an upload thread as one batch
+        while the next archive is being extracted.
+
+        Args:
+            task: The task being processed.
+            downloaded_files: List of downloaded files.
+            task_logger: Logger with task context.
+
+        Returns:
+            None on success, otherwise the reason the task failed.
+        """
+        if len(downloaded_files) == 1:
+            # Nothing to overlap with a single archive
+            success, files_to_upload = self._extract_task(task, downloaded_files, task_logger)
+            if not success:
+                return "Extraction failed"
+            # Pass downloaded_files to get meaningful folder name
+            if not self._upload_task(task, [files_to_upload], task_logger, downloaded_files):
+                return "Upload failed"
+            return None
+
+        upload_queue: queue.Queue[Optional[List[Path]]] = queue.Queue()
+        upload_ok = [True]
+
+        def upload_worker() -> None:
+            # Start uploading (and report UPLOADING) only once there is
+            # something to upload
+            first = upload_queue.get()
+            if first is None:
+                return
+            batches = itertools.chain([first], iter(upload_queue.get, None))
+            try:
+                upload_ok[0] = self._upload_task(task, batches, task_logger, downloaded_files)
+            except Exception as e:
+                task_logger.error("Upload error: %s", e, exc_info=True)
+                upload_ok[0] = False
+                # Drain so the extractor never blocks on a dead consumer
+                for _ in batches:
+                    pass
+
+        uploader = threading.Thread(
+            target=upload_worker, name=f"upload-{task.id[:8]}", daemon=True
+        )
+        uploader.start()
+        try:
+            success, _ = self._extract_task(
+                task, downloaded_files, task_logger, on_extracted=upload_queue.put
+            )
+        finally:
+            upload_queue.put(None)
+            uploader.join()
+
+        if not success:
+            return "Extraction failed"
+        if not upload_ok[0]:
+            return "Upload failed"
+        return None
 
     def _extract_task(
         self,
         task: Task,
         downloaded_files: List[Path],
         task_logger: TaskLogAdapter,
+        on_extracted: Optional[Callable[[List[Path]], None]] = None,
     ) -> Tuple[bool, List[Path]]:
         """Extract archives from downloaded files.
 
@@ -791,22 +1219,25 @@ class Pipeline:
             task: The task being processed.
             downloaded_files: List of downloaded files.
             task_logger: Logger with task context.
+            on_extracted: Optional callback invoked with the files/directories
+                to upload from each archive as soon as it has been extracted.
 
         Returns:
             Tuple of (success, list of files/directories to upload).
         """
-        task_logger.info(f"Extracting {len(downloaded_files)} file(s)")
-        self._state_db.update_status(task.id, TaskStatus.EXTRACTING)
+        task_logger.info("Extracting %d file(s)", len(downloaded_files))
+        self._set_status(task.id, TaskStatus.EXTRACTING)
 
         extract_dir = self._workdir_manager.get_task_extract_dir(task.id)
         files_to_upload: List[Path] = []
         all_success = True
 
-        for file_path in downloaded_files:
-            if not file_path.exists():
-                task_logger.warning(f"File not found: {file_path}")
-                continue
+        # Files that have gone missing are skipped, not failed
+        downloaded_files, missing = _split_missing(downloaded_files)
+        for file_path in missing:
+            task_logger.warning("File not found: %s", file_path)
 
+        for file_path in downloaded_files:
             # Extract (or copy non-archives)
             delete_after = not self.config.keep_temp
             result: ExtractionResult = extract_archive(
@@ -819,13 +1250,18 @@ class Pipeline:
             if result.success:
                 # Add extracted files to upload list
                 if result.extracted_files:
-                    files_to_upload.extend(result.extracted_files)
-                    task_logger.info(f"Extracted {len(result.extracted_files)} file(s) from {file_path.name}")
+                    ready = result.extracted_files
+                    task_logger.info(
+                        "Extracted %d file(s) from %s", len(result.extracted_files), file_path.name
+                    )
                 else:
                     # No extracted files but success - add the extraction directory
-                    files_to_upload.append(result.extracted_path)
+                    ready = [result.extracted_path]
+                files_to_upload.extend(ready)
+                if on_extracted is not None:
+                    on_extracted(ready)
             else:
-                task_logger.error(f"Extraction failed for {file_path.name}: {result.error}")
+                task_logger.error("Extraction failed for %s: %s", file_path.name, result.error)
                 all_success = False
 
         # If we have files to upload, consider it a success even if some failed
@@ -884,23 +1320,25 @@ class Pipeline:
     def _upload_task(
         self,
         task: Task,
-        files_to_upload: List[Path],
+        batches: Iterable[List[Path]],
         task_logger: TaskLogAdapter,
         downloaded_files: Optional[List[Path]] = None,
     ) -> bool:
         """Upload files to Google Drive.
 
+        Each batch is uploaded with a single upload_to_drive_many() call.
+
         Args:
             task: The task being processed.
-            files_to_upload: List of files/directories to upload.
+            batches: Batches of files/directories to upload. May be a lazy
+                iterable that yields a batch as each archive is extracted.
             task_logger: Logger with task context.
             downloaded_files: Original downloaded files (used to determine folder name).
 
         Returns:
             True if all uploads succeeded, False otherwise.
         """
-        task_logger.info(f"Uploading {len(files_to_upload)} item(s) to Drive")
-        self._state_db.update_status(task.id, TaskStatus.UPLOADING)
+        self._set_status(task.id, TaskStatus.UPLOADING)
 
         # Get meaningful folder name from downloaded files (name before .zip)
         # If downloaded_files not provided, try to extract from files_to_upload parent
@@ -908,11 +1346,16 @@ class Pipeline:
             folder_name = self._get_folder_name_from_files(downloaded_files, task)
         else:
             # Fallback: try to use files_to_upload to determine name
+            batches = list(batches)
+            files_to_upload = list(itertools.chain.from_iterable(batches))
             folder_name = self._get_folder_name_from_files(files_to_upload, task)
 
         # Create task-specific destination directory using meaningful name
         task_dest = self.config.drive_dest / folder_name
-        task_logger.info(f"Upload destination folder: {folder_name}")
+        # Output paths are built by string concatenation rather than a Path
+        # join per uploaded item
+        task_dest_prefix = f"{task_dest}{os.sep}"
+        task_logger.info("Upload destination folder: %s", folder_name)
 
         all_success = True
         output_paths: List[str] = []
@@ -920,32 +1363,41 @@ class Pipeline:
         # Create progress callback
         progress_callback = self._create_progress_callback(task, "Uploading")
 
-        for file_path in files_to_upload:
-            if not file_path.exists():
-                task_logger.warning(f"File not found for upload: {file_path}")
+        delete_after = not self.config.keep_temp
+        for batch in batches:
+            # Files that have gone missing are skipped, not failed
+            present, missing = _split_missing(batch)
+            for file_path in missing:
+                task_logger.warning("File not found for upload: %s", file_path)
+            if not present:
                 continue
 
-            delete_after = not self.config.keep_temp
-            result: UploadResult = upload_to_drive(
-                source=file_path,
+            results: List[UploadResult] = upload_to_drive_many(
+                present,
                 drive_dest=task_dest,
                 delete_after=delete_after,
                 progress_callback=progress_callback,
                 logger=self.logger,
             )
 
-            if result.success:
-                output_paths.append(str(result.dest_path / file_path.name))
-                with self._stats_lock:
-                    self._stats.bytes_uploaded += result.bytes_copied
-                task_logger.info(f"Uploaded: {file_path.name}")
-            else:
-                task_logger.error(f"Upload failed for {file_path.name}: {result.error}")
-                all_success = False
+            bytes_uploaded = 0
+            for file_path, result in zip(present, results):
+                if result.success:
+                    output_paths.append(task_dest_prefix + file_path.name)
+                    bytes_uploaded += result.bytes_copied
+                    task_logger.info("Uploaded: %s", file_path.name)
+                else:
+                    task_logger.error("Upload failed for %s: %s", file_path.name, result.error)
+                    all_success = False
+
+            if bytes_uploaded:
+                self._add_stats(bytes_uploaded=bytes_uploaded)
+
+        task_logger.info("Uploaded %d item(s) to Drive", len(output_paths))
 
         # Record output paths in state DB
         if output_paths:
-            self._state_db.set_output_paths(task.id, output_paths)
+            self._set_output_paths(task.id, output_paths)
 
         return all_success or bool(output_paths)
 
@@ -961,7 +1413,7 @@ class Pipeline:
             self._workdir_manager.cleanup_task(task.id)
             task_logger.debug("Cleanup complete")
         except Exception as e:
-            task_logger.warning(f"Cleanup failed: {e}")
+            task_logger.warning("Cleanup failed: %s", e)
 
     def _mark_task_failed(self, task: Task, error: str) -> None:
         """Mark a task as failed and update statistics.
@@ -970,9 +1422,8 @@ class Pipeline:
             task: The task that failed.
             error: Error message.
         """
-        self._state_db.update_status(task.id, TaskStatus.FAILED, error=error)
-        with self._stats_lock:
-            self._stats.failed += 1
+        self._set_status(task.id, TaskStatus.FAILED, error=error)
+        self._add_stats(failed=1)
 
         # Update overall progress
         if self._progress and self._overall_task_id is not None:
@@ -989,18 +1440,34 @@ class Pipeline:
             task: The task being tracked.
             operation: Description of the operation (e.g., "Downloading").
 
+        Updates are coalesced to at most one per _PROGRESS_UPDATE_INTERVAL_NS
+        (plus the final one), so callers may invoke the callback per chunk
+        without contending on the progress display's lock.
+
         Returns:
             Callback function for progress updates.
         """
+        progress = self._progress
+        progress_task_id = self._task_progress_ids.get(task.id)
+        if progress is None or progress_task_id is None:
+            return lambda bytes_done, bytes_total, speed_bps: None
+
+        description = f"[yellow]{operation} {task.id[:8]}..."
+        last_update_ns = 0
+
         def callback(bytes_done: int, bytes_total: int, speed_bps: float) -> None:
-            if self._progress and task.id in self._task_progress_ids:
-                task_id = self._task_progress_ids[task.id]
-                self._progress.update(
-                    task_id,
-                    description=f"[yellow]{operation} {task.id[:8]}...",
-                    completed=bytes_done,
-                    total=bytes_total,
-                )
+            nonlocal last_update_ns
+            now_ns = time.monotonic_ns()
+            finished = 0 < bytes_total <= bytes_done
+            if now_ns - last_update_ns < _PROGRESS_UPDATE_INTERVAL_NS and not finished:
+                return
+            last_update_ns = now_ns
+            progress.update(
+                progress_task_id,
+                description=description,
+                completed=bytes_done,
+                total=bytes_total,
+            )
 
         return callback
 
@@ -1026,14 +1493,14 @@ class Pipeline:
         signal_name = signal.Signals(signum).name
         self.logger.warning(f"Received {signal_name}, initiating graceful shutdown...")
 
-        with self._shutdown_lock:
-            self._shutdown_requested = True
+        self._cancel_event.set()
 
         # Log current state
-        self.logger.info(f"Waiting for {len(self._active_futures)} active task(s) to complete...")
+        self.logger.info(f"Waiting for {self._active_count} active task(s) to complete...")
 
         # Don't forcefully exit - let the main loop handle it
-        # The ThreadPoolExecutor will complete current tasks
+        # Running subprocess downloads watch the event and stop; other
+        # running tasks finish; queued tasks return as soon as they start
 
     def __repr__(self) -> str:
         """Return string representation of Pipeline.
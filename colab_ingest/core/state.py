@@ -9,16 +9,75 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import sys
+import threading
 import uuid
+from collections import OrderedDict
 from contextlib import contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Iterable, Iterator, Optional
 
 from ..utils.url_detect import HostType
 
+# Columns that get_all_tasks() accepts in its order_by clause
+_ORDERABLE_COLUMNS = frozenset({"created_at", "updated_at"})
+
+# Output paths live in the task_outputs child table; task queries fold them
+# back into a JSON list, in insertion order, with one correlated subquery
+_OUTPUT_PATHS_JSON = (
+    "(SELECT json_group_array(path) FROM ("
+    "SELECT path FROM task_outputs WHERE task_id = tasks.id ORDER BY rowid))"
+)
+
+# Column order Task.from_row() unpacks; every task query selects exactly these
+_TASK_COLUMNS = (
+    f"id, url, host, status, {_OUTPUT_PATHS_JSON}, error, created_at, updated_at, retries"
+)
+_SELECT_TASKS = f"SELECT {_TASK_COLUMNS} FROM tasks"
+
+# Columns stored in the tasks table itself
+_STORED_TASK_COLUMNS = "id, url, host, status, error, created_at, updated_at, retries"
+
+# Timestamps are stored as INTEGER Unix epoch milliseconds. _SQL_NOW is the
+# current time in that form, computed by SQLite so write paths don't build
+# a timestamp in Python (unixepoch('subsec') needs SQLite 3.42).
+_SQL_NOW = "CAST(ROUND((julianday('now') - 2440587.5) * 86400000) AS INTEGER)"
+
+# UPDATE/INSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Max tasks kept in StateDB's in-memory lookup cache
+_TASK_CACHE_SIZE = 1024
+
+# Max IDs bound into one IN (...) clause; older SQLite builds cap at 999
+_MAX_SQL_PARAMS = 900
+
+# Applied to every new connection. WAL lets readers (e.g. the status
+# command) proceed while the pipeline writes, and with WAL
+# synchronous=NORMAL only syncs at checkpoints rather than on every commit.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",  # task_outputs rows go with their task
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",  # ~20 MB
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA mmap_size=134217728",  # 128 MB
+)
+
+# Read-only connections can't switch the journal mode and never write rows,
+# so they skip those pragmas; query_only guards against a stray write
+_READ_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only=ON",
+    *(
+        pragma for pragma in _CONNECTION_PRAGMAS
+        if not pragma.startswith(("PRAGMA journal_mode", "PRAGMA foreign_keys"))
+    ),
+)
+
 
 class TaskStatus(Enum):
     """Enumeration of possible task states."""
@@ -31,7 +90,186 @@ class TaskStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# __slots__ shrink each Task and speed up attribute access; dataclasses only
+# generate them on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Bound once so from_row() does no global/attribute lookups per row
+_fromtimestamp = datetime.fromtimestamp
+
+try:
+    import orjson
+
+    # output_paths arrives as the JSON array built by SQLite; orjson decodes
+    # it several times faster than the standard library
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Integer codes stored in the status and host columns. Codes are part of
+# the on-disk format: never renumber them, only append.
+_STATUS_CODES: dict[TaskStatus, int] = {
+    TaskStatus.PENDING: 0,
+    TaskStatus.DOWNLOADING: 1,
+    TaskStatus.EXTRACTING: 2,
+    TaskStatus.UPLOADING: 3,
+    TaskStatus.DONE: 4,
+    TaskStatus.FAILED: 5,
+}
+_HOST_CODES: dict[HostType, int] = {
+    HostType.PIXELDRAIN: 0,
+    HostType.BUZZHEAVIER: 1,
+    HostType.BUNKR: 2,
+    HostType.UNKNOWN: 3,
+}
+# Code -> member lookups for decoding rows
+_STATUSES = tuple(sorted(_STATUS_CODES, key=_STATUS_CODES.__getitem__))
+_HOSTS = tuple(sorted(_HOST_CODES, key=_HOST_CODES.__getitem__))
+
+# Per-column decoders for StateDB.iter_task_dicts(); None passes the stored
+# value through unchanged
+_ROW_DECODERS = {
+    "id": None,
+    "url": None,
+    "host": tuple(host.value for host in _HOSTS).__getitem__,
+    "status": tuple(status.value for status in _STATUSES).__getitem__,
+    "output_paths": _json_loads,
+    "error": None,
+    "created_at": lambda ms: _fromtimestamp(ms / 1000),
+    "updated_at": lambda ms: _fromtimestamp(ms / 1000),
+    "retries": None,
+}
+
+# Shared by get_incomplete_tasks() and the partial index it reads. SQLite
+# only uses a partial index when the query repeats its WHERE terms
+# literally, so the codes are inlined rather than bound.
+_INCOMPLETE_CONDITION = (
+    f"status NOT IN ({_STATUS_CODES[TaskStatus.DONE]}, {_STATUS_CODES[TaskStatus.FAILED]})"
+)
+
+# Tasks a run picks up when retrying failures, served by the partial
+# idx_tasks_runnable index (codes inlined for the same reason as above)
+_RUNNABLE_CONDITION = (
+    f"status IN ({_STATUS_CODES[TaskStatus.PENDING]}, {_STATUS_CODES[TaskStatus.FAILED]})"
+)
+
+# One row: a count per status code (in _STATUSES order), then the total.
+# SUM over a comparison counts matches on any SQLite version (FILTER needs
+# 3.30); it is NULL for an empty table.
+_STATS_QUERY = "SELECT {}, COUNT(*) FROM tasks".format(
+    ", ".join(f"SUM(status = {_STATUS_CODES[status]})" for status in _STATUSES)
+)
+
+_CREATE_TASKS_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS tasks (
+        id TEXT PRIMARY KEY,
+        url TEXT NOT NULL UNIQUE,
+        host INTEGER NOT NULL CHECK(host BETWEEN 0 AND {len(_HOSTS) - 1}),
+        status INTEGER NOT NULL DEFAULT 0 CHECK(status BETWEEN 0 AND {len(_STATUSES) - 1}),
+        error TEXT,
+        created_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL,
+        retries INTEGER DEFAULT 0
+    )
+"""
+
+# rowid order is insertion order, which is the order paths are reported in
+_CREATE_TASK_OUTPUTS_TABLE = """
+    CREATE TABLE IF NOT EXISTS task_outputs (
+        task_id TEXT NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+        path TEXT NOT NULL,
+        PRIMARY KEY (task_id, path)
+    )
+"""
+
+
+# Statements run per task are built once here. sqlite3 keeps a per-connection
+# cache of prepared statements keyed by SQL text; passing the same string
+# object every call means each lookup hashes nothing and parses nothing.
+_SQL_TASK_BY_ID = f"{_SELECT_TASKS} WHERE id = ?"
+_SQL_TASK_BY_URL = f"{_SELECT_TASKS} WHERE url = ?"
+_SQL_TASKS_BY_STATUS = f"{_SELECT_TASKS} WHERE status = ? ORDER BY created_at"
+_SQL_INCOMPLETE_TASKS = f"{_SELECT_TASKS} WHERE {_INCOMPLETE_CONDITION} ORDER BY created_at"
+# The partial idx_tasks_runnable index matches this query and is used once
+# the tables have statistics. It is not forced with INDEXED BY, which fails
+# outright on a database that lacks the index.
+_SQL_RUNNABLE_TASKS = f"{_SELECT_TASKS} WHERE {_RUNNABLE_CONDITION} ORDER BY created_at"
+_SQL_INSERT_TASK = f"""
+    INSERT INTO tasks ({_STORED_TASK_COLUMNS})
+    VALUES (?, ?, ?, ?, NULL, {_SQL_NOW}, {_SQL_NOW}, 0)
+"""
+if _HAS_RETURNING:
+    # The no-op DO UPDATE makes RETURNING produce the existing row on
+    # conflict too, so one statement inserts or finds the task
+    _SQL_CREATE_TASK = (
+        f"{_SQL_INSERT_TASK} ON CONFLICT(url) DO UPDATE SET url = excluded.url"
+        f" RETURNING {_TASK_COLUMNS}"
+    )
+else:
+    _SQL_CREATE_TASK = _SQL_INSERT_TASK.replace("INSERT", "INSERT OR IGNORE", 1)
+_SQL_INSERT_TASKS = f"""
+    INSERT OR IGNORE INTO tasks ({_STORED_TASK_COLUMNS})
+    VALUES (?, ?, ?, ?, NULL, ?, ?, 0)
+"""
+_SQL_UPDATE_STATUS = f"UPDATE tasks SET status = ?, updated_at = {_SQL_NOW} WHERE id = ?"
+_SQL_UPDATE_STATUS_ERROR = (
+    f"UPDATE tasks SET status = ?, error = ?, updated_at = {_SQL_NOW} WHERE id = ?"
+)
+_SQL_UPDATE_STATUS_KEEP_ERROR = (
+    f"UPDATE tasks SET status = ?, error = COALESCE(?, error), updated_at = {_SQL_NOW}"
+    " WHERE id = ?"
+)
+_SQL_RESET_TASK = (
+    f"UPDATE tasks SET status = {_STATUS_CODES[TaskStatus.PENDING]}, error = NULL,"
+    f" updated_at = {_SQL_NOW} WHERE id = ?"
+)
+_SQL_TOUCH_TASK = f"UPDATE tasks SET updated_at = {_SQL_NOW} WHERE id = ?"
+_SQL_INCREMENT_RETRY = (
+    f"UPDATE tasks SET retries = retries + 1, updated_at = {_SQL_NOW} WHERE id = ?"
+)
+if _HAS_RETURNING:
+    _SQL_INCREMENT_RETRY += " RETURNING retries"
+_SQL_INSERT_OUTPUT = "INSERT OR IGNORE INTO task_outputs (task_id, path) VALUES (?, ?)"
+_SQL_DELETE_OUTPUTS = "DELETE FROM task_outputs WHERE task_id = ?"
+_SQL_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+_SQL_SELECT_NOW = f"SELECT {_SQL_NOW}"
+
+# Room for the statements above plus the chunked IN (...) variants
+_STATEMENT_CACHE_SIZE = 256
+
+
+def _listing_query(select: str, limit: Optional[int], order_by: str) -> tuple[str, tuple]:
+    """Append a validated ORDER BY and optional LIMIT to a task SELECT.
+
+    Args:
+        select: SELECT ... FROM tasks statement.
+        limit: Maximum number of rows, or None for all rows.
+        order_by: Sort clause, one of "created_at", "updated_at",
+            optionally followed by "ASC" or "DESC".
+
+    Returns:
+        Tuple of (query, params).
+
+    Raises:
+        ValueError: If order_by is not a supported sort clause.
+    """
+    parts = order_by.split()
+    if (
+        not parts
+        or len(parts) > 2
+        or parts[0] not in _ORDERABLE_COLUMNS
+        or (len(parts) == 2 and parts[1].upper() not in ("ASC", "DESC"))
+    ):
+        raise ValueError(f"Unsupported order_by: {order_by!r}")
+
+    query = f"{select} ORDER BY {' '.join(parts)}"
+    if limit is None:
+        return query, ()
+    return f"{query} LIMIT ?", (limit,)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Task:
     """Represents a download/processing task.
 
@@ -40,7 +278,7 @@ class Task:
         url: Original URL for the download.
         host: Detected host type (pixeldrain, buzzheavier, bunkr).
         status: Current task status.
-        output_paths: List of output file paths (JSON serialized in DB).
+        output_paths: List of output file paths (rows of task_outputs in DB).
         error: Error message if task failed.
         created_at: Timestamp when task was created.
         updated_at: Timestamp of last update.
@@ -61,22 +299,29 @@ class Task:
     def from_row(cls, row: sqlite3.Row) -> Task:
         """Create a Task instance from a database row.
 
+        The row is unpacked by position, so it must contain the columns
+        of _TASK_COLUMNS in that order (a sqlite3.Row or a plain tuple).
+
         Args:
             row: SQLite row with task data.
 
         Returns:
             Task instance populated from the row.
         """
+        (
+            task_id, url, host, status, output_paths,
+            error, created_at, updated_at, retries,
+        ) = row
         return cls(
-            id=row["id"],
-            url=row["url"],
-            host=HostType(row["host"]),
-            status=TaskStatus(row["status"]),
-            output_paths=json.loads(row["output_paths"]) if row["output_paths"] else [],
-            error=row["error"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-            retries=row["retries"],
+            task_id,
+            url,
+            _HOSTS[host],
+            _STATUSES[status],
+            _json_loads(output_paths) if output_paths and output_paths != "[]" else [],
+            error,
+            _fromtimestamp(created_at / 1000),
+            _fromtimestamp(updated_at / 1000),
+            retries,
         )
 
     def to_dict(self) -> dict:
@@ -107,7 +352,13 @@ class StateDB:
     - Retry counting
     - Output path tracking
 
-    The database is created automatically if it doesn't exist.
+    The database is created automatically if it doesn't exist. Each thread
+    opens one connection on first use and keeps it until close() is called.
+
+    get_task_by_id() and get_task_by_url() are served from a small LRU cache
+    shared by all threads. Every write through this instance invalidates the
+    tasks it touches; writes made by other processes are not seen until the
+    entry is evicted or invalidated.
 
     Attributes:
         db_path: Path to the SQLite database file.
@@ -120,72 +371,307 @@ class StateDB:
             db_path: Path to the SQLite database file.
         """
         self.db_path = Path(db_path)
+        self._local = threading.local()
+        # Every connection opened by any thread, so close() can reach them all
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # LRU cache of tasks by ID, plus the URL -> ID index for cached tasks.
+        # _cache_generation changes on every invalidation, so a read that
+        # raced with a write never stores its stale row.
+        self._task_cache: OrderedDict[str, Task] = OrderedDict()
+        self._task_ids_by_url: dict[str, str] = {}
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
+        # Set once the database file is known to exist; it is never removed
+        # while in use, so reads stop checking after that
+        self._db_exists = False
         self._ensure_parent_dir()
 
     def _ensure_parent_dir(self) -> None:
         """Ensure the parent directory for the database exists."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    @contextmanager
-    def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection with row factory configured.
+    def _connection(self, readonly: bool = False) -> sqlite3.Connection:
+        """Return one of this thread's connections, opening it on first use.
 
-        Yields:
+        Connections run in autocommit mode; _transaction() issues BEGIN and
+        COMMIT explicitly. Pragmas are applied once, when the connection is
+        opened.
+
+        Args:
+            readonly: Return the thread's read-only connection (opened with
+                mode=ro) instead of its read-write one.
+
+        Returns:
             Configured SQLite connection.
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        attr = "ro_conn" if readonly else "conn"
+        conn = getattr(self._local, attr, None)
+        if conn is None:
+            if readonly:
+                database, pragmas = f"{self.db_path.resolve().as_uri()}?mode=ro", _READ_CONNECTION_PRAGMAS
+            else:
+                database, pragmas = str(self.db_path), _CONNECTION_PRAGMAS
+            conn = sqlite3.connect(
+                database,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+                uri=readonly,
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in pragmas:
+                conn.execute(pragma)
+            setattr(self._local, attr, conn)
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _read_connection(self) -> sqlite3.Connection:
+        """Return the connection query-only methods should use.
+
+        That is this thread's read-only connection, except inside batch(),
+        where reads go through the batch's connection so they see its
+        uncommitted writes, and before the database file exists.
+
+        Returns:
+            Configured SQLite connection.
+        """
+        if getattr(self._local, "batch_ids", None) is not None:
+            return self._connection()
+        if not self._db_exists:
+            if not self.db_path.exists():
+                return self._connection()
+            self._db_exists = True
+        return self._connection(readonly=True)
 
     @contextmanager
     def _transaction(self) -> Generator[tuple[sqlite3.Connection, sqlite3.Cursor], None, None]:
         """Get a connection with automatic transaction management.
 
+        Inside batch() on the same thread, the batch's transaction is reused
+        and nothing is committed until the batch exits.
+
         Yields:
             Tuple of (connection, cursor) with auto-commit on success.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            try:
-                yield conn, cursor
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
+        conn = self._connection()
+        cursor = conn.cursor()
+        if getattr(self._local, "batch_ids", None) is not None:
+            yield conn, cursor
+            return
+        # IMMEDIATE takes the write lock up front, so a transaction never
+        # fails half-way through trying to upgrade a read lock
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn, cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """Group writes made by this thread into one transaction.
+
+        Every StateDB write inside the block (update_status(),
+        add_output_path(), ...) joins a single transaction that is committed
+        once on exit, or rolled back entirely if the block raises. Nested
+        batches join the outermost one.
+
+        Example:
+            with db.batch():
+                db.update_status(task.id, TaskStatus.DONE)
+                db.set_output_paths(task.id, paths)
+        """
+        if getattr(self._local, "batch_ids", None) is not None:
+            yield
+            return
+
+        batch_ids: list[str] = []
+        try:
+            with self._transaction():
+                self._local.batch_ids = batch_ids
+                try:
+                    yield
+                finally:
+                    self._local.batch_ids = None
+        finally:
+            # Rows read between a write and the commit (or rollback) may
+            # have been cached; drop everything the batch touched
+            self._cache_invalidate(batch_ids)
+
+    def close(self) -> None:
+        """Close every connection opened by this StateDB.
+
+        The database can still be used afterwards; connections are reopened
+        on demand.
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        # Drop the per-thread references so threads reconnect on next use
+        self._local = threading.local()
+
+    def _cache_lookup(self, task_id: Optional[str] = None, url: Optional[str] = None) -> Optional[Task]:
+        """Return a copy of a cached task, looked up by ID or URL.
+
+        Args:
+            task_id: ID of the task.
+            url: URL of the task, used when task_id is None.
+
+        Returns:
+            A copy of the cached Task, or None on a cache miss.
+        """
+        with self._cache_lock:
+            if task_id is None:
+                task_id = self._task_ids_by_url.get(url)
+                if task_id is None:
+                    return None
+            task = self._task_cache.get(task_id)
+            if task is None:
+                return None
+            self._task_cache.move_to_end(task_id)
+        # Callers may modify what they get back, so never hand out the cached object
+        return replace(task, output_paths=list(task.output_paths))
+
+    def _cache_store(self, task: Task, generation: int) -> None:
+        """Cache a task read from the database.
+
+        Args:
+            task: The task as read.
+            generation: Value of _cache_generation before the read. The task
+                is dropped if an invalidation happened since.
+        """
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            self._task_cache[task.id] = replace(task, output_paths=list(task.output_paths))
+            self._task_cache.move_to_end(task.id)
+            self._task_ids_by_url[task.url] = task.id
+            if len(self._task_cache) > _TASK_CACHE_SIZE:
+                _, evicted = self._task_cache.popitem(last=False)
+                self._task_ids_by_url.pop(evicted.url, None)
+
+    def _cache_invalidate(self, task_ids: Iterable[str]) -> None:
+        """Drop tasks from the cache after they were written.
+
+        Args:
+            task_ids: IDs of the modified tasks.
+        """
+        batch_ids = getattr(self._local, "batch_ids", None)
+        if batch_ids is not None:
+            task_ids = list(task_ids)
+            batch_ids.extend(task_ids)
+        with self._cache_lock:
+            self._cache_generation += 1
+            for task_id in task_ids:
+                task = self._task_cache.pop(task_id, None)
+                if task is not None:
+                    self._task_ids_by_url.pop(task.url, None)
 
     def init_db(self) -> None:
         """Initialize the database schema.
 
         Creates the tasks table if it doesn't exist. Safe to call multiple
-        times - will not affect existing data.
+        times - will not affect existing data. Databases from older versions,
+        which stored status, host or timestamps as TEXT or kept output paths
+        in a JSON column, are migrated to the current layout.
         """
         with self._transaction() as (conn, cursor):
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id TEXT PRIMARY KEY,
-                    url TEXT NOT NULL UNIQUE,
-                    host TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'pending',
-                    output_paths TEXT DEFAULT '[]',
-                    error TEXT,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    retries INTEGER DEFAULT 0
-                )
-            """)
+            cursor.execute("PRAGMA table_info(tasks)")
+            column_types = {row[1]: row[2].upper() for row in cursor.fetchall()}
+            migrate = "output_paths" in column_types or "TEXT" in (
+                column_types.get("status"),
+                column_types.get("created_at"),
+            )
+            if migrate:
+                # Indexes move with the renamed table and are dropped with it
+                cursor.execute("ALTER TABLE tasks RENAME TO tasks_legacy")
 
-            # Create indexes for common queries
+            cursor.execute(_CREATE_TASKS_TABLE)
+            cursor.execute(_CREATE_TASK_OUTPUTS_TABLE)
+
+            if migrate:
+                self._copy_legacy_tasks(cursor, column_types)
+
+            # Create indexes for common queries. (status, created_at) serves
+            # the status filters in created_at order without a sort; it
+            # replaces the older status-only index.
+            cursor.execute("DROP INDEX IF EXISTS idx_tasks_status")
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_tasks_status 
-                ON tasks(status)
+                CREATE INDEX IF NOT EXISTS idx_tasks_status_created 
+                ON tasks(status, created_at)
+            """)
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_tasks_active 
+                ON tasks(created_at) WHERE {_INCOMPLETE_CONDITION}
+            """)
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_tasks_runnable 
+                ON tasks(created_at) WHERE {_RUNNABLE_CONDITION}
             """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_tasks_url 
                 ON tasks(url)
             """)
+        self._db_exists = True
+
+    @staticmethod
+    def _copy_legacy_tasks(cursor: sqlite3.Cursor, column_types: dict[str, str]) -> None:
+        """Copy rows from the renamed legacy table into the tasks table.
+
+        TEXT statuses and hosts are mapped to their codes (unrecognized
+        values become PENDING and UNKNOWN). TEXT timestamps, which were
+        local-time ISO-8601, are converted to epoch milliseconds. JSON
+        output_paths lists are expanded into task_outputs rows. The legacy
+        table is dropped afterwards.
+
+        Args:
+            cursor: Cursor inside the migration transaction.
+            column_types: Declared type of each legacy column.
+        """
+        params: list = []
+
+        host_expr = "host"
+        if column_types.get("host") == "TEXT":
+            host_expr = f"CASE host {' '.join('WHEN ? THEN ?' for _ in _HOST_CODES)} ELSE ? END"
+            for host, code in _HOST_CODES.items():
+                params += [host.value, code]
+            params.append(_HOST_CODES[HostType.UNKNOWN])
+
+        status_expr = "status"
+        if column_types.get("status") == "TEXT":
+            status_expr = f"CASE status {' '.join('WHEN ? THEN ?' for _ in _STATUS_CODES)} ELSE ? END"
+            for status, code in _STATUS_CODES.items():
+                params += [status.value, code]
+            params.append(_STATUS_CODES[TaskStatus.PENDING])
+
+        def timestamp_expr(column: str) -> str:
+            if column_types.get(column) != "TEXT":
+                return column
+            # 'utc' treats the stored value as local time
+            return f"CAST(ROUND((julianday({column}, 'utc') - 2440587.5) * 86400000) AS INTEGER)"
+
+        cursor.execute(
+            f"""
+            INSERT INTO tasks ({_STORED_TASK_COLUMNS})
+            SELECT id, url, {host_expr}, {status_expr}, error,
+                {timestamp_expr("created_at")}, {timestamp_expr("updated_at")}, retries
+            FROM tasks_legacy
+            """,
+            params,
+        )
+        if "output_paths" in column_types:
+            cursor.execute("""
+                INSERT OR IGNORE INTO task_outputs (task_id, path)
+                SELECT legacy.id, paths.value
+                FROM tasks_legacy AS legacy,
+                    json_each(COALESCE(legacy.output_paths, '[]')) AS paths
+                ORDER BY legacy.rowid, paths.key
+            """)
+        cursor.execute("DROP TABLE tasks_legacy")
 
     def get_task_by_url(self, url: str) -> Optional[Task]:
         """Retrieve a task by its URL.
@@ -196,11 +682,49 @@ class StateDB:
         Returns:
             Task instance if found, None otherwise.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM tasks WHERE url = ?", (url,))
-            row = cursor.fetchone()
-            return Task.from_row(row) if row else None
+        cached = self._cache_lookup(url=url)
+        if cached is not None:
+            return cached
+
+        generation = self._cache_generation
+        cursor = self._read_connection().cursor()
+        cursor.execute(_SQL_TASK_BY_URL, (url,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        task = Task.from_row(row)
+        self._cache_store(task, generation)
+        return task
+
+    def get_tasks_by_urls(self, urls: Iterable[str]) -> dict[str, Task]:
+        """Retrieve the tasks for several URLs at once.
+
+        Args:
+            urls: URLs to look up. Duplicates are ignored.
+
+        Returns:
+            Dictionary mapping each URL that has a task to that Task.
+            URLs without a task are absent.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        tasks: dict[str, Task] = {}
+        if not unique_urls:
+            return tasks
+
+        cursor = self._read_connection().cursor()
+        # Chunk to stay under SQLite's bound-parameter limit
+        for start in range(0, len(unique_urls), _MAX_SQL_PARAMS):
+            chunk = unique_urls[start:start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"{_SELECT_TASKS} WHERE url IN ({placeholders})",
+                chunk,
+            )
+            for row in cursor.fetchall():
+                task = Task.from_row(row)
+                tasks[task.url] = task
+
+        return tasks
 
     def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """Retrieve a task by its ID.
@@ -211,11 +735,50 @@ class StateDB:
         Returns:
             Task instance if found, None otherwise.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-            row = cursor.fetchone()
-            return Task.from_row(row) if row else None
+        cached = self._cache_lookup(task_id)
+        if cached is not None:
+            return cached
+
+        generation = self._cache_generation
+        cursor = self._read_connection().cursor()
+        cursor.execute(_SQL_TASK_BY_ID, (task_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        task = Task.from_row(row)
+        self._cache_store(task, generation)
+        return task
+
+    def _iter_tasks(self, query: str, params: Iterable = ()) -> Iterator[Task]:
+        """Run a task query and decode rows as the cursor produces them.
+
+        Args:
+            query: SELECT statement returning _TASK_COLUMNS.
+            params: Query parameters.
+
+        Yields:
+            Task instances in query order.
+        """
+        cursor = self._read_connection().execute(query, tuple(params))
+        try:
+            for row in cursor:
+                yield Task.from_row(row)
+        finally:
+            cursor.close()
+
+    def iter_tasks_by_status(self, status: TaskStatus) -> Iterator[Task]:
+        """Stream tasks with a specific status, oldest first.
+
+        Rows are decoded one at a time, so memory stays flat however many
+        tasks match.
+
+        Args:
+            status: The status to filter by.
+
+        Yields:
+            Matching Task instances.
+        """
+        return self._iter_tasks(_SQL_TASKS_BY_STATUS, (_STATUS_CODES[status],))
 
     def get_tasks_by_status(self, status: TaskStatus) -> list[Task]:
         """Retrieve all tasks with a specific status.
@@ -226,13 +789,7 @@ class StateDB:
         Returns:
             List of matching Task instances.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM tasks WHERE status = ? ORDER BY created_at",
-                (status.value,)
-            )
-            return [Task.from_row(row) for row in cursor.fetchall()]
+        return list(self.iter_tasks_by_status(status))
 
     def create_task(self, url: str, host: HostType) -> Task:
         """Create a new task for a URL.
@@ -246,45 +803,90 @@ class StateDB:
         Returns:
             The created or existing Task instance.
         """
-        # Check for existing task first
-        existing = self.get_task_by_url(url)
-        if existing:
-            return existing
-
-        now = datetime.now()
-        task = Task(
-            id=str(uuid.uuid4()),
-            url=url,
-            host=host,
-            status=TaskStatus.PENDING,
-            output_paths=[],
-            error=None,
-            created_at=now,
-            updated_at=now,
-            retries=0,
+        cached = self._cache_lookup(url=url)
+        if cached is not None:
+            return cached
+
+        params = (
+            str(uuid.uuid4()), url, _HOST_CODES[host], _STATUS_CODES[TaskStatus.PENDING],
         )
 
+        generation = self._cache_generation
         with self._transaction() as (conn, cursor):
-            cursor.execute(
-                """
-                INSERT INTO tasks (id, url, host, status, output_paths, error, created_at, updated_at, retries)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    task.id,
-                    task.url,
-                    task.host.value,
-                    task.status.value,
-                    json.dumps(task.output_paths),
-                    task.error,
-                    task.created_at.isoformat(),
-                    task.updated_at.isoformat(),
-                    task.retries,
-                ),
-            )
+            cursor.execute(_SQL_CREATE_TASK, params)
+            if not _HAS_RETURNING:
+                cursor.execute(_SQL_TASK_BY_URL, (url,))
+            task = Task.from_row(cursor.fetchone())
 
+        self._cache_store(task, generation)
         return task
 
+    def create_tasks(self, items: Iterable[tuple[str, HostType]]) -> list[Task]:
+        """Create tasks for several URLs in a single transaction.
+
+        Like create_task(), URLs that already have a task keep it. If a URL
+        appears more than once, its first host type is used.
+
+        Args:
+            items: (url, host) pairs to create tasks for.
+
+        Returns:
+            The created or existing Task for each distinct URL, in the
+            order the URLs were first given.
+        """
+        hosts: dict[str, HostType] = {}
+        for url, host in items:
+            hosts.setdefault(url, host)
+        urls = list(hosts)
+        if not urls:
+            return []
+
+        tasks: dict[str, Task] = {}
+
+        with self._transaction() as (conn, cursor):
+            # One SQLite timestamp for the whole batch
+            cursor.execute(_SQL_SELECT_NOW)
+            now_ms = cursor.fetchone()[0]
+            now = _fromtimestamp(now_ms / 1000)
+
+            # Chunk to stay under SQLite's bound-parameter limit
+            for start in range(0, len(urls), _MAX_SQL_PARAMS):
+                chunk = urls[start:start + _MAX_SQL_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"{_SELECT_TASKS} WHERE url IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    task = Task.from_row(row)
+                    tasks[task.url] = task
+
+            # The transaction holds the write lock, so nothing else can
+            # insert these URLs between the SELECT and the INSERT
+            new_tasks = [
+                Task(
+                    id=str(uuid.uuid4()),
+                    url=url,
+                    host=hosts[url],
+                    status=TaskStatus.PENDING,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for url in urls
+                if url not in tasks
+            ]
+            cursor.executemany(
+                _SQL_INSERT_TASKS,
+                [
+                    (task.id, task.url, _HOST_CODES[task.host], _STATUS_CODES[task.status], now_ms, now_ms)
+                    for task in new_tasks
+                ],
+            )
+
+        for task in new_tasks:
+            tasks[task.url] = task
+        return [tasks[url] for url in urls]
+
     def update_status(
         self,
         task_id: str,
@@ -301,34 +903,55 @@ class StateDB:
         Raises:
             ValueError: If task_id doesn't exist.
         """
-        now = datetime.now().isoformat()
-
         with self._transaction() as (conn, cursor):
             if error is not None:
                 cursor.execute(
-                    """
-                    UPDATE tasks 
-                    SET status = ?, error = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (status.value, error, now, task_id),
+                    _SQL_UPDATE_STATUS_ERROR,
+                    (_STATUS_CODES[status], error, task_id),
                 )
             else:
-                cursor.execute(
-                    """
-                    UPDATE tasks 
-                    SET status = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (status.value, now, task_id),
-                )
+                cursor.execute(_SQL_UPDATE_STATUS, (_STATUS_CODES[status], task_id))
 
             if cursor.rowcount == 0:
                 raise ValueError(f"Task not found: {task_id}")
 
+        self._cache_invalidate((task_id,))
+
+    def update_statuses(
+        self,
+        updates: Iterable[tuple[str, TaskStatus, Optional[str]]],
+    ) -> int:
+        """Apply several status updates in a single transaction.
+
+        Updates are applied in order, so a later update for the same task
+        wins. As with update_status(), a None error leaves the stored error
+        untouched. Unknown IDs are ignored.
+
+        Args:
+            updates: (task_id, status, error) tuples.
+
+        Returns:
+            Number of rows updated.
+        """
+        params = [
+            (_STATUS_CODES[status], error, task_id)
+            for task_id, status, error in updates
+        ]
+        if not params:
+            return 0
+
+        with self._transaction() as (conn, cursor):
+            cursor.executemany(_SQL_UPDATE_STATUS_KEEP_ERROR, params)
+            updated = cursor.rowcount
+
+        self._cache_invalidate(task_id for _, _, task_id in params)
+        return updated
+
     def add_output_path(self, task_id: str, path: str) -> None:
         """Add an output path to a task's output_paths list.
 
+        Paths already recorded for the task are ignored.
+
         Args:
             task_id: The task ID to update.
             path: The output path to add.
@@ -336,54 +959,44 @@ class StateDB:
         Raises:
             ValueError: If task_id doesn't exist.
         """
-        task = self.get_task_by_id(task_id)
-        if not task:
-            raise ValueError(f"Task not found: {task_id}")
-
-        output_paths = task.output_paths.copy()
-        if path not in output_paths:
-            output_paths.append(path)
+        with self._transaction() as (conn, cursor):
+            cursor.execute(_SQL_TOUCH_TASK, (task_id,))
+            if cursor.rowcount == 0:
+                raise ValueError(f"Task not found: {task_id}")
 
-        now = datetime.now().isoformat()
+            cursor.execute(_SQL_INSERT_OUTPUT, (task_id, path))
 
-        with self._transaction() as (conn, cursor):
-            cursor.execute(
-                """
-                UPDATE tasks 
-                SET output_paths = ?, updated_at = ?
-                WHERE id = ?
-                """,
-                (json.dumps(output_paths), now, task_id),
-            )
+        self._cache_invalidate((task_id,))
 
     def set_output_paths(self, task_id: str, paths: list[str]) -> None:
         """Set the complete list of output paths for a task.
 
         Args:
             task_id: The task ID to update.
-            paths: List of output paths.
+            paths: List of output paths. Duplicates are stored once.
 
         Raises:
             ValueError: If task_id doesn't exist.
         """
-        now = datetime.now().isoformat()
-
         with self._transaction() as (conn, cursor):
-            cursor.execute(
-                """
-                UPDATE tasks 
-                SET output_paths = ?, updated_at = ?
-                WHERE id = ?
-                """,
-                (json.dumps(paths), now, task_id),
-            )
-
+            cursor.execute(_SQL_TOUCH_TASK, (task_id,))
             if cursor.rowcount == 0:
                 raise ValueError(f"Task not found: {task_id}")
 
+            cursor.execute(_SQL_DELETE_OUTPUTS, (task_id,))
+            cursor.executemany(
+                _SQL_INSERT_OUTPUT,
+                [(task_id, path) for path in paths],
+            )
+
+        self._cache_invalidate((task_id,))
+
     def increment_retry(self, task_id: str) -> int:
         """Increment the retry counter for a task.
 
+        The counter is incremented in SQL, so concurrent callers can't
+        lose an increment.
+
         Args:
             task_id: The task ID to update.
 
@@ -393,35 +1006,118 @@ class StateDB:
         Raises:
             ValueError: If task_id doesn't exist.
         """
-        task = self.get_task_by_id(task_id)
-        if not task:
-            raise ValueError(f"Task not found: {task_id}")
+        with self._transaction() as (conn, cursor):
+            cursor.execute(_SQL_INCREMENT_RETRY, (task_id,))
+            if not _HAS_RETURNING:
+                cursor.execute("SELECT retries FROM tasks WHERE id = ?", (task_id,))
+            row = cursor.fetchone()
 
-        new_count = task.retries + 1
-        now = datetime.now().isoformat()
+            if row is None:
+                raise ValueError(f"Task not found: {task_id}")
 
-        with self._transaction() as (conn, cursor):
-            cursor.execute(
-                """
-                UPDATE tasks 
-                SET retries = ?, updated_at = ?
-                WHERE id = ?
-                """,
-                (new_count, now, task_id),
-            )
+        self._cache_invalidate((task_id,))
+        return row[0]
+
+    def iter_all_tasks(
+        self,
+        limit: Optional[int] = None,
+        order_by: str = "created_at",
+    ) -> Iterator[Task]:
+        """Stream tasks from the database without building a list.
+
+        Args:
+            limit: Maximum number of tasks to yield. None yields all tasks.
+            order_by: Sort clause, one of "created_at", "updated_at",
+                optionally followed by "ASC" or "DESC".
+
+        Yields:
+            Task instances in the requested order (creation time by default).
 
-        return new_count
+        Raises:
+            ValueError: If order_by is not a supported sort clause.
+        """
+        query, params = _listing_query(_SELECT_TASKS, limit, order_by)
+        return self._iter_tasks(query, params)
+
+    def iter_task_dicts(
+        self,
+        columns: tuple[str, ...] = ("id", "url", "status"),
+        limit: Optional[int] = None,
+        order_by: str = "created_at",
+    ) -> Iterator[dict]:
+        """Stream selected task columns as plain dictionaries.
 
-    def get_all_tasks(self) -> list[Task]:
+        For listings that only need a few fields: no Task objects are built
+        and output paths are only gathered when asked for. Values match
+        Task.to_dict(), except timestamps, which are datetimes.
+
+        Args:
+            columns: Fields to include, any of the Task attribute names.
+            limit: Maximum number of rows to yield. None yields all rows.
+            order_by: Sort clause, as for iter_all_tasks().
+
+        Yields:
+            One dictionary per task, keyed by the requested column names.
+
+        Raises:
+            ValueError: If a column or order_by is not supported.
+        """
+        unknown = [column for column in columns if column not in _ROW_DECODERS]
+        if unknown:
+            raise ValueError(f"Unsupported columns: {', '.join(unknown)}")
+
+        select = ", ".join(
+            _OUTPUT_PATHS_JSON if column == "output_paths" else column
+            for column in columns
+        )
+        query, params = _listing_query(f"SELECT {select} FROM tasks", limit, order_by)
+        return self._iter_dicts(query, params, columns)
+
+    def _iter_dicts(
+        self, query: str, params: tuple, columns: tuple[str, ...]
+    ) -> Iterator[dict]:
+        """Run a query and yield each raw row as a decoded dictionary.
+
+        Args:
+            query: SELECT statement returning the given columns in order.
+            params: Query parameters.
+            columns: Column names, used as keys and to pick decoders.
+
+        Yields:
+            One dictionary per row.
+        """
+        decoders = [_ROW_DECODERS[column] for column in columns]
+        cursor = self._read_connection().cursor()
+        # Plain tuples; sqlite3.Row objects would only be unpacked again
+        cursor.row_factory = None
+        try:
+            for row in cursor.execute(query, params):
+                yield {
+                    column: decode(value) if decode is not None and value is not None else value
+                    for column, decode, value in zip(columns, decoders, row)
+                }
+        finally:
+            cursor.close()
+
+    def get_all_tasks(
+        self,
+        limit: Optional[int] = None,
+        order_by: str = "created_at",
+    ) -> list[Task]:
         """Retrieve all tasks from the database.
 
+        Args:
+            limit: Maximum number of tasks to return. None returns all tasks.
+            order_by: Sort clause, one of "created_at", "updated_at",
+                optionally followed by "ASC" or "DESC".
+
         Returns:
-            List of all Task instances, ordered by creation time.
+            List of Task instances in the requested order (creation time by default).
+
+        Raises:
+            ValueError: If order_by is not a supported sort clause.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM tasks ORDER BY created_at")
-            return [Task.from_row(row) for row in cursor.fetchall()]
+        return list(self.iter_all_tasks(limit, order_by))
 
     def get_pending_and_failed_tasks(self, retry_failed: bool = False) -> list[Task]:
         """Get tasks that need processing.
@@ -432,19 +1128,9 @@ class StateDB:
         Returns:
             List of Task instances that need processing.
         """
-        statuses = [TaskStatus.PENDING.value]
         if retry_failed:
-            statuses.append(TaskStatus.FAILED.value)
-
-        placeholders = ",".join("?" * len(statuses))
-
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                f"SELECT * FROM tasks WHERE status IN ({placeholders}) ORDER BY created_at",
-                statuses,
-            )
-            return [Task.from_row(row) for row in cursor.fetchall()]
+            return list(self._iter_tasks(_SQL_RUNNABLE_TASKS))
+        return self.get_tasks_by_status(TaskStatus.PENDING)
 
     def get_incomplete_tasks(self) -> list[Task]:
         """Get all tasks that are not yet complete (not DONE or FAILED).
@@ -452,16 +1138,7 @@ class StateDB:
         Returns:
             List of incomplete Task instances.
         """
-        complete_statuses = [TaskStatus.DONE.value, TaskStatus.FAILED.value]
-        placeholders = ",".join("?" * len(complete_statuses))
-
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                f"SELECT * FROM tasks WHERE status NOT IN ({placeholders}) ORDER BY created_at",
-                complete_statuses,
-            )
-            return [Task.from_row(row) for row in cursor.fetchall()]
+        return list(self._iter_tasks(_SQL_INCOMPLETE_TASKS))
 
     def reset_task(self, task_id: str) -> None:
         """Reset a task to PENDING status for re-processing.
@@ -474,21 +1151,50 @@ class StateDB:
         Raises:
             ValueError: If task_id doesn't exist.
         """
-        now = datetime.now().isoformat()
-
         with self._transaction() as (conn, cursor):
-            cursor.execute(
-                """
-                UPDATE tasks 
-                SET status = ?, error = NULL, updated_at = ?
-                WHERE id = ?
-                """,
-                (TaskStatus.PENDING.value, now, task_id),
-            )
+            cursor.execute(_SQL_RESET_TASK, (task_id,))
 
             if cursor.rowcount == 0:
                 raise ValueError(f"Task not found: {task_id}")
 
+        self._cache_invalidate((task_id,))
+
+    def reset_tasks(self, task_ids: Iterable[str]) -> int:
+        """Reset several tasks to PENDING status in a single transaction.
+
+        Like reset_task(), clears the error message but preserves retry count.
+        Unknown IDs are ignored.
+
+        Args:
+            task_ids: IDs of the tasks to reset.
+
+        Returns:
+            Number of tasks that were reset.
+        """
+        ids = list(task_ids)
+        if not ids:
+            return 0
+
+        reset_count = 0
+
+        with self._transaction() as (conn, cursor):
+            # Chunk to stay under SQLite's bound-parameter limit
+            for start in range(0, len(ids), _MAX_SQL_PARAMS):
+                chunk = ids[start:start + _MAX_SQL_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    UPDATE tasks 
+                    SET status = ?, error = NULL, updated_at = {_SQL_NOW}
+                    WHERE id IN ({placeholders})
+                    """,
+                    (_STATUS_CODES[TaskStatus.PENDING], *chunk),
+                )
+                reset_count += cursor.rowcount
+
+        self._cache_invalidate(ids)
+        return reset_count
+
     def delete_task(self, task_id: str) -> bool:
         """Delete a task from the database.
 
@@ -499,28 +1205,30 @@ class StateDB:
             True if task was deleted, False if not found.
         """
         with self._transaction() as (conn, cursor):
-            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-            return cursor.rowcount > 0
+            cursor.execute(_SQL_DELETE_TASK, (task_id,))
+            deleted = cursor.rowcount > 0
+
+        self._cache_invalidate((task_id,))
+        return deleted
 
     def get_stats(self) -> dict[str, int]:
         """Get task statistics by status.
 
+        All counts, including zeros and the total, come from one pass over
+        the table.
+
         Returns:
-            Dictionary mapping status names to counts.
+            Dictionary mapping status names to counts, plus "total".
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT status, COUNT(*) as count FROM tasks GROUP BY status"
-            )
-            stats = {row["status"]: row["count"] for row in cursor.fetchall()}
-
-        # Ensure all statuses are represented
-        for status in TaskStatus:
-            if status.value not in stats:
-                stats[status.value] = 0
+        cursor = self._read_connection().cursor()
+        cursor.execute(_STATS_QUERY)
+        counts = cursor.fetchone()
 
-        stats["total"] = sum(stats.values())
+        stats = {
+            status.value: count or 0
+            for status, count in zip(_STATUSES, counts)
+        }
+        stats["total"] = counts[-1]
         return stats
 
     def __repr__(self) -> str:
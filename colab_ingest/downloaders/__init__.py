@@ -23,6 +23,7 @@ from colab_ingest.downloaders.bunkr_adapter import (
     BunkrDownloaderError,
     BunkrScriptNotFoundError,
     BunkrDownloadTimeoutError,
+    BunkrDownloadCancelledError,
 )
 from colab_ingest.downloaders.buzzheavier_adapter import (
     BuzzHeavierDownloaderAdapter,
@@ -46,6 +47,7 @@ __all__ = [
     "BunkrDownloaderError",
     "BunkrScriptNotFoundError",
     "BunkrDownloadTimeoutError",
+    "BunkrDownloadCancelledError",
     # BuzzHeavier
     "BuzzHeavierDownloaderAdapter",
     "BuzzHeavierDownloadResult",
@@ -6,17 +6,26 @@ from Bunkr using the bundled BunkrDownloader tool via subprocess calls.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
+import random
+import re
+import selectors
 import signal
 import subprocess
 import sys
+import tempfile
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List, Optional, Set, Tuple
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, NoReturn, Optional, Sequence, Set, Tuple
 
+from colab_ingest.downloaders.bunkr_worker import RESULT_MARKER
 from colab_ingest.utils.logging import get_logger
 
 
@@ -24,6 +33,150 @@ from colab_ingest.utils.logging import get_logger
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_TIMEOUT_SECONDS = 30 * 60  # 30 minutes per URL
 
+INITIAL_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+
+# Default concurrency for download_many()
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 4)
+
+# Script run by the processes of a BunkrWorkerPool
+_WORKER_SCRIPT = Path(__file__).with_name("bunkr_worker.py")
+
+# How often a cancellable download checks its cancel event while waiting
+_CANCEL_POLL_SECONDS = 0.05
+
+# How often download() looks for finished files while an on_file callback
+# is waiting for them
+_FILE_POLL_SECONDS = 2.0
+
+# Suffix BunkrDownloader gives a file until it is completely downloaded
+_PARTIAL_SUFFIX = ".temp"
+
+# Bytes read from the downloader's output pipe per os.read() call
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Output lines kept for the error message of a failed download
+_OUTPUT_TAIL_LINES = 50
+# Number of trailing output lines quoted in a failure message.
+_ERROR_CONTEXT_LINES = 5
+
+# Line breaks as universal-newlines text mode would see them
+_LINE_BREAK = re.compile(rb"\r\n|\r|\n")
+
+# Patterns that classify the output of a failed run. BunkrDownloader exits
+# with 1 for permanent problems (bad URL, no disk space) as well as network
+# ones, so the exit code alone doesn't say whether a retry can help.
+_NOT_FOUND_RE = re.compile(r"\b404\b|\bnot found\b", re.IGNORECASE)
+_RATE_LIMIT_RE = re.compile(
+    r"\b429\b|rate.?limit|too many requests|slow down", re.IGNORECASE
+)
+_NETWORK_ERROR_RE = re.compile(
+    r"ConnectionError|Connection (?:reset|aborted|refused)|RemoteDisconnected|ECONNRESET"
+    r"|Max retries exceeded|timed out|Timeout|Temporary failure in name resolution"
+    r"|Name or service not known|\b50[0234]\b",
+    re.IGNORECASE,
+)
+
+
+def _decode_output(lines: Iterable[bytes]) -> str:
+    """Join raw output lines into text.
+
+    Args:
+        lines: Undecoded output lines.
+
+    Returns:
+        The lines decoded as UTF-8 (invalid bytes replaced), joined by newlines.
+    """
+    return b"\n".join(lines).decode("utf-8", "replace")
+
+
+def _last_output_lines(lines: Sequence[bytes], count: int) -> List[str]:
+    """Return the last lines of retained output for an error message.
+
+    Trailing blank lines are skipped, so the result ends with the last line
+    that has content.
+
+    Args:
+        lines: Undecoded output lines, oldest first.
+        count: Maximum number of lines to return.
+
+    Returns:
+        Up to count decoded lines, oldest first.
+    """
+    last: List[bytes] = []
+    for line in reversed(lines):
+        if not last and not line.strip():
+            continue
+        last.append(line)
+        if len(last) == count:
+            break
+    last.reverse()
+    return _decode_output(last).split("\n")
+
+
+def _split_lines(data: bytes) -> Tuple[List[bytes], bytes]:
+    """Split the complete lines off buffered output.
+
+    Args:
+        data: Output read so far and not yet split.
+
+    Returns:
+        Tuple of (complete lines, remainder to keep for the next read).
+    """
+    # A trailing \r may be the first half of \r\n; keep it for the next read
+    split_at = len(data) - 1 if data.endswith(b"\r") else len(data)
+    *lines, rest = _LINE_BREAK.split(data[:split_at])
+    return lines, rest + data[split_at:]
+
+
+def _open_pidfd(pid: int) -> Optional[int]:
+    """Open a file descriptor that becomes readable when a process exits.
+
+    Args:
+        pid: Process ID of a child that has not been reaped yet.
+
+    Returns:
+        The pidfd, or None where pidfds are unavailable (not Linux 5.3+).
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _iter_files(root: Path) -> Iterator[os.DirEntry]:
+    """Yield the regular files under root, recursively.
+
+    Walks with os.scandir and an explicit stack, so entry types come from
+    the directory listing without a stat, and no Path objects are built.
+    Symlinks are neither followed nor reported. Unreadable directories are
+    skipped.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        os.DirEntry for each regular file, with an absolute path.
+    """
+    stack = [os.path.abspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+                except OSError:
+                    continue
+
 
 @dataclass
 class BunkrDownloadResult:
@@ -35,6 +188,7 @@ class BunkrDownloadResult:
         url: The Bunkr URL that was downloaded.
         error: Error message if download failed (None if successful).
         output_dir: Directory where files were downloaded.
+        total_bytes: Combined size in bytes of downloaded_files.
     """
 
     success: bool
@@ -42,6 +196,7 @@ class BunkrDownloadResult:
     url: str
     error: Optional[str]
     output_dir: Path
+    total_bytes: int = 0
 
 
 class BunkrDownloaderError(Exception):
@@ -62,11 +217,135 @@ class BunkrDownloadTimeoutError(BunkrDownloaderError):
     pass
 
 
+class BunkrDownloadCancelledError(BunkrDownloaderError):
+    """Raised when a download is cancelled through its cancel event."""
+
+    pass
+
+
+class BunkrWorkerPool:
+    """Pool of long-lived BunkrDownloader worker processes.
+
+    Each worker runs bunkr_worker.py, which imports the downloader once and
+    then serves one download per request, so interpreter start-up and
+    imports are paid per worker rather than per URL. Workers are started on
+    demand, at most size at a time. A worker that exits or is terminated
+    (timeout, cancellation) is replaced by a fresh one when next needed.
+
+    Attributes:
+        size: Maximum number of worker processes.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        third_party_path: Path,
+        env: Dict[str, str],
+    ) -> None:
+        """Initialize the pool; no worker is started yet.
+
+        Args:
+            size: Maximum number of worker processes.
+            third_party_path: Path to the BunkrDownloader directory.
+            env: Environment for worker processes.
+        """
+        self.size = size
+        self.env = env
+        self._command = [sys.executable, str(_WORKER_SCRIPT), str(third_party_path)]
+        self._cwd = str(third_party_path)
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: List[subprocess.Popen] = []
+        self._closed = False
+
+    def _start_worker(self) -> subprocess.Popen:
+        """Start a worker process.
+
+        Returns:
+            The worker, with binary stdin and (stderr merged) stdout pipes.
+        """
+        return subprocess.Popen(
+            self._command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+            cwd=self._cwd,
+            env=self.env,
+        )
+
+    def acquire(self) -> subprocess.Popen:
+        """Take an idle worker, starting one if none is idle.
+
+        Blocks while size workers are in use. Every acquire() must be
+        followed by a release() of the returned worker.
+
+        Returns:
+            A running worker process.
+        """
+        self._slots.acquire()
+        try:
+            while True:
+                with self._lock:
+                    process = self._idle.pop() if self._idle else None
+                if process is None:
+                    return self._start_worker()
+                if process.poll() is None:
+                    return process
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, process: subprocess.Popen) -> None:
+        """Return a worker taken with acquire().
+
+        Workers that have exited are dropped; after close() returned
+        workers are stopped.
+
+        Args:
+            process: The worker to return.
+        """
+        try:
+            if process.poll() is None:
+                with self._lock:
+                    if not self._closed:
+                        self._idle.append(process)
+                        return
+                self._stop_worker(process)
+        finally:
+            self._slots.release()
+
+    def _stop_worker(self, process: subprocess.Popen) -> None:
+        """Stop a worker by closing its stdin, killing it if that fails.
+
+        Args:
+            process: The worker to stop.
+        """
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+            process.wait(timeout=5.0)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+    def close(self) -> None:
+        """Stop all idle workers; workers in use stop when released."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for process in idle:
+            self._stop_worker(process)
+
+
 class BunkrDownloaderAdapter:
     """Adapter for the bundled BunkrDownloader module.
 
     Wraps the BunkrDownloader tool using subprocess calls for downloading
-    files from Bunkr URLs (both album /a/ and file /f/ URLs).
+    files from Bunkr URLs (both album /a/ and file /f/ URLs). By default
+    each download runs in a fresh process; with worker_pool_size set,
+    downloads run in reused worker processes instead (see BunkrWorkerPool),
+    and close() should be called when the adapter is no longer needed.
 
     Attributes:
         download_dir: Directory to save downloaded files.
@@ -82,6 +361,7 @@ class BunkrDownloaderAdapter:
         third_party_path: Optional[Path] = None,
         timeout: int = DEFAULT_TIMEOUT_SECONDS,
         logger: Optional[logging.Logger] = None,
+        worker_pool_size: int = 0,
     ) -> None:
         """Initialize the Bunkr downloader adapter.
 
@@ -92,6 +372,9 @@ class BunkrDownloaderAdapter:
                 If None, uses the bundled module in the same directory.
             timeout: Timeout in seconds for each download (default 30 minutes).
             logger: Optional logger instance. If None, uses default logger.
+            worker_pool_size: Number of long-lived downloader processes to
+                reuse across downloads. 0 (the default) starts a fresh
+                process for every download.
         """
         self.download_dir = Path(download_dir)
         self.max_retries = max_retries
@@ -104,14 +387,49 @@ class BunkrDownloaderAdapter:
         else:
             self.third_party_path = Path(third_party_path)
 
+        # Set by the first successful _find_downloader_script() lookup,
+        # together with the command line prefix that runs the script
+        self._script_path: Optional[Path] = None
+        self._command_prefix: List[str] = []
+        # Working directory of downloader processes, as Popen takes it
+        self._cwd = str(self.third_party_path)
+        # Result of the last verify_installation() check
+        self._verified: Optional[bool] = None
+
+        # Environment for downloader processes, built once rather than per run
+        self._worker_pool: Optional[BunkrWorkerPool] = None
+        self.refresh_env()
+        if worker_pool_size > 0:
+            self._worker_pool = BunkrWorkerPool(
+                worker_pool_size, self.third_party_path, self._child_env
+            )
+
         # Ensure download directory exists
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
         self._logger.debug(
-            f"BunkrDownloaderAdapter initialized with download_dir: {download_dir}, "
-            f"third_party_path: {self.third_party_path}"
+            "BunkrDownloaderAdapter initialized with download_dir: %s, "
+            "third_party_path: %s",
+            download_dir,
+            self.third_party_path,
         )
 
+    def refresh_env(self) -> None:
+        """Rebuild the downloader environment from the current os.environ.
+
+        The environment is captured when the adapter is created; call this
+        after changing os.environ for later downloads to see the change.
+        Pooled workers that are already running keep their environment.
+        """
+        self._child_env = {**os.environ, "PYTHONUNBUFFERED": "1"}  # Ensure unbuffered output
+        if self._worker_pool is not None:
+            self._worker_pool.env = self._child_env
+
+    def close(self) -> None:
+        """Stop the adapter's pooled worker processes, if any."""
+        if self._worker_pool is not None:
+            self._worker_pool.close()
+
     def _auto_detect_third_party_path(self) -> Path:
         """Auto-detect the bunkr module directory.
 
@@ -124,15 +442,26 @@ class BunkrDownloaderAdapter:
         # The bunkr module is bundled in the same directory as this adapter
         return Path(__file__).resolve().parent / "bunkr"
 
-    def _find_downloader_script(self) -> Path:
+    def _find_downloader_script(self, use_cache: bool = True) -> Path:
         """Locate the downloader.py script in the bundled bunkr directory.
 
+        The path is remembered after the first successful lookup, so later
+        downloads skip the existence check.
+
+        Args:
+            use_cache: If False, check the filesystem again even if the
+                script was found before.
+
         Returns:
             Path to the downloader.py script.
 
         Raises:
             BunkrScriptNotFoundError: If the script cannot be found.
         """
+        if use_cache and self._script_path is not None:
+            return self._script_path
+
+        self._script_path = None
         script_path = self.third_party_path / "downloader.py"
 
         if not script_path.exists():
@@ -145,9 +474,11 @@ class BunkrDownloaderAdapter:
             self._logger.error(error_msg)
             raise BunkrScriptNotFoundError(error_msg)
 
+        self._script_path = script_path
+        self._command_prefix = [sys.executable, str(script_path)]  # Same interpreter
         return script_path
 
-    def verify_installation(self) -> bool:
+    def verify_installation(self, force: bool = False) -> bool:
         """Check if BunkrDownloader is available and properly installed.
 
         Verifies that:
@@ -155,22 +486,39 @@ class BunkrDownloaderAdapter:
         - The script is readable
         - Basic Python imports work (optional check)
 
+        The result is remembered for the adapter's lifetime, so repeated
+        calls are free.
+
+        Args:
+            force: If True, check the filesystem again instead of returning
+                the remembered result.
+
+        Returns:
+            True if BunkrDownloader is properly installed, False otherwise.
+        """
+        if self._verified is None or force:
+            self._verified = self._check_installation()
+        return self._verified
+
+    def _check_installation(self) -> bool:
+        """Run the checks behind verify_installation().
+
         Returns:
             True if BunkrDownloader is properly installed, False otherwise.
         """
         try:
-            script_path = self._find_downloader_script()
+            script_path = self._find_downloader_script(use_cache=False)
 
             # Check if script is readable
             if not os.access(script_path, os.R_OK):
-                self._logger.warning(f"BunkrDownloader script is not readable: {script_path}")
+                self._logger.warning("BunkrDownloader script is not readable: %s", script_path)
                 return False
 
             # Check if the third_party directory has expected structure
             expected_files = ["downloader.py"]
             for expected_file in expected_files:
                 if not (self.third_party_path / expected_file).exists():
-                    self._logger.warning(f"Missing expected file: {expected_file}")
+                    self._logger.warning("Missing expected file: %s", expected_file)
                     return False
 
             self._logger.debug("BunkrDownloader installation verified successfully")
@@ -179,68 +527,439 @@ class BunkrDownloaderAdapter:
         except BunkrScriptNotFoundError:
             return False
         except Exception as e:
-            self._logger.warning(f"Error verifying BunkrDownloader installation: {e}")
+            self._logger.warning("Error verifying BunkrDownloader installation: %s", e)
             return False
 
     def _stream_process_output(
         self,
         process: subprocess.Popen,
         callback: Optional[Callable[[str], None]],
-    ) -> Tuple[int, str]:
+        cancel_event: Optional[threading.Event] = None,
+        on_poll: Optional[Callable[[], None]] = None,
+        result_marker: Optional[bytes] = None,
+    ) -> Tuple[int, Deque[bytes]]:
         """Stream stdout/stderr from subprocess in real-time.
 
-        Reads process output line-by-line and passes each line to the callback.
-        Collects all output for error reporting.
+        Reads the binary pipe in large chunks on the calling thread, splits
+        it into lines and passes each line to the callback. Lines are only
+        decoded when the callback or debug logging consumes them, and the
+        lines from one read go out as a single debug record. The last
+        _OUTPUT_TAIL_LINES lines are kept for error reporting.
 
         Args:
-            process: The subprocess.Popen instance to stream from.
+            process: The subprocess.Popen instance to stream from, opened
+                with a binary stdout pipe.
             callback: Optional callback function that receives each line of output.
+            cancel_event: Optional event; once set, the process is
+                terminated within _CANCEL_POLL_SECONDS.
+            on_poll: Optional function called every _FILE_POLL_SECONDS
+                while the process runs.
+            result_marker: For a pooled worker, the marker of the line
+                that ends a request and carries its return code; the
+                worker keeps running. If None, output ends when the
+                process exits.
+
+        Returns:
+            Tuple of (return_code, last lines of output, undecoded). The
+            lines are only decoded if a failure needs reporting.
+
+        Raises:
+            BunkrDownloadTimeoutError: If the process outlives self.timeout.
+            BunkrDownloadCancelledError: If cancel_event was set.
+        """
+        deadline = time.monotonic() + self.timeout
+        cancel_interval = _CANCEL_POLL_SECONDS if cancel_event is not None else float("inf")
+        next_poll = time.monotonic() + _FILE_POLL_SECONDS
+
+        def checkpoint() -> float:
+            """Handle cancellation, timeout and polling; return the next wait."""
+            nonlocal next_poll
+            if cancel_event is not None and cancel_event.is_set():
+                self._raise_cancelled(process)
+            now = time.monotonic()
+            remaining = deadline - now
+            if remaining <= 0:
+                self._raise_timeout(process)
+            if on_poll is None:
+                return min(remaining, cancel_interval)
+            if now >= next_poll:
+                on_poll()
+                next_poll = now + _FILE_POLL_SECONDS
+            return min(remaining, cancel_interval, next_poll - now)
+
+        tail: Deque[bytes] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        log_lines = self._logger.isEnabledFor(logging.DEBUG)
+
+        def handle_lines(raw_lines: List[bytes]) -> None:
+            self._handle_output_lines(raw_lines, tail, callback, log_lines)
+
+        if process.stdout is not None:
+            fd = process.stdout.fileno()
+            pending = b""
+            with selectors.DefaultSelector() as selector:
+                selector.register(fd, selectors.EVENT_READ)
+                while True:
+                    if not selector.select(timeout=checkpoint()):
+                        continue
+                    chunk = os.read(fd, _READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    lines, pending = _split_lines(pending + chunk)
+                    if result_marker is not None and lines:
+                        # The worker writes nothing after the result line
+                        before, marker, result = lines[-1].partition(result_marker)
+                        if marker:
+                            lines[-1:] = [before] if before else []
+                            handle_lines(lines)
+                            return json.loads(result)["returncode"], tail
+                    handle_lines(lines)
+            if pending:
+                handle_lines(_LINE_BREAK.split(pending.rstrip(b"\r")))
+
+        # Output is closed; the process is exiting. With a pidfd the exit is
+        # waited for in one select(), without Popen.wait()'s sleep polling.
+        pidfd = _open_pidfd(process.pid)
+        if pidfd is not None:
+            try:
+                with selectors.DefaultSelector() as selector:
+                    selector.register(pidfd, selectors.EVENT_READ)
+                    while not selector.select(timeout=checkpoint()):
+                        pass
+            finally:
+                os.close(pidfd)
+        while True:
+            try:
+                return_code = process.wait(timeout=checkpoint())
+                break
+            except subprocess.TimeoutExpired:
+                continue
+
+        return return_code, tail
+
+    def _handle_output_lines(
+        self,
+        raw_lines: List[bytes],
+        tail: Deque[bytes],
+        callback: Optional[Callable[[str], None]],
+        log_lines: bool,
+    ) -> None:
+        """Record lines read in one go and pass them on.
+
+        Args:
+            raw_lines: Undecoded output lines.
+            tail: Deque of recent lines to append to.
+            callback: Optional callback that receives each decoded line.
+            log_lines: Whether to log the lines at debug level.
+        """
+        tail.extend(raw_lines)
+        if not raw_lines or (not log_lines and callback is None):
+            return
+        lines = [raw_line.decode("utf-8", "replace") for raw_line in raw_lines]
+        if log_lines:
+            # One record per read: lines that arrived together are logged
+            # together
+            self._logger.debug("[BUNKR] %s", "\n[BUNKR] ".join(lines))
+        if callback is not None:
+            for line in lines:
+                try:
+                    callback(line)
+                except Exception as e:
+                    self._logger.warning("Output callback error: %s", e)
+
+    def _raise_cancelled(self, process: subprocess.Popen) -> NoReturn:
+        """Stop a download whose cancel event was set.
+
+        Args:
+            process: The subprocess to terminate.
+
+        Raises:
+            BunkrDownloadCancelledError: Always.
+        """
+        self._logger.info("Download cancelled, terminating...")
+        self._terminate_process(process)
+        raise BunkrDownloadCancelledError("Download cancelled")
+
+    def _raise_timeout(self, process: subprocess.Popen) -> NoReturn:
+        """Stop a download that has run out of time.
+
+        Args:
+            process: The subprocess to terminate.
+
+        Raises:
+            BunkrDownloadTimeoutError: Always.
+        """
+        self._logger.warning("Process timed out after %ss, terminating...", self.timeout)
+        self._terminate_process(process)
+        raise BunkrDownloadTimeoutError(
+            f"Download timed out after {self.timeout} seconds"
+        )
+
+    def _calculate_backoff(self, attempt: int) -> float:
+        """Calculate backoff time with exponential increase and jitter.
+
+        Args:
+            attempt: Current attempt number (0-indexed).
+
+        Returns:
+            Seconds to wait before next retry.
+        """
+        backoff = INITIAL_BACKOFF_SECONDS * (2 ** attempt) * (0.5 + random.random())
+        return min(backoff, MAX_BACKOFF_SECONDS)
+
+    def _classify_failure(
+        self, return_code: int, output: Iterable[bytes]
+    ) -> Optional[str]:
+        """Decide whether a failed downloader run is worth repeating.
+
+        Missing content is never retried, even if the output also shows
+        network errors.
+
+        Args:
+            return_code: Exit code of the downloader process.
+            output: Last lines of its output, undecoded.
+
+        Returns:
+            A short reason if the failure looks transient (killed by a
+            signal, e.g. the OOM killer; rate limited; network error),
+            otherwise None.
+        """
+        if return_code < 0:
+            return f"killed by signal {-return_code}"
+        output = _decode_output(output)
+        if _NOT_FOUND_RE.search(output):
+            return None
+        if _RATE_LIMIT_RE.search(output):
+            return "rate limited"
+        if _NETWORK_ERROR_RE.search(output):
+            return "network error"
+        return None
+
+    def _run_downloader(
+        self,
+        args: List[str],
+        output_callback: Optional[Callable[[str], None]],
+        cancel_event: Optional[threading.Event] = None,
+        on_poll: Optional[Callable[[], None]] = None,
+    ) -> Tuple[int, Deque[bytes]]:
+        """Run the downloader, repeating runs that failed transiently.
+
+        Up to max_retries runs are made, with exponential backoff and jitter
+        between them. Files completed by an earlier run are skipped by the
+        downloader itself, so a repeat resumes rather than restarts.
+
+        Args:
+            args: Downloader command line arguments; the script must have
+                been found by _find_downloader_script().
+            output_callback: Optional callback for real-time log streaming.
+            cancel_event: Optional event that cancels the download, including
+                during a backoff wait.
+            on_poll: Optional function called periodically while a run is
+                in progress.
+
+        Returns:
+            Tuple of (return_code, last lines of output, undecoded) of the
+            final run.
+
+        Raises:
+            BunkrDownloadTimeoutError: If a run outlives self.timeout.
+            BunkrDownloadCancelledError: If cancel_event was set.
+        """
+        attempts = max(1, self.max_retries)
+        attempt = 0
+        while True:
+            if self._worker_pool is not None:
+                return_code, output = self._run_in_worker(
+                    args, output_callback, cancel_event, on_poll
+                )
+            else:
+                process = subprocess.Popen(
+                    [*self._command_prefix, *args],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,  # Combine stderr with stdout
+                    bufsize=0,  # Raw pipe; output is read in chunks and split here
+                    cwd=self._cwd,  # Set working directory for imports
+                    env=self._child_env,
+                )
+                return_code, output = self._stream_process_output(
+                    process, output_callback, cancel_event, on_poll
+                )
+            attempt += 1
+            if return_code == 0 or attempt >= attempts:
+                return return_code, output
+
+            reason = self._classify_failure(return_code, output)
+            if reason is None:
+                return return_code, output
+
+            backoff = self._calculate_backoff(attempt - 1)
+            self._logger.warning(
+                "Downloader exited with code %d, %s (attempt %d/%d). Retrying in %.1fs...",
+                return_code,
+                reason,
+                attempt,
+                attempts,
+                backoff,
+            )
+            if cancel_event is None:
+                time.sleep(backoff)
+            elif cancel_event.wait(backoff):
+                raise BunkrDownloadCancelledError("Download cancelled")
+
+    async def _stream_process_output_async(
+        self,
+        process: asyncio.subprocess.Process,
+        callback: Optional[Callable[[str], None]],
+    ) -> Tuple[int, Deque[bytes]]:
+        """Stream output of an asyncio subprocess until it exits.
+
+        Like _stream_process_output(), but awaits the output instead of
+        blocking on it. The caller enforces the timeout.
+
+        Args:
+            process: The process, started with a stdout pipe.
+            callback: Optional callback function that receives each line of output.
+
+        Returns:
+            Tuple of (return_code, last lines of output, undecoded).
+        """
+        tail: Deque[bytes] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        log_lines = self._logger.isEnabledFor(logging.DEBUG)
+        pending = b""
+        while True:
+            chunk = await process.stdout.read(_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            lines, pending = _split_lines(pending + chunk)
+            self._handle_output_lines(lines, tail, callback, log_lines)
+        if pending:
+            self._handle_output_lines(
+                _LINE_BREAK.split(pending.rstrip(b"\r")), tail, callback, log_lines
+            )
+        return await process.wait(), tail
+
+    async def _terminate_process_async(self, process: asyncio.subprocess.Process) -> None:
+        """Terminate an asyncio subprocess gracefully, then forcefully if needed.
+
+        Args:
+            process: The subprocess to terminate.
+        """
+        try:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), 5.0)
+            except asyncio.TimeoutError:
+                self._logger.warning("Process did not terminate gracefully, forcing kill...")
+                process.kill()
+                await asyncio.wait_for(process.wait(), 5.0)
+        except ProcessLookupError:
+            pass
+        except Exception as e:
+            self._logger.error("Error terminating process: %s", e)
+
+    async def _run_downloader_async(
+        self,
+        args: List[str],
+        output_callback: Optional[Callable[[str], None]],
+    ) -> Tuple[int, Deque[bytes]]:
+        """Run the downloader with asyncio, repeating transient failures.
+
+        The async counterpart of _run_downloader(); always starts a fresh
+        process.
+
+        Args:
+            args: Downloader command line arguments; the script must have
+                been found by _find_downloader_script().
+            output_callback: Optional callback for real-time log streaming.
+
+        Returns:
+            Tuple of (return_code, last lines of output, undecoded) of the
+            final run.
+
+        Raises:
+            BunkrDownloadTimeoutError: If a run outlives self.timeout.
+        """
+        attempts = max(1, self.max_retries)
+        attempt = 0
+        while True:
+            process = await asyncio.create_subprocess_exec(
+                *self._command_prefix,
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=self._cwd,
+                env=self._child_env,
+            )
+            try:
+                return_code, output = await asyncio.wait_for(
+                    self._stream_process_output_async(process, output_callback),
+                    self.timeout,
+                )
+            except asyncio.TimeoutError:
+                self._logger.warning(
+                    "Process timed out after %ss, terminating...", self.timeout
+                )
+                await self._terminate_process_async(process)
+                raise BunkrDownloadTimeoutError(
+                    f"Download timed out after {self.timeout} seconds"
+                ) from None
+            except asyncio.CancelledError:
+                await self._terminate_process_async(process)
+                raise
+            attempt += 1
+            if return_code == 0 or attempt >= attempts:
+                return return_code, output
+
+            reason = self._classify_failure(return_code, output)
+            if reason is None:
+                return return_code, output
+
+            backoff = self._calculate_backoff(attempt - 1)
+            self._logger.warning(
+                "Downloader exited with code %d, %s (attempt %d/%d). Retrying in %.1fs...",
+                return_code,
+                reason,
+                attempt,
+                attempts,
+                backoff,
+            )
+            await asyncio.sleep(backoff)
+
+    def _run_in_worker(
+        self,
+        args: List[str],
+        output_callback: Optional[Callable[[str], None]],
+        cancel_event: Optional[threading.Event] = None,
+        on_poll: Optional[Callable[[], None]] = None,
+    ) -> Tuple[int, Deque[bytes]]:
+        """Run the downloader once in a pooled worker process.
+
+        Args:
+            args: Downloader command line arguments.
+            output_callback: Optional callback for real-time log streaming.
+            cancel_event: Optional event that cancels the download.
+            on_poll: Optional function called periodically while the
+                download is in progress.
 
         Returns:
-            Tuple of (return_code, collected_output).
-        """
-        collected_output: List[str] = []
-        
-        def read_output():
-            """Read and process output lines from the process."""
-            if process.stdout is None:
-                return
-                
-            for line in iter(process.stdout.readline, ""):
-                if not line:
-                    break
-                    
-                line = line.rstrip("\n\r")
-                collected_output.append(line)
-                
-                # Log with prefix
-                self._logger.debug(f"[BUNKR] {line}")
-                
-                # Call user callback if provided
-                if callback:
-                    try:
-                        callback(line)
-                    except Exception as e:
-                        self._logger.warning(f"Output callback error: {e}")
-
-        # Read output in a separate thread to handle blocking
-        output_thread = threading.Thread(target=read_output, daemon=True)
-        output_thread.start()
-        
-        # Wait for process completion with timeout
+            Tuple of (return_code, last lines of output, undecoded).
+
+        Raises:
+            BunkrDownloadTimeoutError: If the run outlives self.timeout.
+            BunkrDownloadCancelledError: If cancel_event was set.
+        """
+        pool = self._worker_pool
+        process = pool.acquire()
         try:
-            return_code = process.wait(timeout=self.timeout)
-        except subprocess.TimeoutExpired:
-            self._logger.warning(f"Process timed out after {self.timeout}s, terminating...")
-            self._terminate_process(process)
-            raise BunkrDownloadTimeoutError(
-                f"Download timed out after {self.timeout} seconds"
+            try:
+                process.stdin.write(json.dumps({"args": args}).encode() + b"\n")
+            except BrokenPipeError:
+                # The worker has just exited; streaming picks up its exit code
+                pass
+            return self._stream_process_output(
+                process, output_callback, cancel_event, on_poll, RESULT_MARKER
             )
-        
-        # Wait for output thread to finish
-        output_thread.join(timeout=5.0)
-        
-        return return_code, "\n".join(collected_output)
+        finally:
+            pool.release(process)
 
     def _terminate_process(self, process: subprocess.Popen) -> None:
         """Terminate a subprocess gracefully, then forcefully if needed.
@@ -259,7 +978,7 @@ class BunkrDownloaderAdapter:
                 process.kill()
                 process.wait(timeout=5.0)
         except Exception as e:
-            self._logger.error(f"Error terminating process: {e}")
+            self._logger.error("Error terminating process: %s", e)
 
     def _collect_downloaded_files(self, output_dir: Path) -> List[Path]:
         """Scan output directory for downloaded files after process completes.
@@ -270,38 +989,238 @@ class BunkrDownloaderAdapter:
         Returns:
             List of file paths found in the output directory.
         """
-        if not output_dir.exists():
-            return []
+        files = [Path(entry.path) for entry in _iter_files(output_dir)]
+        files.sort()
+
+        self._logger.debug("Collected %d downloaded file(s) from %s", len(files), output_dir)
 
-        files: List[Path] = []
-        
-        # Recursively find all files
-        for item in output_dir.rglob("*"):
-            if item.is_file():
-                files.append(item)
+        return files
 
-        self._logger.debug(f"Collected {len(files)} downloaded file(s) from {output_dir}")
-        
-        return sorted(files)
+    def _get_files_before_download(self, output_dir: Path) -> Dict[Path, int]:
+        """Get existing files and their sizes before download starts.
 
-    def _get_files_before_download(self, output_dir: Path) -> Set[Path]:
-        """Get set of existing files before download starts.
+        Only regular files are stat'ed, once each, to record their size, so
+        callers never need to stat the files again.
 
         Args:
             output_dir: Directory to scan.
 
         Returns:
-            Set of existing file paths (resolved to absolute paths).
+            Mapping of existing file paths (absolute) to their sizes in bytes.
+        """
+        files: Dict[Path, int] = {}
+        for entry in _iter_files(output_dir):
+            try:
+                files[Path(entry.path)] = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+        return files
+
+    def _snapshot_watermark(self, output_dir: Path) -> Optional[int]:
+        """Read the filesystem's current time in output_dir.
+
+        A throwaway probe file is created and its mtime read back, so the
+        watermark comes from the same clock that will stamp downloaded files
+        (on network mounts that is the server's clock, not ours).
+
+        Args:
+            output_dir: Directory the download will write to.
+
+        Returns:
+            Probe mtime in nanoseconds, or None if no probe could be created.
+        """
+        try:
+            fd, probe = tempfile.mkstemp(prefix=".colab-ingest-", dir=output_dir)
+        except OSError:
+            return None
+        try:
+            return os.fstat(fd).st_mtime_ns
+        finally:
+            os.close(fd)
+            try:
+                os.unlink(probe)
+            except OSError:
+                pass
+
+    def _collect_new_files_since(
+        self,
+        output_dir: Path,
+        watermark_ns: int,
+    ) -> Tuple[List[Path], int]:
+        """Find regular files modified after a watermark.
+
+        Only regular files are stat'ed, once each, for both the mtime check
+        and the size.
+
+        Args:
+            output_dir: Directory to scan.
+            watermark_ns: Value returned by _snapshot_watermark().
+
+        Returns:
+            Tuple of (sorted new file paths, their combined size in bytes).
+        """
+        new_files: List[Path] = []
+        total_bytes = 0
+        for entry in _iter_files(output_dir):
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            # Strictly after: file times come from a coarse clock, so files
+            # written just before the probe can share its mtime. A file
+            # written by the download in the probe's own tick is missed,
+            # but the downloader takes far longer than a tick to start.
+            if st.st_mtime_ns > watermark_ns:
+                new_files.append(Path(entry.path))
+                total_bytes += st.st_size
+        new_files.sort()
+        return new_files, total_bytes
+
+    def _find_new_files(
+        self,
+        output_dir: Path,
+        watermark_ns: Optional[int],
+        files_before: Dict[Path, int],
+    ) -> Tuple[List[Path], int]:
+        """Find files written by the download.
+
+        Args:
+            output_dir: Directory the download wrote to.
+            watermark_ns: Watermark taken before the download, or None.
+            files_before: Full snapshot taken before the download; only
+                used when there is no watermark.
+
+        Returns:
+            Tuple of (sorted new file paths, their combined size in bytes).
+        """
+        if watermark_ns is not None:
+            return self._collect_new_files_since(output_dir, watermark_ns)
+        files_after = self._get_files_before_download(output_dir)
+        return self._diff_files(files_before, files_after)
+
+    def _diff_files(
+        self,
+        files_before: Dict[Path, int],
+        files_after: Dict[Path, int],
+    ) -> Tuple[List[Path], int]:
+        """Find files that appeared between two snapshots.
+
+        Args:
+            files_before: Snapshot taken before the download.
+            files_after: Snapshot taken after the download.
+
+        Returns:
+            Tuple of (sorted new file paths, their combined size in bytes).
         """
-        if not output_dir.exists():
-            return set()
-        
-        return {f.resolve() for f in output_dir.rglob("*") if f.is_file()}
+        new_files = sorted(files_after.keys() - files_before.keys())
+        return new_files, sum(files_after[f] for f in new_files)
+
+    def _prepare_download(
+        self, url: str, output_dir: Path
+    ) -> Tuple[List[str], Optional[int], Dict[Path, int]]:
+        """Get ready to download a URL into output_dir.
+
+        Args:
+            url: The Bunkr URL to download.
+            output_dir: Directory for the download; created if missing.
+
+        Returns:
+            Tuple of (downloader arguments, watermark, before-snapshot) for
+            _find_new_files(). The before-snapshot is only taken if no
+            watermark could be.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Mark the start of the download so new files can be told apart
+        watermark_ns = self._snapshot_watermark(output_dir)
+        files_before = (
+            self._get_files_before_download(output_dir) if watermark_ns is None else {}
+        )
+
+        args = [
+            url,
+            "--custom-path", str(output_dir),
+            "--max-retries", str(self.max_retries),
+            "--disable-ui",  # Disable progress UI for logging
+        ]
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Executing command: %s",
+                " ".join([*self._command_prefix, *args]),
+            )
+            self._logger.debug("Working directory: %s", self.third_party_path)
+
+        return args, watermark_ns, files_before
+
+    def _completed_result(
+        self,
+        url: str,
+        output_dir: Path,
+        return_code: int,
+        output: Deque[bytes],
+        elapsed_time: float,
+        downloaded_files: List[Path],
+        total_bytes: int,
+    ) -> BunkrDownloadResult:
+        """Build the result of a downloader run that exited.
+
+        Args:
+            url: The downloaded URL.
+            output_dir: Directory the download wrote to.
+            return_code: Exit code of the final run.
+            output: Last lines of its output, undecoded.
+            elapsed_time: Seconds the download took.
+            downloaded_files: Files written by the download.
+            total_bytes: Their combined size in bytes.
+
+        Returns:
+            BunkrDownloadResult for the run.
+        """
+        if return_code == 0:
+            self._logger.info(
+                "Download completed successfully in %.1fs. Downloaded %d file(s).",
+                elapsed_time,
+                len(downloaded_files),
+            )
+
+            # Log downloaded files
+            for file_path in downloaded_files:
+                self._logger.info("  - %s", file_path.name)
+
+            return BunkrDownloadResult(
+                success=True,
+                downloaded_files=downloaded_files,
+                url=url,
+                error=None,
+                output_dir=output_dir,
+                total_bytes=total_bytes,
+            )
+
+        error_msg = f"Download failed with exit code {return_code}"
+        if output:
+            # Get last few lines for error context
+            last_lines = _last_output_lines(output, _ERROR_CONTEXT_LINES)
+            error_msg += f"\nLast output:\n" + "\n".join(last_lines)
+
+        self._logger.error(error_msg)
+
+        return BunkrDownloadResult(
+            success=False,
+            downloaded_files=downloaded_files,  # May have partial downloads
+            url=url,
+            error=error_msg,
+            output_dir=output_dir,
+            total_bytes=total_bytes,
+        )
 
     def download(
         self,
         url: str,
         output_callback: Optional[Callable[[str], None]] = None,
+        download_dir: Optional[Path] = None,
+        cancel_event: Optional[threading.Event] = None,
+        on_file: Optional[Callable[[Path], None]] = None,
     ) -> BunkrDownloadResult:
         """Download from Bunkr URL using subprocess.
 
@@ -312,114 +1231,90 @@ class BunkrDownloaderAdapter:
             url: The Bunkr URL to download (album /a/ or file /f/ URL).
             output_callback: Optional callback for real-time log streaming.
                 Receives each line of subprocess output.
+            download_dir: Optional directory for this download. Defaults to
+                the adapter's download_dir, so one adapter can serve
+                downloads into different directories.
+            cancel_event: Optional event another thread can set to stop the
+                download; the downloader process is terminated promptly and
+                a failed result is returned.
+            on_file: Optional callback that receives each completed file
+                while the download is still running, so callers can start
+                processing early. Files are found every _FILE_POLL_SECONDS;
+                each file is reported once, and any not yet reported are
+                reported before download() returns. Partial ".temp" files
+                are never reported.
 
         Returns:
             BunkrDownloadResult with download status and file information.
         """
         start_time = time.time()
-        self._logger.info(f"Starting Bunkr download: {url}")
+        output_dir = Path(download_dir) if download_dir is not None else self.download_dir
+        self._logger.info("Starting Bunkr download: %s", url)
 
         # Verify installation
         try:
-            script_path = self._find_downloader_script()
+            self._find_downloader_script()
         except BunkrScriptNotFoundError as e:
             return BunkrDownloadResult(
                 success=False,
                 downloaded_files=[],
                 url=url,
                 error=str(e),
-                output_dir=self.download_dir,
+                output_dir=output_dir,
             )
 
-        # Ensure output directory exists
-        self.download_dir.mkdir(parents=True, exist_ok=True)
+        args, watermark_ns, files_before = self._prepare_download(url, output_dir)
 
-        # Get files before download to identify new files
-        files_before = self._get_files_before_download(self.download_dir)
+        reported: Set[Path] = set()
 
-        # Build command
-        cmd = [
-            sys.executable,  # Use same Python interpreter
-            str(script_path),
-            url,
-            "--custom-path", str(self.download_dir),
-            "--max-retries", str(self.max_retries),
-            "--disable-ui",  # Disable progress UI for logging
-        ]
-
-        self._logger.debug(f"Executing command: {' '.join(cmd)}")
-        self._logger.debug(f"Working directory: {self.third_party_path}")
+        def report_files() -> None:
+            files, _ = self._find_new_files(output_dir, watermark_ns, files_before)
+            for file_path in files:
+                if file_path.suffix == _PARTIAL_SUFFIX or file_path in reported:
+                    continue
+                reported.add(file_path)
+                try:
+                    on_file(file_path)
+                except Exception as e:
+                    self._logger.warning("File callback error: %s", e)
 
         try:
-            # Start subprocess
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # Combine stderr with stdout
-                text=True,  # String output instead of bytes
-                cwd=str(self.third_party_path),  # Set working directory for imports
-                env={**os.environ, "PYTHONUNBUFFERED": "1"},  # Ensure unbuffered output
+            # Run the downloader, streaming output until it completes
+            return_code, output = self._run_downloader(
+                args,
+                output_callback,
+                cancel_event,
+                on_poll=report_files if on_file is not None else None,
             )
 
-            # Stream output and wait for completion
-            return_code, output = self._stream_process_output(process, output_callback)
-
             # Calculate elapsed time
             elapsed_time = time.time() - start_time
 
             # Get new files (files downloaded during this operation)
-            files_after = self._get_files_before_download(self.download_dir)
-            new_files = files_after - files_before
-            downloaded_files = sorted(list(new_files))
-
-            # Check result
-            if return_code == 0:
-                self._logger.info(
-                    f"Download completed successfully in {elapsed_time:.1f}s. "
-                    f"Downloaded {len(downloaded_files)} file(s)."
-                )
-                
-                # Log downloaded files
-                for file_path in downloaded_files:
-                    self._logger.info(f"  - {file_path.name}")
-
-                return BunkrDownloadResult(
-                    success=True,
-                    downloaded_files=downloaded_files,
-                    url=url,
-                    error=None,
-                    output_dir=self.download_dir,
-                )
-            else:
-                error_msg = f"Download failed with exit code {return_code}"
-                if output:
-                    # Get last few lines for error context
-                    output_lines = output.strip().split("\n")
-                    last_lines = output_lines[-5:] if len(output_lines) > 5 else output_lines
-                    error_msg += f"\nLast output:\n" + "\n".join(last_lines)
-
-                self._logger.error(error_msg)
-
-                return BunkrDownloadResult(
-                    success=False,
-                    downloaded_files=downloaded_files,  # May have partial downloads
-                    url=url,
-                    error=error_msg,
-                    output_dir=self.download_dir,
-                )
+            downloaded_files, total_bytes = self._find_new_files(
+                output_dir, watermark_ns, files_before
+            )
+            if on_file is not None:
+                report_files()
 
-        except BunkrDownloadTimeoutError as e:
-            # Collect any files that may have been downloaded before timeout
-            files_after = self._get_files_before_download(self.download_dir)
-            new_files = files_after - files_before
-            downloaded_files = sorted(list(new_files))
+            return self._completed_result(
+                url, output_dir, return_code, output, elapsed_time,
+                downloaded_files, total_bytes,
+            )
+
+        except (BunkrDownloadTimeoutError, BunkrDownloadCancelledError) as e:
+            # Collect any files that may have been downloaded before it stopped
+            downloaded_files, total_bytes = self._find_new_files(
+                output_dir, watermark_ns, files_before
+            )
 
             return BunkrDownloadResult(
                 success=False,
                 downloaded_files=downloaded_files,
                 url=url,
                 error=str(e),
-                output_dir=self.download_dir,
+                output_dir=output_dir,
+                total_bytes=total_bytes,
             )
 
         except FileNotFoundError as e:
@@ -431,7 +1326,7 @@ class BunkrDownloaderAdapter:
                 downloaded_files=[],
                 url=url,
                 error=error_msg,
-                output_dir=self.download_dir,
+                output_dir=output_dir,
             )
 
         except Exception as e:
@@ -439,18 +1334,155 @@ class BunkrDownloaderAdapter:
             self._logger.error(error_msg, exc_info=True)
 
             # Try to collect any downloaded files
-            files_after = self._get_files_before_download(self.download_dir)
-            new_files = files_after - files_before
-            downloaded_files = sorted(list(new_files))
+            downloaded_files, total_bytes = self._find_new_files(
+                output_dir, watermark_ns, files_before
+            )
 
             return BunkrDownloadResult(
                 success=False,
                 downloaded_files=downloaded_files,
                 url=url,
                 error=error_msg,
-                output_dir=self.download_dir,
+                output_dir=output_dir,
+                total_bytes=total_bytes,
+            )
+
+    async def download_async(
+        self,
+        url: str,
+        output_callback: Optional[Callable[[str], None]] = None,
+        download_dir: Optional[Path] = None,
+    ) -> BunkrDownloadResult:
+        """Download from Bunkr URL without blocking the event loop.
+
+        The asyncio counterpart of download(): the downloader process is
+        driven by the running event loop, so many downloads can run on one
+        thread alongside other asyncio work. Each download starts a fresh
+        process; the worker pool only serves download(). To stop a
+        download, cancel the awaiting task; the process is terminated and
+        the cancellation propagates.
+
+        Args:
+            url: The Bunkr URL to download (album /a/ or file /f/ URL).
+            output_callback: Optional callback for real-time log streaming,
+                called on the event loop thread.
+            download_dir: Optional directory for this download. Defaults to
+                the adapter's download_dir.
+
+        Returns:
+            BunkrDownloadResult with download status and file information.
+        """
+        start_time = time.time()
+        output_dir = Path(download_dir) if download_dir is not None else self.download_dir
+        self._logger.info("Starting Bunkr download: %s", url)
+
+        try:
+            self._find_downloader_script()
+        except BunkrScriptNotFoundError as e:
+            return BunkrDownloadResult(
+                success=False,
+                downloaded_files=[],
+                url=url,
+                error=str(e),
+                output_dir=output_dir,
+            )
+
+        args, watermark_ns, files_before = self._prepare_download(url, output_dir)
+
+        try:
+            return_code, output = await self._run_downloader_async(args, output_callback)
+            elapsed_time = time.time() - start_time
+
+            # Scanning the output directory can take a while for big albums
+            downloaded_files, total_bytes = await asyncio.to_thread(
+                self._find_new_files, output_dir, watermark_ns, files_before
+            )
+            return self._completed_result(
+                url, output_dir, return_code, output, elapsed_time,
+                downloaded_files, total_bytes,
             )
 
+        except BunkrDownloadTimeoutError as e:
+            downloaded_files, total_bytes = await asyncio.to_thread(
+                self._find_new_files, output_dir, watermark_ns, files_before
+            )
+            return BunkrDownloadResult(
+                success=False,
+                downloaded_files=downloaded_files,
+                url=url,
+                error=str(e),
+                output_dir=output_dir,
+                total_bytes=total_bytes,
+            )
+
+        except FileNotFoundError as e:
+            error_msg = f"Failed to execute Python interpreter: {e}"
+            self._logger.error(error_msg)
+
+            return BunkrDownloadResult(
+                success=False,
+                downloaded_files=[],
+                url=url,
+                error=error_msg,
+                output_dir=output_dir,
+            )
+
+        except Exception as e:
+            error_msg = f"Unexpected error during download: {e}"
+            self._logger.error(error_msg, exc_info=True)
+
+            downloaded_files, total_bytes = await asyncio.to_thread(
+                self._find_new_files, output_dir, watermark_ns, files_before
+            )
+            return BunkrDownloadResult(
+                success=False,
+                downloaded_files=downloaded_files,
+                url=url,
+                error=error_msg,
+                output_dir=output_dir,
+                total_bytes=total_bytes,
+            )
+
+    def download_many(
+        self,
+        urls: List[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        output_callback: Optional[Callable[[str], None]] = None,
+        download_dir: Optional[Path] = None,
+    ) -> List[BunkrDownloadResult]:
+        """Download several Bunkr URLs concurrently.
+
+        Each URL is downloaded into its own numbered subdirectory of the
+        download directory ("0", "1", ...), so concurrent downloads never
+        pick up each other's files.
+
+        Args:
+            urls: The Bunkr URLs to download.
+            max_workers: Maximum number of downloads running at once.
+            output_callback: Optional callback for real-time log streaming.
+                Called from several threads at once, so it must be
+                thread-safe.
+            download_dir: Optional parent directory for the downloads.
+                Defaults to the adapter's download_dir.
+
+        Returns:
+            One BunkrDownloadResult per URL, in the order of urls.
+        """
+        if not urls:
+            return []
+
+        base_dir = Path(download_dir) if download_dir is not None else self.download_dir
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(urls))),
+            thread_name_prefix="bunkr-download",
+        ) as executor:
+            futures = [
+                executor.submit(self.download, url, output_callback, base_dir / str(index))
+                for index, url in enumerate(urls)
+            ]
+            # download() reports failures in its result rather than raising
+            return [future.result() for future in futures]
+
     def __repr__(self) -> str:
         """Return string representation of BunkrDownloaderAdapter.
 
@@ -0,0 +1,125 @@
+"""Long-lived worker process running BunkrDownloader downloads.
+
+BunkrDownloaderAdapter starts this script when its worker pool is enabled,
+so interpreter start-up and the downloader's third-party dependencies are
+paid once per worker rather than once per URL. Usage:
+
+    python bunkr_worker.py <bunkr_directory>
+
+Requests are read from stdin, one JSON object per line:
+{"args": [<downloader.py arguments>]}. Each request runs like
+`python downloader.py <arguments>` would; its output goes to stdout as
+usual, followed by RESULT_MARKER and a JSON object {"returncode": <int>}
+on one line. The worker exits when stdin is closed.
+
+The downloader's own modules (downloader.py and its src package) are
+imported afresh for every request, so no module state carries over from
+one URL to the next. Its clear_terminal() is skipped: output goes to a
+pipe, not a terminal.
+
+The script only uses the standard library, so starting it does not import
+the colab_ingest package.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import os
+import sys
+import traceback
+from types import ModuleType
+from typing import List
+
+# Precedes the result line of a request; cannot appear in downloader output
+RESULT_MARKER = b"\x00colab-ingest-result\x00"
+
+
+def _import_downloader(bunkr_dir: str) -> ModuleType:
+    """Import the downloader with fresh module state.
+
+    Modules loaded from bunkr_dir by an earlier request are dropped first;
+    third-party modules stay loaded.
+
+    Args:
+        bunkr_dir: Absolute path of the BunkrDownloader directory.
+
+    Returns:
+        The freshly imported downloader module.
+    """
+    prefix = bunkr_dir + os.sep
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.abspath(path).startswith(prefix):
+            del sys.modules[name]
+    downloader = importlib.import_module("downloader")
+    if hasattr(downloader, "clear_terminal"):
+        downloader.clear_terminal = lambda: None
+    return downloader
+
+
+def _run(downloader: ModuleType, args: List[str]) -> int:
+    """Run one download the way `python downloader.py <args>` would.
+
+    Args:
+        downloader: The imported downloader module.
+        args: Command line arguments for the downloader.
+
+    Returns:
+        The exit code the downloader script would have exited with.
+    """
+    sys.argv = ["downloader.py", *args]
+    try:
+        asyncio.run(downloader.main())
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def main() -> int:
+    """Serve download requests from stdin until it is closed.
+
+    Returns:
+        Exit code.
+    """
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <bunkr_directory>", file=sys.stderr)
+        return 2
+
+    # Import the downloader the way running it as a script would. This
+    # first import loads its dependencies; requests re-import only the
+    # downloader's own modules.
+    bunkr_dir = os.path.abspath(sys.argv[1])
+    sys.path[0] = bunkr_dir
+    _import_downloader(bunkr_dir)
+
+    out = sys.stdout.buffer
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        try:
+            downloader = _import_downloader(bunkr_dir)
+        except Exception:
+            traceback.print_exc()
+            return_code = 1
+        else:
+            return_code = _run(downloader, request["args"])
+        sys.stdout.flush()
+        sys.stderr.flush()
+        out.write(RESULT_MARKER + json.dumps({"returncode": return_code}).encode() + b"\n")
+        out.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,13 +8,20 @@ from __future__ import annotations
 
 import logging
 import os
+import re
+import selectors
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, List, Optional, Set, Tuple
+from typing import Callable, Deque, Iterator, List, Optional, Tuple
 
 from colab_ingest.utils.logging import get_logger
 
@@ -22,6 +29,51 @@ from colab_ingest.utils.logging import get_logger
 # Default configuration
 DEFAULT_TIMEOUT_SECONDS = 30 * 60  # 30 minutes per download
 
+# Default concurrency for download_many()
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 4)
+
+# How often a cancellable download checks its cancel event while waiting
+_CANCEL_POLL_SECONDS = 0.05
+
+# Bytes read from the downloader's output pipe per os.read() call
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Output lines kept for the error message of a failed download
+_OUTPUT_TAIL_LINES = 5
+
+# Line breaks as universal-newlines text mode would see them
+_LINE_BREAK = re.compile(rb"\r\n|\r|\n")
+
+# Prefix of the per-download directories the script runs in
+_WORK_DIR_PREFIX = ".bh_"
+
+
+def _walk_files(root: Path, skip_prefix: Optional[str] = None) -> Iterator[os.DirEntry]:
+    """Yield the regular files under root, recursively.
+
+    Uses os.scandir, whose entries know their type without a stat call.
+    Symlinks are not followed.
+
+    Args:
+        root: Directory to walk; a missing directory yields nothing.
+        skip_prefix: Optional name prefix of directories not to descend into.
+
+    Yields:
+        A DirEntry for each regular file.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if skip_prefix is None or not entry.name.startswith(skip_prefix):
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
 
 @dataclass
 class BuzzHeavierDownloadResult:
@@ -33,6 +85,7 @@ class BuzzHeavierDownloadResult:
         file_id: The BuzzHeavier ID or URL that was downloaded.
         error: Error message if download failed (None if successful).
         output_dir: Directory where files were downloaded.
+        total_bytes: Combined size in bytes of downloaded_files.
     """
 
     success: bool
@@ -40,6 +93,7 @@ class BuzzHeavierDownloadResult:
     file_id: str
     error: Optional[str]
     output_dir: Path
+    total_bytes: int = 0
 
 
 class BuzzHeavierDownloaderError(Exception):
@@ -60,6 +114,12 @@ class BuzzHeavierDownloadTimeoutError(BuzzHeavierDownloaderError):
     pass
 
 
+class BuzzHeavierDownloadCancelledError(BuzzHeavierDownloaderError):
+    """Raised when a download is cancelled through its cancel event."""
+
+    pass
+
+
 class BuzzHeavierDownloaderAdapter:
     """Adapter for the bundled buzzheavier-downloader module.
 
@@ -101,6 +161,12 @@ class BuzzHeavierDownloaderAdapter:
         else:
             self.third_party_path = Path(third_party_path)
 
+        # Set by the first successful _find_downloader_script() lookup
+        self._script_path: Optional[Path] = None
+
+        # Environment for downloader processes, built once rather than per run
+        self.refresh_env()
+
         # Ensure download directory exists
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
@@ -109,6 +175,21 @@ class BuzzHeavierDownloaderAdapter:
             f"third_party_path: {self.third_party_path}"
         )
 
+    def refresh_env(self) -> None:
+        """Rebuild the downloader environment from the current os.environ.
+
+        The environment is captured when the adapter is created; call this
+        after changing os.environ for later downloads to see the change.
+        """
+        # Add script's directory to PYTHONPATH for relative imports
+        self._child_env = {
+            **os.environ,
+            "PYTHONUNBUFFERED": "1",  # Ensure unbuffered output
+            "PYTHONPATH": str(self.third_party_path.resolve())
+            + os.pathsep
+            + os.environ.get("PYTHONPATH", ""),
+        }
+
     def _auto_detect_third_party_path(self) -> Path:
         """Auto-detect the buzzheavier module directory.
 
@@ -121,15 +202,26 @@ class BuzzHeavierDownloaderAdapter:
         # The buzzheavier module is bundled in the same directory as this adapter
         return Path(__file__).resolve().parent / "buzzheavier"
 
-    def _find_downloader_script(self) -> Path:
+    def _find_downloader_script(self, use_cache: bool = True) -> Path:
         """Locate the bhdownload.py script in the bundled buzzheavier directory.
 
+        The path is remembered after the first successful lookup, so later
+        downloads skip the existence check.
+
+        Args:
+            use_cache: If False, check the filesystem again even if the
+                script was found before.
+
         Returns:
-            Path to the bhdownload.py script.
+            Absolute path to the bhdownload.py script.
 
         Raises:
             BuzzHeavierScriptNotFoundError: If the script cannot be found.
         """
+        if use_cache and self._script_path is not None:
+            return self._script_path
+
+        self._script_path = None
         script_path = self.third_party_path / "bhdownload.py"
 
         if not script_path.exists():
@@ -142,7 +234,9 @@ class BuzzHeavierDownloaderAdapter:
             self._logger.error(error_msg)
             raise BuzzHeavierScriptNotFoundError(error_msg)
 
-        return script_path
+        # Absolute, since the script runs with the download dir as its cwd
+        self._script_path = script_path.resolve()
+        return self._script_path
 
     def verify_installation(self) -> bool:
         """Check if buzzheavier-downloader is available and properly installed.
@@ -155,7 +249,7 @@ class BuzzHeavierDownloaderAdapter:
             True if buzzheavier-downloader is properly installed, False otherwise.
         """
         try:
-            script_path = self._find_downloader_script()
+            script_path = self._find_downloader_script(use_cache=False)
 
             # Check if script is readable
             if not os.access(script_path, os.R_OK):
@@ -177,61 +271,97 @@ class BuzzHeavierDownloaderAdapter:
         self,
         process: subprocess.Popen,
         callback: Optional[Callable[[str], None]],
+        cancel_event: Optional[threading.Event] = None,
     ) -> Tuple[int, str]:
         """Stream stdout/stderr from subprocess in real-time.
 
-        Reads process output line-by-line and passes each line to the callback.
-        Collects all output for error reporting.
+        Reads the binary pipe in chunks on the calling thread, waiting for
+        output with a selector so the timeout is enforced without a reader
+        thread. Output is split into lines like text mode would (\n, \r\n
+        and \r, as written by progress bars) and each line is passed to the
+        callback. The last _OUTPUT_TAIL_LINES non-blank lines are kept for
+        error reporting.
 
         Args:
-            process: The subprocess.Popen instance to stream from.
+            process: The subprocess.Popen instance to stream from, opened
+                with a binary stdout pipe.
             callback: Optional callback function that receives each line of output.
+            cancel_event: Optional event; once set, the process is
+                terminated and BuzzHeavierDownloadCancelledError is raised.
 
         Returns:
-            Tuple of (return_code, collected_output).
-        """
-        collected_output: List[str] = []
-
-        def read_output() -> None:
-            """Read and process output lines from the process."""
-            if process.stdout is None:
-                return
-
-            for line in iter(process.stdout.readline, ""):
-                if not line:
-                    break
-
-                line = line.rstrip("\n\r")
-                collected_output.append(line)
-
-                # Log with prefix
-                self._logger.debug(f"[BUZZHEAVIER] {line}")
-
-                # Call user callback if provided
-                if callback:
-                    try:
-                        callback(line)
-                    except Exception as e:
-                        self._logger.warning(f"Output callback error: {e}")
-
-        # Read output in a separate thread to handle blocking
-        output_thread = threading.Thread(target=read_output, daemon=True)
-        output_thread.start()
+            Tuple of (return_code, last non-blank lines of output).
 
-        # Wait for process completion with timeout
-        try:
-            return_code = process.wait(timeout=self.timeout)
-        except subprocess.TimeoutExpired:
-            self._logger.warning(f"Process timed out after {self.timeout}s, terminating...")
-            self._terminate_process(process)
-            raise BuzzHeavierDownloadTimeoutError(
-                f"Download timed out after {self.timeout} seconds"
-            )
-
-        # Wait for output thread to finish
-        output_thread.join(timeout=5.0)
+        Raises:
+            BuzzHeavierDownloadTimeoutError: If the process outlives self.timeout.
+            BuzzHeavierDownloadCancelledError: If cancel_event was set.
+        """
+        tail: Deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        deadline = time.monotonic() + self.timeout
+
+        def handle_line(raw_line: bytes) -> None:
+            line = raw_line.decode("utf-8", "replace")
+            if line.strip():
+                tail.append(line)
+
+            # Log with prefix
+            self._logger.debug(f"[BUZZHEAVIER] {line}")
+
+            # Call user callback if provided
+            if callback:
+                try:
+                    callback(line)
+                except Exception as e:
+                    self._logger.warning(f"Output callback error: {e}")
+
+        def remaining_time() -> float:
+            if cancel_event is not None and cancel_event.is_set():
+                self._logger.info("Download cancelled, terminating...")
+                self._terminate_process(process)
+                raise BuzzHeavierDownloadCancelledError("Download cancelled")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._logger.warning(f"Process timed out after {self.timeout}s, terminating...")
+                self._terminate_process(process)
+                raise BuzzHeavierDownloadTimeoutError(
+                    f"Download timed out after {self.timeout} seconds"
+                )
+            if cancel_event is not None:
+                return min(remaining, _CANCEL_POLL_SECONDS)
+            return remaining
+
+        if process.stdout is not None:
+            fd = process.stdout.fileno()
+            pending = b""
+            with selectors.DefaultSelector() as selector:
+                selector.register(fd, selectors.EVENT_READ)
+                while True:
+                    if not selector.select(timeout=remaining_time()):
+                        continue
+                    chunk = os.read(fd, _READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    pending += chunk
+                    # A trailing \r may be the first half of \r\n; keep it
+                    # for the next read
+                    split_at = len(pending) - 1 if pending.endswith(b"\r") else len(pending)
+                    *lines, rest = _LINE_BREAK.split(pending[:split_at])
+                    pending = rest + pending[split_at:]
+                    for line in lines:
+                        handle_line(line)
+            if pending:
+                for line in _LINE_BREAK.split(pending.rstrip(b"\r")):
+                    handle_line(line)
+
+        # Output is closed; wait for the process to exit
+        while True:
+            try:
+                return_code = process.wait(timeout=remaining_time())
+                break
+            except subprocess.TimeoutExpired:
+                continue
 
-        return return_code, "\n".join(collected_output)
+        return return_code, "\n".join(tail)
 
     def _terminate_process(self, process: subprocess.Popen) -> None:
         """Terminate a subprocess gracefully, then forcefully if needed.
@@ -241,83 +371,112 @@ class BuzzHeavierDownloaderAdapter:
         """
         try:
             # Try graceful termination first (SIGTERM)
-            process.terminate()
+            self._signal_process_group(process, force=False)
             try:
                 process.wait(timeout=5.0)
             except subprocess.TimeoutExpired:
                 # Force kill if still running (SIGKILL)
                 self._logger.warning("Process did not terminate gracefully, forcing kill...")
-                process.kill()
+                self._signal_process_group(process, force=True)
                 process.wait(timeout=5.0)
         except Exception as e:
             self._logger.error(f"Error terminating process: {e}")
 
+    def _signal_process_group(self, process: subprocess.Popen, force: bool) -> None:
+        """Terminate or kill the downloader together with any helpers it started.
+
+        The downloader runs in its own session, so its process group holds
+        just its own processes. Where there are no process groups (Windows),
+        only the downloader itself is signalled.
+
+        Args:
+            process: The downloader process.
+            force: Send SIGKILL instead of SIGTERM.
+        """
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        elif force:
+            process.kill()
+        else:
+            process.terminate()
+
     def _collect_downloaded_files(
-        self, output_dir: Path, before_files: Set[Path], include_existing: bool = False
-    ) -> List[Path]:
-        """Identify newly downloaded files by comparing before/after.
+        self,
+        work_dir: Path,
+        output_dir: Path,
+    ) -> Tuple[List[Path], int]:
+        """Move the files a download wrote to work_dir into output_dir.
+
+        Files keep their path relative to work_dir and replace same-named
+        files in output_dir, as if the script had written there directly.
+        work_dir is removed afterwards, unless a file could not be moved.
 
         Args:
-            output_dir: Directory to scan for downloaded files.
-            before_files: Set of files that existed before download (already resolved).
-            include_existing: If True and no new files found, return all existing files.
-                This handles retry scenarios where files already exist from previous attempts.
+            work_dir: Directory the script ran in.
+            output_dir: Directory the files belong in.
 
         Returns:
-            List of newly downloaded file paths.
+            Tuple of (sorted downloaded file paths, their combined size in bytes).
         """
-        if not output_dir.exists():
-            return []
-
-        # Small delay to ensure filesystem has synced (especially on network drives)
-        time.sleep(0.5)
-
-        # Get current files - resolve to absolute paths for consistent comparison
-        current_files: Set[Path] = set()
-        for item in output_dir.rglob("*"):
-            if item.is_file():
-                current_files.add(item.resolve())
+        files: List[Path] = []
+        total_bytes = 0
+        keep_work_dir = False
+        output_dir = output_dir.resolve()
+        for entry in _walk_files(work_dir):
+            relative = os.path.relpath(entry.path, work_dir)
+            try:
+                size = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+            target = output_dir / relative
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(entry.path, target)
+            except OSError as e:
+                self._logger.warning(f"Could not move {relative} into {output_dir}: {e}")
+                target = Path(entry.path)
+                keep_work_dir = True
+            files.append(target)
+            total_bytes += size
 
-        # Find new files (before_files should already be resolved)
-        new_files = current_files - before_files
+        if not keep_work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
 
-        self._logger.debug(
-            f"Collected {len(new_files)} newly downloaded file(s) from {output_dir}"
-        )
-        self._logger.debug(f"Before files: {len(before_files)}, Current files: {len(current_files)}")
-        
-        # If no new files but process succeeded, return existing files (retry scenario)
-        if len(new_files) == 0 and len(current_files) > 0 and include_existing:
-            self._logger.debug(
-                f"No new files detected, but returning {len(current_files)} existing file(s) "
-                "(likely from previous download attempt)"
-            )
-            return sorted(list(current_files))
-        
-        # Log current files for debugging if no new files found
-        if len(new_files) == 0 and len(current_files) > 0:
-            self._logger.debug(f"Current files in dir: {[str(f) for f in current_files]}")
+        files.sort()
+        self._logger.debug(f"Collected {len(files)} downloaded file(s) into {output_dir}")
+        return files, total_bytes
 
-        return sorted(list(new_files))
+    def _list_files(self, directory: Path) -> Tuple[List[Path], int]:
+        """List the regular files under a directory.
 
-    def _get_files_before_download(self, output_dir: Path) -> Set[Path]:
-        """Get set of existing files before download starts.
+        Work directories of downloads still in progress are skipped.
 
         Args:
-            output_dir: Directory to scan.
+            directory: Directory to scan.
 
         Returns:
-            Set of existing file paths (resolved to absolute paths).
+            Tuple of (sorted absolute file paths, their combined size in bytes).
         """
-        if not output_dir.exists():
-            return set()
-
-        return {f.resolve() for f in output_dir.rglob("*") if f.is_file()}
+        files: List[Path] = []
+        total_bytes = 0
+        for entry in _walk_files(directory.resolve(), skip_prefix=_WORK_DIR_PREFIX):
+            try:
+                total_bytes += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+            files.append(Path(entry.path))
+        files.sort()
+        return files, total_bytes
 
     def download(
         self,
         file_id: str,
         output_callback: Optional[Callable[[str], None]] = None,
+        download_dir: Optional[Path] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> BuzzHeavierDownloadResult:
         """Download from BuzzHeavier using subprocess.
 
@@ -331,11 +490,18 @@ class BuzzHeavierDownloaderAdapter:
             file_id: The BuzzHeavier ID or full URL to download.
             output_callback: Optional callback for real-time log streaming.
                 Receives each line of subprocess output.
+            download_dir: Optional directory for this download. Defaults to
+                the adapter's download_dir, so one adapter can serve
+                downloads into different directories.
+            cancel_event: Optional event another thread can set to stop the
+                download; the downloader is terminated promptly and a failed
+                result is returned.
 
         Returns:
             BuzzHeavierDownloadResult with download status and file information.
         """
         start_time = time.time()
+        output_dir = Path(download_dir) if download_dir is not None else self.download_dir
         self._logger.info(f"Starting BuzzHeavier download: {file_id}")
 
         # Verify installation
@@ -347,144 +513,194 @@ class BuzzHeavierDownloaderAdapter:
                 downloaded_files=[],
                 file_id=file_id,
                 error=str(e),
-                output_dir=self.download_dir,
+                output_dir=output_dir,
             )
 
         # Ensure output directory exists
-        self.download_dir.mkdir(parents=True, exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Get files before download to identify new files
-        files_before = self._get_files_before_download(self.download_dir)
+        # The script downloads to its CWD. Running it in a fresh directory
+        # (on the same filesystem, so files can be renamed into place)
+        # means whatever ends up there was written by this download.
+        work_dir = Path(tempfile.mkdtemp(prefix=_WORK_DIR_PREFIX, dir=output_dir.resolve()))
 
         # Build command
-        # The script downloads to CWD, so we run it with cwd=download_dir
         # We need to provide the absolute path to the script since we're changing cwd
         cmd = [
             sys.executable,  # Use same Python interpreter
-            str(script_path.resolve()),  # Absolute path to script
+            str(script_path),  # Absolute path to script
             file_id,
         ]
 
         self._logger.debug(f"Executing command: {' '.join(cmd)}")
-        self._logger.debug(f"Working directory: {self.download_dir}")
+        self._logger.debug(f"Working directory: {work_dir}")
 
-        try:
-            # Start subprocess
-            # Set cwd to download_dir so files are downloaded there
-            # Add script's directory to PYTHONPATH for relative imports
-            env = {
-                **os.environ,
-                "PYTHONUNBUFFERED": "1",  # Ensure unbuffered output
-                "PYTHONPATH": str(self.third_party_path.resolve())
-                + os.pathsep
-                + os.environ.get("PYTHONPATH", ""),
-            }
+        return_code, output, error_msg = self._run_downloader(
+            cmd, work_dir, output_callback, cancel_event
+        )
 
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # Combine stderr with stdout
-                text=True,  # String output instead of bytes
-                cwd=str(self.download_dir),  # Download to this directory
-                env=env,
+        # Collect the files once for every outcome; failed downloads may
+        # have left partial files
+        downloaded_files, total_bytes = self._collect_downloaded_files(work_dir, output_dir)
+        if return_code == 0 and not downloaded_files:
+            # Nothing written (retry scenario): the file is likely there
+            # from a previous download attempt
+            downloaded_files, total_bytes = self._list_files(output_dir)
+            self._logger.debug(
+                f"No new files detected, returning {len(downloaded_files)} existing file(s)"
             )
 
-            # Stream output and wait for completion
-            return_code, output = self._stream_process_output(process, output_callback)
-
-            # Calculate elapsed time
-            elapsed_time = time.time() - start_time
+        # Calculate elapsed time
+        elapsed_time = time.time() - start_time
 
-            # Check result
-            if return_code == 0:
-                # Get new files (files downloaded during this operation)
-                # Use include_existing=True to handle retry scenarios where file already exists
-                downloaded_files = self._collect_downloaded_files(
-                    self.download_dir, files_before, include_existing=True
-                )
-                self._logger.info(
-                    f"Download completed successfully in {elapsed_time:.1f}s. "
-                    f"Downloaded {len(downloaded_files)} file(s)."
-                )
-
-                # Log downloaded files
-                for file_path in downloaded_files:
-                    self._logger.info(f"  - {file_path.name}")
-
-                return BuzzHeavierDownloadResult(
-                    success=True,
-                    downloaded_files=downloaded_files,
-                    file_id=file_id,
-                    error=None,
-                    output_dir=self.download_dir,
-                )
-            else:
-                # Get new files for failed downloads (may have partial downloads)
-                downloaded_files = self._collect_downloaded_files(
-                    self.download_dir, files_before, include_existing=False
-                )
-                
-                error_msg = f"Download failed with exit code {return_code}"
-                if output:
-                    # Get last few lines for error context
-                    output_lines = output.strip().split("\n")
-                    last_lines = (
-                        output_lines[-5:] if len(output_lines) > 5 else output_lines
-                    )
-                    error_msg += f"\nLast output:\n" + "\n".join(last_lines)
-
-                self._logger.error(error_msg)
-
-                return BuzzHeavierDownloadResult(
-                    success=False,
-                    downloaded_files=downloaded_files,  # May have partial downloads
-                    file_id=file_id,
-                    error=error_msg,
-                    output_dir=self.download_dir,
-                )
-
-        except BuzzHeavierDownloadTimeoutError as e:
-            # Collect any files that may have been downloaded before timeout
-            downloaded_files = self._collect_downloaded_files(
-                self.download_dir, files_before
+        # Check result
+        if return_code == 0:
+            self._logger.info(
+                f"Download completed successfully in {elapsed_time:.1f}s. "
+                f"Downloaded {len(downloaded_files)} file(s)."
             )
 
+            # Log downloaded files
+            for file_path in downloaded_files:
+                self._logger.info(f"  - {file_path.name}")
+
             return BuzzHeavierDownloadResult(
-                success=False,
+                success=True,
                 downloaded_files=downloaded_files,
                 file_id=file_id,
-                error=str(e),
-                output_dir=self.download_dir,
+                error=None,
+                output_dir=output_dir,
+                total_bytes=total_bytes,
             )
 
-        except FileNotFoundError as e:
-            error_msg = f"Failed to execute Python interpreter: {e}"
+        if error_msg is None:
+            error_msg = f"Download failed with exit code {return_code}"
+            if output:
+                # Output is already just the last few lines
+                error_msg += f"\nLast output:\n" + output
+
             self._logger.error(error_msg)
 
-            return BuzzHeavierDownloadResult(
-                success=False,
-                downloaded_files=[],
-                file_id=file_id,
-                error=error_msg,
-                output_dir=self.download_dir,
+        return BuzzHeavierDownloadResult(
+            success=False,
+            downloaded_files=downloaded_files,  # May have partial downloads
+            file_id=file_id,
+            error=error_msg,
+            output_dir=output_dir,
+            total_bytes=total_bytes,
+        )
+
+    def _run_downloader(
+        self,
+        cmd: List[str],
+        output_dir: Path,
+        output_callback: Optional[Callable[[str], None]],
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Tuple[Optional[int], str, Optional[str]]:
+        """Run the downloader script in output_dir and wait for it.
+
+        Args:
+            cmd: Downloader command line.
+            output_dir: Directory to run the script in; it downloads there.
+            output_callback: Optional callback for real-time log streaming.
+            cancel_event: Optional event that stops the download when set.
+
+        Returns:
+            Tuple of (return_code, collected_output, error). If the script
+            did not run to completion (timeout, cancellation, interpreter
+            missing, unexpected error), return_code is None and error says
+            why; otherwise error is None.
+        """
+        try:
+            # Start subprocess
+            # Set cwd to output_dir so files are downloaded there
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,  # Combine stderr with stdout
+                bufsize=0,  # Raw pipe; output is read in chunks and split here
+                cwd=str(output_dir),  # Download to this directory
+                env=self._child_env,
+                start_new_session=True,  # Own process group, see _signal_process_group()
             )
 
+            # Stream output and wait for completion
+            try:
+                return_code, output = self._stream_process_output(
+                    process, output_callback, cancel_event
+                )
+            except BaseException:
+                # In its own session the downloader does not get the
+                # terminal's Ctrl+C. Callers on worker threads stop it
+                # through cancel_event; stop it here when this thread is
+                # interrupted
+                if process.poll() is None:
+                    self._terminate_process(process)
+                raise
+            return return_code, output, None
+
+        except (BuzzHeavierDownloadTimeoutError, BuzzHeavierDownloadCancelledError) as e:
+            return None, "", str(e)
+
+        except FileNotFoundError as e:
+            error_msg = f"Failed to execute Python interpreter: {e}"
+            self._logger.error(error_msg)
+            return None, "", error_msg
+
         except Exception as e:
             error_msg = f"Unexpected error during download: {e}"
             self._logger.error(error_msg, exc_info=True)
+            return None, "", error_msg
 
-            # Try to collect any downloaded files
-            downloaded_files = self._collect_downloaded_files(
-                self.download_dir, files_before
-            )
+    def download_many(
+        self,
+        file_ids: List[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        output_callback: Optional[Callable[[str], None]] = None,
+        download_dir: Optional[Path] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> List[BuzzHeavierDownloadResult]:
+        """Download several BuzzHeavier IDs or URLs concurrently.
 
-            return BuzzHeavierDownloadResult(
-                success=False,
-                downloaded_files=downloaded_files,
-                file_id=file_id,
-                error=error_msg,
-                output_dir=self.download_dir,
-            )
+        Each download runs in its own numbered subdirectory of the download
+        directory ("0", "1", ...), so concurrent downloads never pick up
+        each other's files.
+
+        Args:
+            file_ids: The BuzzHeavier IDs or full URLs to download.
+            max_workers: Maximum number of downloads running at once.
+            output_callback: Optional callback for real-time log streaming.
+                Called from several threads at once, so it must be
+                thread-safe.
+            download_dir: Optional parent directory for the downloads.
+                Defaults to the adapter's download_dir.
+            cancel_event: Optional event that stops every download when set.
+                Downloads run on worker threads, where Ctrl+C does not
+                reach them, so pass one to be able to interrupt them.
+
+        Returns:
+            One BuzzHeavierDownloadResult per ID, in the order of file_ids.
+        """
+        if not file_ids:
+            return []
+
+        base_dir = Path(download_dir) if download_dir is not None else self.download_dir
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(file_ids))),
+            thread_name_prefix="buzzheavier-download",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self.download,
+                    file_id,
+                    output_callback,
+                    base_dir / str(index),
+                    cancel_event,
+                )
+                for index, file_id in enumerate(file_ids)
+            ]
+            # download() reports failures in its result rather than raising
+            return [future.result() for future in futures]
 
     def __repr__(self) -> str:
         """Return string representation of BuzzHeavierDownloaderAdapter.
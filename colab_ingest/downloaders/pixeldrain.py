@@ -107,6 +107,7 @@ class PixeldrainDownloader:
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         timeout: int = DEFAULT_TIMEOUT,
         logger: Optional[logging.Logger] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initialize the Pixeldrain downloader.
 
@@ -117,6 +118,9 @@ class PixeldrainDownloader:
             chunk_size: Size of chunks for streaming downloads (default 1MB).
             timeout: Request timeout in seconds.
             logger: Optional logger instance. If None, uses default logger.
+            session: Optional requests session whose connection pool is
+                reused across requests (and across downloaders sharing it).
+                If None, a private session is created.
         """
         self.api_key = api_key
         self.download_dir = Path(download_dir)
@@ -124,6 +128,7 @@ class PixeldrainDownloader:
         self.chunk_size = chunk_size
         self.timeout = timeout
         self._logger = logger or get_logger("downloaders.pixeldrain")
+        self._session = session or requests.Session()
 
         # Ensure download directory exists
         self.download_dir.mkdir(parents=True, exist_ok=True)
@@ -262,7 +267,7 @@ class PixeldrainDownloader:
 
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(
+                response = self._session.get(
                     url,
                     headers=self._get_headers(),
                     timeout=self.timeout,
@@ -481,7 +486,7 @@ class PixeldrainDownloader:
             headers["Range"] = f"bytes={initial_bytes}-"
             self._logger.debug(f"Requesting range: bytes={initial_bytes}-")
 
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=headers,
             stream=True,
@@ -26,6 +26,7 @@ from colab_ingest.utils.url_detect import (
     extract_bunkr_id,
     normalize_bunkr_url,
     is_pixeldrain_list,
+    parse_links,
     parse_links_file,
     validate_url,
 )
@@ -38,6 +39,7 @@ from colab_ingest.utils.extract import (
 )
 from colab_ingest.utils.upload import (
     upload_to_drive,
+    upload_to_drive_many,
     UploadResult,
     check_rsync_available,
 )
@@ -60,6 +62,7 @@ __all__ = [
     "extract_bunkr_id",
     "normalize_bunkr_url",
     "is_pixeldrain_list",
+    "parse_links",
     "parse_links_file",
     "validate_url",
     # Extraction
@@ -70,6 +73,7 @@ __all__ = [
     "check_extraction_tools",
     # Upload
     "upload_to_drive",
+    "upload_to_drive_many",
     "UploadResult",
     "check_rsync_available",
 ]
@@ -15,8 +15,12 @@ import shutil
 import subprocess
 import time
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# Max sources passed to one rsync invocation, to stay well under ARG_MAX
+_RSYNC_MAX_SOURCES = 500
 
 
 @dataclass
@@ -38,9 +42,13 @@ class UploadResult:
     error: Optional[str] = None
 
 
+@cache
 def check_rsync_available() -> bool:
     """Check if rsync is installed and available.
 
+    The result is cached, so ``rsync --version`` runs at most once per
+    process rather than once per upload.
+
     Returns:
         True if rsync is available, False otherwise.
     """
@@ -160,58 +168,15 @@ def upload_with_rsync(
         # Ensure destination directory exists
         dest.mkdir(parents=True, exist_ok=True)
 
-        # Build rsync command
-        cmd = [
-            "rsync",
-            "-a",  # Archive mode (preserves permissions, times, etc.)
-            "--info=progress2",  # Show overall progress
-            "--no-inc-recursive",  # Disable incremental recursion for accurate progress
-        ]
-
-        if delete_source:
-            cmd.append("--remove-source-files")
-
-        # Add source and destination
-        # For directories, add trailing slash to copy contents
-        source_str = str(source)
-        if source.is_dir():
-            source_str = source_str.rstrip("/") + "/"
-
-        cmd.extend([source_str, str(dest) + "/"])
-
-        log.debug(f"Running: {' '.join(cmd)}")
-
         # Calculate total size for progress
         total_size = _get_total_size(source)
-        bytes_copied = 0
 
-        # Run rsync with live progress parsing
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
+        returncode, bytes_copied, stderr = _run_rsync(
+            [source], dest, delete_source, progress_callback, total_size, log
         )
 
-        # Read output lines for progress
-        if process.stdout:
-            for line in process.stdout:
-                line = line.strip()
-                if line:
-                    progress = parse_rsync_progress(line)
-                    if progress and progress_callback:
-                        bytes_copied, estimated_total, speed = progress
-                        # Use our calculated total if rsync's estimate seems off
-                        if total_size > 0:
-                            estimated_total = total_size
-                        progress_callback(bytes_copied, estimated_total, speed)
-
-        # Wait for completion
-        _, stderr = process.communicate(timeout=86400)  # 24 hour timeout
-
-        if process.returncode != 0:
-            error_msg = stderr.strip() if stderr else f"rsync failed with code {process.returncode}"
+        if returncode != 0:
+            error_msg = stderr.strip() if stderr else f"rsync failed with code {returncode}"
             log.error(f"rsync failed: {error_msg}")
             return UploadResult(
                 success=False,
@@ -222,15 +187,8 @@ def upload_with_rsync(
             )
 
         # If rsync used --remove-source-files, we need to clean up empty directories
-        if delete_source and source.is_dir() and source.exists():
-            try:
-                # Remove empty directories left by rsync
-                _remove_empty_dirs(source)
-                # Remove the source directory itself if empty
-                if source.exists() and not any(source.iterdir()):
-                    source.rmdir()
-            except OSError as e:
-                log.warning(f"Failed to clean up empty directories: {e}")
+        if delete_source:
+            _cleanup_rsync_source(source, log)
 
         log.info(f"Successfully uploaded {total_size} bytes via rsync")
         return UploadResult(
@@ -261,6 +219,105 @@ def upload_with_rsync(
         )
 
 
+def _run_rsync(
+    sources: Sequence[Path],
+    dest: Path,
+    delete_source: bool,
+    progress_callback: Optional[Callable[[int, int, float], None]],
+    total_size: int,
+    log: logging.Logger,
+) -> Tuple[int, int, str]:
+    """Run one rsync invocation copying sources into dest.
+
+    Directory sources get a trailing slash, so their contents (not the
+    directory itself) are copied into dest.
+
+    Args:
+        sources: Files and/or directories to copy.
+        dest: Destination directory (must exist).
+        delete_source: If True, pass --remove-source-files.
+        progress_callback: Optional callback for progress updates.
+        total_size: Combined size of the sources, reported as the total.
+        log: Logger for the command line.
+
+    Returns:
+        Tuple of (return code, bytes copied per rsync's last progress line,
+        stderr output).
+
+    Raises:
+        subprocess.TimeoutExpired: If rsync runs for more than 24 hours.
+    """
+    # Build rsync command
+    cmd = [
+        "rsync",
+        "-a",  # Archive mode (preserves permissions, times, etc.)
+        "--info=progress2",  # Show overall progress
+        "--no-inc-recursive",  # Disable incremental recursion for accurate progress
+    ]
+
+    if delete_source:
+        cmd.append("--remove-source-files")
+
+    # Add sources and destination
+    # For directories, add trailing slash to copy contents
+    for source in sources:
+        source_str = str(source)
+        if source.is_dir():
+            source_str = source_str.rstrip("/") + "/"
+        cmd.append(source_str)
+
+    cmd.append(str(dest) + "/")
+
+    log.debug(f"Running: {' '.join(cmd)}")
+
+    bytes_copied = 0
+
+    # Run rsync with live progress parsing
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    )
+
+    # Read output lines for progress
+    if process.stdout:
+        for line in process.stdout:
+            line = line.strip()
+            if line:
+                progress = parse_rsync_progress(line)
+                if progress and progress_callback:
+                    bytes_copied, estimated_total, speed = progress
+                    # Use our calculated total if rsync's estimate seems off
+                    if total_size > 0:
+                        estimated_total = total_size
+                    progress_callback(bytes_copied, estimated_total, speed)
+
+    # Wait for completion
+    _, stderr = process.communicate(timeout=86400)  # 24 hour timeout
+
+    return process.returncode, bytes_copied, stderr or ""
+
+
+def _cleanup_rsync_source(source: Path, log: logging.Logger) -> None:
+    """Remove directories left empty by rsync --remove-source-files.
+
+    Args:
+        source: Source that rsync copied (no-op unless a directory).
+        log: Logger for cleanup failures.
+    """
+    if source.is_dir() and source.exists():
+        try:
+            # Remove empty directories left by rsync
+            _remove_empty_dirs(source)
+            # Remove the source directory itself if empty
+            if source.exists() and not any(source.iterdir()):
+                source.rmdir()
+        except OSError as e:
+            log.warning(f"Failed to clean up empty directories: {e}")
+
+
 def _remove_empty_dirs(path: Path) -> None:
     """Recursively remove empty directories.
 
@@ -293,6 +350,10 @@ def _copy_file_with_progress(
 ) -> int:
     """Copy a single file with progress tracking.
 
+    On Linux the data is copied with os.copy_file_range(), which keeps it in
+    the kernel (or lets the filesystem clone it). If the filesystems don't
+    support that, the rest of the file is copied through a userspace buffer.
+
     Args:
         src: Source file path.
         dst: Destination file path.
@@ -307,24 +368,63 @@ def _copy_file_with_progress(
     bytes_copied = 0
     start_time = time.time()
 
-    with open(src, "rb") as fsrc:
+    def report_progress() -> None:
+        if progress_callback:
+            elapsed = time.time() - start_time
+            speed = bytes_copied / elapsed if elapsed > 0 else 0
+            progress_callback(
+                current_copied + bytes_copied,
+                total_size,
+                speed,
+            )
+
+    with open(src, "rb", buffering=0) as fsrc:
         with open(dst, "wb") as fdst:
-            while True:
-                chunk = fsrc.read(chunk_size)
-                if not chunk:
+            src_fd = fsrc.fileno()
+            dst_fd = fdst.fileno()
+
+            # copy_file_range advances both file offsets, so the userspace
+            # fallback below simply continues where it stopped
+            copy_range = getattr(os, "copy_file_range", None)
+            in_kernel_done = False
+            while copy_range is not None:
+                try:
+                    n = copy_range(src_fd, dst_fd, chunk_size)
+                except OSError:
+                    # e.g. EXDEV/EINVAL/ENOSYS: copy the rest in userspace
                     break
-
-                fdst.write(chunk)
-                bytes_copied += len(chunk)
-
-                if progress_callback:
-                    elapsed = time.time() - start_time
-                    speed = bytes_copied / elapsed if elapsed > 0 else 0
-                    progress_callback(
-                        current_copied + bytes_copied,
-                        total_size,
-                        speed,
-                    )
+                if not n:
+                    # 0 means EOF, except that some filesystems (FUSE mounts,
+                    # procfs-like sources) return 0 without copying
+                    # anything. As shutil does, only trust it once data has
+                    # been copied; otherwise let the userspace copy decide.
+                    in_kernel_done = bytes_copied > 0
+                    break
+                bytes_copied += n
+                report_progress()
+
+            if not in_kernel_done:
+                if hasattr(os, "posix_fadvise"):
+                    try:
+                        os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+
+                # Read unbuffered into one reusable buffer rather than
+                # allocating a new bytes object per chunk; large writes
+                # bypass the writer's own buffer. Small files only need a
+                # buffer as large as themselves.
+                remaining = os.fstat(src_fd).st_size - bytes_copied
+                buffer = bytearray(max(1, min(chunk_size, remaining)))
+                view = memoryview(buffer)
+                while True:
+                    n = fsrc.readinto(buffer)
+                    if not n:
+                        break
+
+                    fdst.write(view[:n])
+                    bytes_copied += n
+                    report_progress()
 
     # Preserve metadata
     shutil.copystat(src, dst)
@@ -533,3 +633,110 @@ def upload_to_drive(
             progress_callback,
             log,
         )
+
+
+def upload_to_drive_many(
+    sources: Sequence[Path],
+    drive_dest: Path,
+    delete_after: bool = True,
+    progress_callback: Optional[Callable[[int, int, float], None]] = None,
+    logger: Optional[logging.Logger] = None,
+) -> List[UploadResult]:
+    """Upload several files or directories to the same Drive destination.
+
+    Equivalent to calling upload_to_drive() for each source, but with rsync
+    all sources are copied by a single invocation (up to
+    _RSYNC_MAX_SOURCES per invocation), so process startup is paid once
+    rather than per file. If a batched rsync fails, its sources are retried
+    one by one so each gets an accurate result; with delete_after, sources
+    the failed run already copied and removed count as uploaded.
+
+    Args:
+        sources: Paths to the files or directories to upload.
+        drive_dest: Destination path on Drive.
+        delete_after: If True, delete source files after successful upload.
+        progress_callback: Optional callback for progress updates.
+            Called with (bytes_copied, total_bytes, speed_bps) for each batch.
+        logger: Optional logger for progress messages.
+
+    Returns:
+        One UploadResult per source, in the same order as sources.
+    """
+    log = logger or logging.getLogger(__name__)
+
+    if not check_rsync_available() or len(sources) <= 1:
+        return [
+            upload_to_drive(source, drive_dest, delete_after, progress_callback, log)
+            for source in sources
+        ]
+
+    results: List[Optional[UploadResult]] = [None] * len(sources)
+    pending: List[Tuple[int, Path, int]] = []
+    for index, source in enumerate(sources):
+        if source.exists():
+            pending.append((index, source, _get_total_size(source)))
+        else:
+            results[index] = UploadResult(
+                success=False,
+                source_path=source,
+                dest_path=drive_dest,
+                bytes_copied=0,
+                error=f"Source not found: {source}",
+            )
+
+    if pending:
+        drive_dest.mkdir(parents=True, exist_ok=True)
+
+    for start in range(0, len(pending), _RSYNC_MAX_SOURCES):
+        batch = pending[start:start + _RSYNC_MAX_SOURCES]
+        batch_size = sum(size for _, _, size in batch)
+        log.info(
+            f"Uploading {len(batch)} item(s) ({batch_size:,} bytes) to {drive_dest} via rsync"
+        )
+
+        try:
+            returncode, _, stderr = _run_rsync(
+                [source for _, source, _ in batch],
+                drive_dest,
+                delete_after,
+                progress_callback,
+                batch_size,
+                log,
+            )
+        except Exception as e:
+            returncode, stderr = -1, str(e)
+
+        if returncode != 0:
+            log.warning(
+                f"Batched rsync failed ({stderr.strip() or f'code {returncode}'}), "
+                "retrying items individually"
+            )
+            for index, source, size in batch:
+                if delete_after and not source.exists():
+                    # rsync copied this source and removed it before the
+                    # batch failed (e.g. a partial transfer, code 23)
+                    results[index] = UploadResult(
+                        success=True,
+                        source_path=source,
+                        dest_path=drive_dest,
+                        bytes_copied=size,
+                        error=None,
+                    )
+                    continue
+                results[index] = upload_to_drive(
+                    source, drive_dest, delete_after, progress_callback, log
+                )
+            continue
+
+        for index, source, size in batch:
+            if delete_after:
+                _cleanup_rsync_source(source, log)
+            results[index] = UploadResult(
+                success=True,
+                source_path=source,
+                dest_path=drive_dest,
+                bytes_copied=size,
+                error=None,
+            )
+
+    return results
@@ -9,7 +9,7 @@ from __future__ import annotations
 import re
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from urllib.parse import urlparse
 
 
@@ -280,6 +280,49 @@ def extract_bunkr_id(url: str) -> Optional[str]:
     return None
 
 
+def parse_links(lines: Iterable[str]) -> list[tuple[str, HostType, str]]:
+    """Classify URLs, one per line, by host.
+
+    Detects the host type for each line and extracts the relevant ID or
+    normalized URL. Empty lines and lines starting with # are skipped.
+
+    Args:
+        lines: Iterable of URL lines (e.g. an open file or list of strings).
+
+    Returns:
+        List of tuples: (original_url, host_type, extracted_id_or_url).
+        For unknown hosts, the third element is the original URL.
+    """
+    results: list[tuple[str, HostType, str]] = []
+
+    for line in lines:
+        line = line.strip()
+
+        # Skip empty lines and comments
+        if not line or line.startswith("#"):
+            continue
+
+        host_type = detect_host(line)
+
+        if host_type == HostType.PIXELDRAIN:
+            extracted = extract_pixeldrain_id(line)
+            results.append((line, host_type, extracted or line))
+
+        elif host_type == HostType.BUZZHEAVIER:
+            extracted = extract_buzzheavier_id(line)
+            results.append((line, host_type, extracted or line))
+
+        elif host_type == HostType.BUNKR:
+            normalized = normalize_bunkr_url(line)
+            results.append((line, host_type, normalized))
+
+        else:
+            # Unknown host - keep original URL
+            results.append((line, host_type, line))
+
+    return results
+
+
 def parse_links_file(filepath: Path) -> list[tuple[str, HostType, str]]:
     """Parse a file containing URLs, one per line.
 
@@ -308,35 +351,8 @@ def parse_links_file(filepath: Path) -> list[tuple[str, HostType, str]]:
     if not filepath.exists():
         raise FileNotFoundError(f"Links file not found: {filepath}")
 
-    results: list[tuple[str, HostType, str]] = []
-
     with open(filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith("#"):
-                continue
-
-            host_type = detect_host(line)
-
-            if host_type == HostType.PIXELDRAIN:
-                extracted = extract_pixeldrain_id(line)
-                results.append((line, host_type, extracted or line))
-
-            elif host_type == HostType.BUZZHEAVIER:
-                extracted = extract_buzzheavier_id(line)
-                results.append((line, host_type, extracted or line))
-
-            elif host_type == HostType.BUNKR:
-                normalized = normalize_bunkr_url(line)
-                results.append((line, host_type, normalized))
-
-            else:
-                # Unknown host - keep original URL
-                results.append((line, host_type, line))
-
-    return results
+        return parse_links(f)
 
 
 def validate_url(url: str) -> tuple[bool, Optional[str]]:
@@ -0,0 +1,157 @@
+"""Tests for the BunkrDownloader adapter."""
+
+import threading
+import time
+
+import pytest
+
+from colab_ingest.downloaders.bunkr_adapter import BunkrDownloaderAdapter
+
+# Stand-in for the bundled downloader.py; the URL argument picks what it does
+FAKE_DOWNLOADER = """
+import asyncio
+import sys
+import time
+
+from src.state import CALLS
+
+
+def clear_terminal():
+    print("terminal cleared")
+
+
+async def main():
+    clear_terminal()
+    url, custom_path = sys.argv[1], sys.argv[3]
+    CALLS.append(url)
+    print(f"calls={len(CALLS)}")
+    if url == "fail":
+        sys.exit(3)
+    if url == "hang":
+        time.sleep(60)
+    with open(f"{custom_path}/{url}.bin", "w") as f:
+        f.write(url)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+"""
+
+
+class TestFindNewFiles:
+    """Tests for the mtime watermark used to find downloaded files."""
+
+    def test_files_written_before_watermark_not_reported(self, temp_dir):
+        """Files written just before the watermark share its tick but are old."""
+        adapter = BunkrDownloaderAdapter(download_dir=temp_dir)
+        for i in range(20):
+            (temp_dir / f"old{i}.bin").write_text("old")
+            watermark_ns = adapter._snapshot_watermark(temp_dir)
+            files, _ = adapter._find_new_files(temp_dir, watermark_ns, {})
+            assert files == []
+
+    def test_files_written_after_watermark_reported(self, temp_dir):
+        """Files written after the watermark are reported with their size."""
+        adapter = BunkrDownloaderAdapter(download_dir=temp_dir)
+        (temp_dir / "old.bin").write_text("old")
+        watermark_ns = adapter._snapshot_watermark(temp_dir)
+        time.sleep(0.05)
+        (temp_dir / "sub").mkdir()
+        (temp_dir / "sub" / "new.bin").write_text("new data")
+
+        files, total_bytes = adapter._find_new_files(temp_dir, watermark_ns, {})
+
+        assert files == [temp_dir / "sub" / "new.bin"]
+        assert total_bytes == len("new data")
+
+
+@pytest.fixture
+def fake_bunkr_dir(temp_dir):
+    """Create a fake BunkrDownloader directory with module-level state."""
+    bunkr_dir = temp_dir / "bunkr"
+    (bunkr_dir / "src").mkdir(parents=True)
+    (bunkr_dir / "src" / "__init__.py").write_text("")
+    (bunkr_dir / "src" / "state.py").write_text("CALLS = []\n")
+    (bunkr_dir / "downloader.py").write_text(FAKE_DOWNLOADER)
+    return bunkr_dir
+
+
+@pytest.fixture
+def pooled_adapter(temp_dir, fake_bunkr_dir):
+    """Adapter running downloads in a single pooled worker."""
+    adapter = BunkrDownloaderAdapter(
+        download_dir=temp_dir / "downloads",
+        max_retries=1,
+        third_party_path=fake_bunkr_dir,
+        timeout=5,
+        worker_pool_size=1,
+    )
+    yield adapter
+    adapter.close()
+
+
+def _pooled_worker(adapter):
+    """Return the pool's idle worker process."""
+    (worker,) = adapter._worker_pool._idle
+    return worker
+
+
+class TestBunkrWorkerPool:
+    """Tests for downloads run in pooled worker processes."""
+
+    def test_success_reuses_worker_with_fresh_state(self, pooled_adapter):
+        """Each download in a reused worker starts from fresh module state."""
+        output = []
+        first = pooled_adapter.download("aaa", output.append)
+        worker = _pooled_worker(pooled_adapter)
+        second = pooled_adapter.download("bbb", output.append)
+
+        assert first.success and second.success
+        assert [p.name for p in first.downloaded_files] == ["aaa.bin"]
+        assert [p.name for p in second.downloaded_files] == ["bbb.bin"]
+        assert _pooled_worker(pooled_adapter) is worker
+        assert output == ["calls=1", "calls=1"]
+
+    def test_failure_reports_exit_code(self, pooled_adapter):
+        """A failing download reports its exit code and keeps the worker."""
+        result = pooled_adapter.download("fail")
+        worker = _pooled_worker(pooled_adapter)
+
+        assert not result.success
+        assert "exit code 3" in result.error
+        assert pooled_adapter.download("ok").success
+        assert _pooled_worker(pooled_adapter) is worker
+
+    def test_timeout_replaces_worker(self, pooled_adapter):
+        """A worker killed on timeout is replaced for the next download."""
+        pooled_adapter.download("ok")
+        worker = _pooled_worker(pooled_adapter)
+        pooled_adapter.timeout = 1
+
+        result = pooled_adapter.download("hang")
+
+        assert not result.success
+        assert "timed out" in result.error
+        assert worker.poll() is not None
+        pooled_adapter.timeout = 5
+        assert pooled_adapter.download("ok").success
+        assert _pooled_worker(pooled_adapter) is not worker
+
+    def test_cancel_replaces_worker(self, pooled_adapter):
+        """A cancelled download stops its worker; the next one gets a new worker."""
+        pooled_adapter.download("ok")
+        worker = _pooled_worker(pooled_adapter)
+        cancel = threading.Event()
+        timer = threading.Timer(0.5, cancel.set)
+        timer.start()
+
+        try:
+            result = pooled_adapter.download("hang", cancel_event=cancel)
+        finally:
+            timer.cancel()
+
+        assert not result.success
+        assert "cancelled" in result.error
+        assert worker.poll() is not None
+        assert pooled_adapter.download("ok").success
+        assert _pooled_worker(pooled_adapter) is not worker
@@ -1,6 +1,7 @@
 """Tests for state management with SQLite database."""
 
 import pytest
+import sqlite3
 from pathlib import Path
 from datetime import datetime
 
@@ -38,6 +39,138 @@ class TestStateDBInitialization:
         tasks = temp_state_db.get_all_tasks()
         assert len(tasks) == 1
 
+    def test_init_db_migrates_text_enums(self, temp_dir):
+        """Databases with TEXT status/host/timestamps are migrated."""
+        import sqlite3
+
+        db_path = temp_dir / "old_state.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE tasks (
+                id TEXT PRIMARY KEY,
+                url TEXT NOT NULL UNIQUE,
+                host TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                output_paths TEXT DEFAULT '[]',
+                error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                retries INTEGER DEFAULT 0
+            )
+        """)
+        conn.execute("CREATE INDEX idx_tasks_status ON tasks(status)")
+        conn.execute(
+            "INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ("t1", "https://bunkr.si/a/x", "bunkr", "failed", '["/a"]', "boom",
+             "2024-01-01T00:00:00", "2024-01-01T00:00:01", 3),
+        )
+        conn.commit()
+        conn.close()
+
+        db = StateDB(db_path)
+        db.init_db()
+
+        task = db.get_task_by_id("t1")
+        assert task.host == HostType.BUNKR
+        assert task.status == TaskStatus.FAILED
+        assert task.output_paths == ["/a"]
+        assert task.error == "boom"
+        assert task.retries == 3
+        assert task.created_at == datetime(2024, 1, 1, 0, 0, 0)
+        assert task.updated_at == datetime(2024, 1, 1, 0, 0, 1)
+        assert db.get_stats()["failed"] == 1
+
+        # A second init_db() leaves the migrated table alone
+        db.init_db()
+        assert db.get_task_by_id("t1").status == TaskStatus.FAILED
+
+    def test_close_and_reopen(self, temp_state_db):
+        """close() releases connections; later calls reconnect."""
+        temp_state_db.create_task("https://example.com/file1", HostType.PIXELDRAIN)
+        temp_state_db.close()
+
+        tasks = temp_state_db.get_all_tasks()
+        assert len(tasks) == 1
+
+    def test_connection_pragmas(self, temp_state_db):
+        """Connections use WAL with synchronous=NORMAL."""
+        conn = temp_state_db._connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_reads_use_readonly_connection(self, temp_state_db):
+        """Query methods read through a separate query-only connection."""
+        import sqlite3
+
+        task = temp_state_db.create_task("https://example.com/file1", HostType.PIXELDRAIN)
+        temp_state_db._cache_invalidate([task.id])
+
+        assert temp_state_db.get_task_by_id(task.id).id == task.id
+        ro_conn = temp_state_db._connection(readonly=True)
+        assert ro_conn is not temp_state_db._connection()
+        assert ro_conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            ro_conn.execute("DELETE FROM tasks")
+
+    def test_connection_per_thread(self, temp_state_db):
+        """Each thread gets its own connection, sharing the same data."""
+        import threading
+
+        temp_state_db.create_task("https://example.com/file1", HostType.PIXELDRAIN)
+        main_conn = temp_state_db._connection()
+        seen = {}
+
+        def worker():
+            seen["conn"] = temp_state_db._connection()
+            seen["tasks"] = temp_state_db.get_all_tasks()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen["conn"] is not main_conn
+        assert len(seen["tasks"]) == 1
+        assert temp_state_db._connection() is main_conn
+
+    def test_transaction_rolls_back_on_error(self, temp_state_db):
+        """A failing update leaves no partial changes behind."""
+        with pytest.raises(ValueError):
+            temp_state_db.update_status("missing-id", TaskStatus.DONE)
+
+        # The connection is usable again afterwards
+        task = temp_state_db.create_task("https://example.com/file1", HostType.PIXELDRAIN)
+        assert temp_state_db.get_task_by_id(task.id) is not None
+
+    def test_batch_commits_once(self, temp_state_db):
+        """Writes inside batch() commit together on exit."""
+        task = temp_state_db.create_task("https://example.com/file1", HostType.PIXELDRAIN)
+        reader = StateDB(temp_state_db.db_path)
+
+        with temp_state_db.batch():
+            temp_state_db.update_status(task.id, TaskStatus.DONE)
+            temp_state_db.add_output_path(task.id, "/out/a")
+            # Not visible to other connections until the batch commits
+            assert reader.get_task_by_id(task.id).status == TaskStatus.PENDING
+
+        stored = temp_state_db.get_task_by_id(task.id)
+        assert stored.status == TaskStatus.DONE
+        assert stored.output_paths == ["/out/a"]
+        reader.close()
+
+    def test_batch_rolls_back_on_error(self, temp_state_db):
+        """A failing batch() discards every write made inside it."""
+        task = temp_state_db.create_task("https://example.com/file1", HostType.PIXELDRAIN)
+
+        with pytest.raises(ValueError):
+            with temp_state_db.batch():
+                temp_state_db.update_status(task.id, TaskStatus.DONE)
+                # Caches the uncommitted row
+                temp_state_db.get_task_by_id(task.id)
+                temp_state_db.update_status("missing-id", TaskStatus.DONE)
+
+        assert temp_state_db.get_task_by_id(task.id).status == TaskStatus.PENDING
+
     def test_repr(self, temp_state_db):
         """StateDB has a useful string representation."""
         repr_str = repr(temp_state_db)
@@ -83,6 +216,20 @@ class TestTaskCreation:
         assert task1.id == task2.id
         assert task1.url == task2.url
 
+    def test_create_task_existing_returns_stored_row(self, temp_state_db):
+        """An uncached duplicate URL returns the stored task with its outputs."""
+        url = "https://pixeldrain.com/u/abc12345"
+        task1 = temp_state_db.create_task(url, HostType.PIXELDRAIN)
+        temp_state_db.add_output_path(task1.id, "/out/file.bin")
+        temp_state_db._cache_invalidate([task1.id])
+
+        task2 = temp_state_db.create_task(url, HostType.BUNKR)
+
+        assert task2.id == task1.id
+        assert task2.host == HostType.PIXELDRAIN
+        assert task2.output_paths == ["/out/file.bin"]
+        assert temp_state_db.get_stats()["total"] == 1
+
     def test_create_task_generates_uuid(self, temp_state_db):
         """Each new task gets a unique UUID."""
         task1 = temp_state_db.create_task("https://example1.com", HostType.PIXELDRAIN)
@@ -93,6 +240,35 @@ class TestTaskCreation:
         assert len(task1.id) == 36
         assert len(task2.id) == 36
 
+    def test_create_tasks_batch(self, temp_state_db):
+        """create_tasks() creates new tasks and returns existing ones in order."""
+        existing = temp_state_db.create_task("https://example2.com", HostType.BUNKR)
+
+        tasks = temp_state_db.create_tasks([
+            ("https://example1.com", HostType.PIXELDRAIN),
+            ("https://example2.com", HostType.PIXELDRAIN),
+            ("https://example3.com", HostType.BUZZHEAVIER),
+            ("https://example1.com", HostType.BUNKR),
+        ])
+
+        assert [t.url for t in tasks] == [
+            "https://example1.com",
+            "https://example2.com",
+            "https://example3.com",
+        ]
+        assert tasks[0].host == HostType.PIXELDRAIN
+        assert tasks[1].id == existing.id
+        assert tasks[1].host == HostType.BUNKR
+        assert all(t.status == TaskStatus.PENDING for t in tasks)
+
+        stored = temp_state_db.get_task_by_url("https://example3.com")
+        assert stored.id == tasks[2].id
+        assert len(temp_state_db.get_all_tasks()) == 3
+
+    def test_create_tasks_empty(self, temp_state_db):
+        """create_tasks() with no items is a no-op."""
+        assert temp_state_db.create_tasks([]) == []
+
 
 class TestTaskRetrieval:
     """Tests for task retrieval methods."""
@@ -113,6 +289,23 @@ class TestTaskRetrieval:
         result = temp_state_db.get_task_by_url("https://nonexistent.com")
         assert result is None
 
+    def test_get_tasks_by_urls(self, temp_state_db):
+        """Bulk lookup returns only URLs that have tasks."""
+        task1 = temp_state_db.create_task("https://example.com/1", HostType.PIXELDRAIN)
+        task2 = temp_state_db.create_task("https://example.com/2", HostType.BUNKR)
+        
+        found = temp_state_db.get_tasks_by_urls([
+            "https://example.com/1",
+            "https://example.com/2",
+            "https://example.com/missing",
+            "https://example.com/1",
+        ])
+        
+        assert set(found) == {task1.url, task2.url}
+        assert found[task1.url].id == task1.id
+        assert found[task2.url].host == HostType.BUNKR
+        assert temp_state_db.get_tasks_by_urls([]) == {}
+
     def test_get_task_by_id(self, temp_state_db):
         """Retrieve task by ID."""
         url = "https://pixeldrain.com/u/abc12345"
@@ -128,6 +321,27 @@ class TestTaskRetrieval:
         result = temp_state_db.get_task_by_id("nonexistent-id")
         assert result is None
 
+    def test_cached_lookup_sees_writes(self, temp_state_db):
+        """Cached lookups reflect later writes and return independent copies."""
+        url = "https://pixeldrain.com/u/abc12345"
+        task = temp_state_db.create_task(url, HostType.PIXELDRAIN)
+
+        first = temp_state_db.get_task_by_id(task.id)
+        first.output_paths.append("/mutated")
+        assert temp_state_db.get_task_by_id(task.id).output_paths == []
+
+        temp_state_db.update_status(task.id, TaskStatus.DONE)
+        temp_state_db.add_output_path(task.id, "/drive/a")
+
+        by_id = temp_state_db.get_task_by_id(task.id)
+        by_url = temp_state_db.get_task_by_url(url)
+        assert by_id.status == TaskStatus.DONE
+        assert by_url.output_paths == ["/drive/a"]
+
+        temp_state_db.delete_task(task.id)
+        assert temp_state_db.get_task_by_id(task.id) is None
+        assert temp_state_db.get_task_by_url(url) is None
+
     def test_get_all_tasks(self, temp_state_db):
         """Retrieve all tasks."""
         urls = [
@@ -143,6 +357,60 @@ class TestTaskRetrieval:
         
         assert len(all_tasks) == 3
 
+    def test_get_all_tasks_limit_and_order(self, temp_state_db):
+        """get_all_tasks() honours limit and order_by."""
+        import time
+
+        first = temp_state_db.create_task("https://example1.com", HostType.PIXELDRAIN)
+        temp_state_db.create_task("https://example2.com", HostType.PIXELDRAIN)
+        time.sleep(0.01)
+        temp_state_db.update_status(first.id, TaskStatus.DOWNLOADING)
+
+        recent = temp_state_db.get_all_tasks(limit=1, order_by="updated_at DESC")
+
+        assert len(recent) == 1
+        assert recent[0].id == first.id
+
+    def test_get_all_tasks_rejects_unknown_order(self, temp_state_db):
+        """get_all_tasks() rejects unsupported order_by clauses."""
+        with pytest.raises(ValueError, match="Unsupported order_by"):
+            temp_state_db.get_all_tasks(order_by="url; DROP TABLE tasks")
+
+    def test_iter_tasks_is_lazy(self, temp_state_db):
+        """iter_* methods return generators that yield tasks in order."""
+        import types
+
+        for i in range(3):
+            temp_state_db.create_task(f"https://example{i}.com", HostType.PIXELDRAIN)
+
+        tasks = temp_state_db.iter_all_tasks()
+        assert isinstance(tasks, types.GeneratorType)
+        assert next(tasks).url == "https://example0.com"
+        assert [t.url for t in tasks] == ["https://example1.com", "https://example2.com"]
+
+        pending = temp_state_db.iter_tasks_by_status(TaskStatus.PENDING)
+        assert len(list(pending)) == 3
+
+    def test_iter_task_dicts(self, temp_state_db):
+        """iter_task_dicts() yields only the requested, decoded columns."""
+        task = temp_state_db.create_task("https://example1.com", HostType.BUNKR)
+        temp_state_db.add_output_path(task.id, "/out/a")
+
+        rows = list(temp_state_db.iter_task_dicts(
+            ("url", "host", "status", "output_paths", "updated_at")
+        ))
+
+        assert rows == [{
+            "url": "https://example1.com",
+            "host": "bunkr",
+            "status": "pending",
+            "output_paths": ["/out/a"],
+            "updated_at": temp_state_db.get_task_by_id(task.id).updated_at,
+        }]
+
+        with pytest.raises(ValueError, match="Unsupported columns"):
+            temp_state_db.iter_task_dicts(("url", "password"))
+
     def test_get_tasks_by_status(self, temp_state_db):
         """Retrieve tasks filtered by status."""
         # Create tasks with different statuses
@@ -221,6 +489,30 @@ class TestStatusUpdates:
         assert updated.updated_at >= original_updated
 
 
+    def test_update_statuses_batch(self, temp_state_db):
+        """Batch updates apply in order and keep errors unless given."""
+        task1 = temp_state_db.create_task("https://example.com/1", HostType.PIXELDRAIN)
+        task2 = temp_state_db.create_task("https://example.com/2", HostType.BUNKR)
+        temp_state_db.update_status(task2.id, TaskStatus.FAILED, error="boom")
+        
+        count = temp_state_db.update_statuses([
+            (task1.id, TaskStatus.DOWNLOADING, None),
+            (task1.id, TaskStatus.EXTRACTING, None),
+            (task2.id, TaskStatus.PENDING, None),
+            ("nonexistent-id", TaskStatus.DONE, None),
+        ])
+        
+        assert count == 3
+        assert temp_state_db.get_task_by_id(task1.id).status == TaskStatus.EXTRACTING
+        updated2 = temp_state_db.get_task_by_id(task2.id)
+        assert updated2.status == TaskStatus.PENDING
+        assert updated2.error == "boom"
+
+    def test_update_statuses_empty(self, temp_state_db):
+        """Empty batch is a no-op."""
+        assert temp_state_db.update_statuses([]) == 0
+
+
 class TestOutputPaths:
     """Tests for output path management."""
 
@@ -278,6 +570,27 @@ class TestOutputPaths:
         with pytest.raises(ValueError, match="Task not found"):
             temp_state_db.add_output_path("nonexistent-id", "/some/path")
 
+    def test_set_output_paths_keeps_order(self, temp_state_db):
+        """set_output_paths() replaces the list and keeps its order."""
+        task = temp_state_db.create_task("https://example.com", HostType.PIXELDRAIN)
+        temp_state_db.add_output_path(task.id, "/old")
+
+        temp_state_db.set_output_paths(task.id, ["/z", "/a", "/m", "/a"])
+
+        retrieved = temp_state_db.get_task_by_id(task.id)
+        assert retrieved.output_paths == ["/z", "/a", "/m"]
+
+    def test_delete_task_removes_output_paths(self, temp_state_db):
+        """Deleting a task also deletes its output path rows."""
+        task = temp_state_db.create_task("https://example.com", HostType.PIXELDRAIN)
+        temp_state_db.set_output_paths(task.id, ["/a", "/b"])
+
+        temp_state_db.delete_task(task.id)
+
+        conn = temp_state_db._connection()
+        count = conn.execute("SELECT COUNT(*) FROM task_outputs").fetchone()[0]
+        assert count == 0
+
 
 class TestRetryManagement:
     """Tests for retry counter management."""
@@ -340,6 +653,16 @@ class TestPendingAndFailedTasks:
         assert task1.id in task_ids
         assert task3.id in task_ids
 
+    def test_get_pending_and_failed_without_runnable_index(self, temp_state_db):
+        """Runnable tasks are found even if the partial index is missing."""
+        task = temp_state_db.create_task("https://example1.com", HostType.PIXELDRAIN)
+        with sqlite3.connect(temp_state_db.db_path) as conn:
+            conn.execute("DROP INDEX idx_tasks_runnable")
+        
+        tasks = temp_state_db.get_pending_and_failed_tasks(retry_failed=True)
+        
+        assert [t.id for t in tasks] == [task.id]
+
 
 class TestTaskReset:
     """Tests for task reset functionality."""
@@ -373,6 +696,26 @@ class TestTaskReset:
             temp_state_db.reset_task("nonexistent-id")
 
 
+    def test_reset_tasks_batch(self, temp_state_db):
+        """reset_tasks() resets several tasks and ignores unknown IDs."""
+        task1 = temp_state_db.create_task("https://example1.com", HostType.PIXELDRAIN)
+        task2 = temp_state_db.create_task("https://example2.com", HostType.PIXELDRAIN)
+        temp_state_db.update_status(task1.id, TaskStatus.FAILED, error="Error 1")
+        temp_state_db.update_status(task2.id, TaskStatus.FAILED, error="Error 2")
+
+        count = temp_state_db.reset_tasks([task1.id, task2.id, "nonexistent-id"])
+
+        assert count == 2
+        for task_id in (task1.id, task2.id):
+            reset = temp_state_db.get_task_by_id(task_id)
+            assert reset.status == TaskStatus.PENDING
+            assert reset.error is None
+
+    def test_reset_tasks_empty(self, temp_state_db):
+        """reset_tasks() with no IDs is a no-op."""
+        assert temp_state_db.reset_tasks([]) == 0
+
+
 class TestTaskDeletion:
     """Tests for task deletion."""
 
@@ -451,3 +794,26 @@ class TestTaskDataclass:
         assert retrieved.status == TaskStatus.PENDING
         assert isinstance(retrieved.created_at, datetime)
         assert isinstance(retrieved.updated_at, datetime)
+
+    def test_task_from_tuple(self):
+        """from_row() also accepts a plain tuple in column order."""
+        row = (
+            "task-1",
+            "https://example.com",
+            2,  # bunkr
+            4,  # done
+            '["/drive/a.txt"]',
+            None,
+            int(datetime(2024, 1, 2, 3, 4, 5, 6000).timestamp() * 1000),
+            int(datetime(2024, 1, 2, 3, 4, 6).timestamp() * 1000),
+            2,
+        )
+
+        task = Task.from_row(row)
+
+        assert task.id == "task-1"
+        assert task.host == HostType.BUNKR
+        assert task.status == TaskStatus.DONE
+        assert task.output_paths == ["/drive/a.txt"]
+        assert task.created_at == datetime(2024, 1, 2, 3, 4, 5, 6000)
+        assert task.retries == 2
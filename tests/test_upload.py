@@ -0,0 +1,76 @@
+"""Tests for upload utilities."""
+
+import shutil
+from unittest.mock import patch
+
+from colab_ingest.utils import upload
+from colab_ingest.utils.upload import _copy_file_with_progress, upload_to_drive_many
+
+
+class TestCopyFileWithProgress:
+    """Tests for the _copy_file_with_progress() helper."""
+
+    def test_copy_file_range_returning_zero_falls_back(self, temp_dir):
+        """A copy_file_range that copies nothing does not truncate the copy."""
+        src = temp_dir / "src.bin"
+        dst = temp_dir / "dst.bin"
+        data = b"x" * 3000
+        src.write_bytes(data)
+
+        with patch.object(upload.os, "copy_file_range", return_value=0, create=True):
+            copied = _copy_file_with_progress(src, dst, None, 0, len(data), chunk_size=1024)
+
+        assert copied == len(data)
+        assert dst.read_bytes() == data
+
+    def test_copy_empty_file(self, temp_dir):
+        """Empty files are copied as empty files."""
+        src = temp_dir / "empty.bin"
+        dst = temp_dir / "copy.bin"
+        src.write_bytes(b"")
+
+        assert _copy_file_with_progress(src, dst, None, 0, 0) == 0
+        assert dst.read_bytes() == b""
+
+
+class TestUploadToDriveMany:
+    """Tests for the upload_to_drive_many() function."""
+
+    def test_partial_batch_failure_with_delete_after(self, temp_dir):
+        """Sources removed by a failed batch count as uploaded; the rest are retried."""
+        src_dir = temp_dir / "src"
+        src_dir.mkdir()
+        drive_dest = temp_dir / "drive"
+        sources = []
+        for name in ("a.txt", "b.txt", "c.txt"):
+            path = src_dir / name
+            path.write_text(name)
+            sources.append(path)
+
+        calls = []
+
+        def fake_rsync(batch_sources, dest, delete_source, progress_callback, total_size, log):
+            calls.append(list(batch_sources))
+            if len(calls) == 1:
+                # Copy and remove the first source, then fail like a
+                # partial transfer (exit code 23)
+                shutil.copy2(batch_sources[0], dest / batch_sources[0].name)
+                batch_sources[0].unlink()
+                return 23, 0, "some files could not be transferred"
+            for source in batch_sources:
+                shutil.copy2(source, dest / source.name)
+                if delete_source:
+                    source.unlink()
+            return 0, total_size, ""
+
+        with patch.object(upload, "check_rsync_available", return_value=True), \
+                patch.object(upload, "_run_rsync", side_effect=fake_rsync):
+            results = upload_to_drive_many(sources, drive_dest, delete_after=True)
+
+        assert [result.success for result in results] == [True, True, True]
+        assert [result.source_path for result in results] == sources
+        assert results[0].bytes_copied == len("a.txt")
+        # Only the sources still present were retried
+        assert calls[1:] == [[sources[1]], [sources[2]]]
+        assert sorted(p.name for p in drive_dest.iterdir()) == ["a.txt", "b.txt", "c.txt"]
+        assert not any(src_dir.iterdir())
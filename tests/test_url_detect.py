@@ -10,6 +10,7 @@ from colab_ingest.utils.url_detect import (
     extract_buzzheavier_id,
     normalize_bunkr_url,
     extract_bunkr_id,
+    parse_links,
     parse_links_file,
     validate_url,
     is_pixeldrain_list,
@@ -294,6 +295,18 @@ class TestParseLinksFile:
         assert results[1][1] == HostType.BUZZHEAVIER
         assert results[1][2] == "buzztestid12"
 
+    def test_parse_links_from_lines(self):
+        """parse_links() accepts an iterable of lines."""
+        results = parse_links([
+            "# comment\n",
+            "\n",
+            "  https://pixeldrain.com/u/testid01  \n",
+            "https://unknown-host.com/file123",
+        ])
+
+        assert [r[1] for r in results] == [HostType.PIXELDRAIN, HostType.UNKNOWN]
+        assert results[0] == ("https://pixeldrain.com/u/testid01", HostType.PIXELDRAIN, "testid01")
+
 
 class TestValidateUrl:
     """Tests for the validate_url() function."""